@@ -0,0 +1,114 @@
+"""
+Benchmarks the SQLite adapter on the assets table: inserting 100,000 assets
+and listing a folder with 10,000 children. The baseline uses a rollback
+journal and no secondary indexes, as the adapter did before.
+
+Usage: python scripts/benchmark_sqlite.py
+"""
+
+import os
+import tempfile
+import time
+from datetime import datetime
+
+from nodetool.models.asset import Asset
+from nodetool.models.condition_builder import Field
+from nodetool.models.sqlite_adapter import SQLiteAdapter
+
+ASSETS = 100_000
+FOLDERS = 10
+SINGLE_SAVES = 2_000
+
+
+def make_assets() -> list[dict]:
+    folder_ids = [f"folder{i}" for i in range(FOLDERS)]
+    assets = [
+        Asset(
+            id=folder_id,
+            user_id="1",
+            parent_id="1",
+            name=folder_id,
+            content_type="folder",
+            created_at=datetime.now(),
+        )
+        for folder_id in folder_ids
+    ]
+    for i in range(ASSETS - FOLDERS):
+        assets.append(
+            Asset(
+                id=f"{i:08d}",
+                user_id="1",
+                parent_id=folder_ids[i % FOLDERS],
+                name=f"image{i}.png",
+                content_type="image/png",
+                created_at=datetime.now(),
+            )
+        )
+    return [asset.model_dump() for asset in assets]
+
+
+def run(tuned: bool):
+    schema = Asset.get_table_schema()
+    if not tuned:
+        schema = {"table_name": schema["table_name"]}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        adapter = SQLiteAdapter(
+            os.path.join(tmp, "bench.db"), Asset.db_fields(), schema
+        )
+        if not tuned:
+            adapter.connection.execute("PRAGMA journal_mode = DELETE")
+            adapter.connection.execute("PRAGMA synchronous = FULL")
+        assets = make_assets()
+
+        start = time.perf_counter()
+        for asset in assets[:SINGLE_SAVES]:
+            adapter.save(asset)
+        single = time.perf_counter() - start
+
+        start = time.perf_counter()
+        adapter.save_many(assets)
+        batched = time.perf_counter() - start
+
+        start = time.perf_counter()
+        children = []
+        start_key = ""
+        while True:
+            page, start_key = adapter.query(
+                Field("user_id")
+                .equals("1")
+                .and_(Field("parent_id").equals("folder3"))
+                .and_(Field("id").greater_than(start_key)),
+                limit=1000,
+            )
+            children += page
+            if not start_key:
+                break
+        listing = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cursor = adapter.connection.execute(
+            "SELECT COUNT(*) FROM nodetool_assets WHERE user_id = ? AND parent_id = ?",
+            ("1", "folder3"),
+        )
+        count = cursor.fetchone()[0]
+        lookup = time.perf_counter() - start
+        adapter.connection.close()
+
+    label = "WAL with indexes" if tuned else "rollback journal without indexes"
+    print(f"{label}:")
+    print(
+        f"  save: {SINGLE_SAVES} rows in {single:.2f}s"
+        f" ({SINGLE_SAVES / single:.0f} rows/s)"
+    )
+    print(
+        f"  save_many: {len(assets)} rows in {batched:.2f}s"
+        f" ({len(assets) / batched:.0f} rows/s)"
+    )
+    print(f"  list folder: {len(children)} children in {listing * 1000:.1f}ms")
+    print(f"  count folder: {count} children in {lookup * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    run(tuned=False)
+    run(tuned=True)
@@ -18,17 +18,11 @@ from nodetool.types.asset import (
 )
 from nodetool.api.utils import current_user, User
 from nodetool.common.environment import Environment
-from typing import Dict, List, Optional, Tuple, Union
+from typing import AsyncGenerator, Dict, List, Optional, Tuple, Union
 from nodetool.models.asset import Asset as AssetModel
 from nodetool.models.workflow import Workflow
 
-from nodetool.common.environment import Environment
-from nodetool.common.media_utils import (
-    create_image_thumbnail,
-    create_video_thumbnail,
-    get_audio_duration,
-    get_video_duration,
-)
+from nodetool.api.media_worker import MediaWorkerPool, needs_media_processing
 
 log = Environment.get_logger()
 router = APIRouter(prefix="/api/assets", tags=["assets"])
@@ -139,51 +133,64 @@ async def delete(id: str, user: User = Depends(current_user)):
         raise HTTPException(status_code=500, detail=f"Error deleting asset: {str(e)}")
 
 async def delete_folder(user_id: str, folder_id: str) -> List[str]:
-    deleted_asset_ids = []
     try:
-        assets, next_cursor = AssetModel.paginate(
-            user_id=user_id,
-            parent_id=folder_id,
-            limit=10000
-        )
-        # Delete children first
-        for index, asset in enumerate(assets, 1):
-            if asset.content_type == "folder":
-                subfolder_deleted_ids = await delete_folder(user_id, asset.id)
-                deleted_asset_ids.extend(subfolder_deleted_ids)
-            else:
-                await delete_single_asset(asset)
-                deleted_asset_ids.append(asset.id)
-        
-        # Delete folder
-        folder = AssetModel.find(user_id, folder_id)
-        if folder:
-            await delete_single_asset(folder)
-            deleted_asset_ids.append(folder_id)
-        else:
+        # The tree lists parents first, so children are deleted first.
+        assets = AssetModel.get_asset_tree(user_id, [folder_id])[::-1]
+        if not assets:
             log.warning(f"Folder not found when trying to delete: {folder_id}")
+            return []
+        deleted_asset_ids = [asset.id for asset in assets]
+        AssetModel.delete_many(deleted_asset_ids)
+        await delete_asset_files(assets)
         log.info(f"Total assets deleted: {len(deleted_asset_ids)}")
         return deleted_asset_ids
     except Exception as e:
-        log.exception(f"Error in delete_folder function for folder {folder_id}: {str(e)}")
+        log.exception(
+            f"Error in delete_folder function for folder {folder_id}: {str(e)}"
+        )
         raise
 
+
+# Storage deletes in flight at once when deleting many assets.
+STORAGE_DELETE_CONCURRENCY = 16
+
+
+async def delete_asset_files(assets: List[AssetModel]):
+    """
+    Deletes the files and thumbnails of the given assets from storage,
+    with up to STORAGE_DELETE_CONCURRENCY deletes in flight.
+    """
+    storage = Environment.get_asset_storage()
+    semaphore = asyncio.Semaphore(STORAGE_DELETE_CONCURRENCY)
+
+    async def delete_file(asset: AssetModel, file_name: str):
+        async with semaphore:
+            try:
+                await storage.delete(file_name)
+            except Exception as e:
+                log.warning(f"Error deleting {file_name} for asset {asset.id}: {e}")
+
+    deletes = []
+    for asset in assets:
+        if asset.content_type == "folder":
+            continue
+        deletes.append(delete_file(asset, asset.file_name))
+        if asset.has_thumbnail:
+            deletes.append(delete_file(asset, asset.thumb_file_name))
+    await asyncio.gather(*deletes)
+
+
 async def delete_single_asset(asset: AssetModel):
     try:
         asset.delete()
-        storage = Environment.get_asset_storage()
-        try:
-            await storage.delete(asset.thumb_file_name)
-        except Exception as e:
-            log.warning(f"Error deleting thumbnail for asset {asset.id}: {e}")
-        try:
-            await storage.delete(asset.file_name)
-        except Exception as e:
-            log.warning(f"Error deleting file for asset {asset.id}: {e}")
+        await delete_asset_files([asset])
     except Exception as e:
-        log.exception(f"Error in delete_single_asset function for asset {asset.id}: {str(e)}")
+        log.exception(
+            f"Error in delete_single_asset function for asset {asset.id}: {str(e)}"
+        )
         raise
 
+
 @router.post("/")
 async def create(
     file: UploadFile | None = None,
@@ -198,29 +205,15 @@ async def create(
 
     req = AssetCreateRequest.model_validate_json(json)
     asset = None
-    duration = None
-    file_io = None
-    thumbnail = None
 
     if req.workflow_id:
         workflow = Workflow.get(req.workflow_id)
         if workflow and workflow.user_id != user.id:
             raise HTTPException(status_code=404, detail="Workflow not found")
 
-    try:
-        if file:
-            file_content = await file.read()
-            file_io = BytesIO(file_content)
-            storage = Environment.get_asset_storage()
-
-            if "video" in req.content_type:
-                duration = await get_video_duration(file_io)
-                thumbnail = await create_video_thumbnail(file_io, 512, 512)
-            elif "audio" in req.content_type:
-                duration = get_audio_duration(file_io)
-            elif "image" in req.content_type:
-                thumbnail = await create_image_thumbnail(file_io, 512, 512)
+    process_media = file is not None and needs_media_processing(req.content_type)
 
+    try:
         asset = AssetModel.create(
             workflow_id=req.workflow_id,
             user_id=user.id,
@@ -228,14 +221,13 @@ async def create(
             name=req.name,
             content_type=req.content_type,
             metadata=req.metadata,
-            duration=duration,
+            duration=req.duration,
+            media_status="pending" if process_media else None,
         )
-        if file_io:
-            file_io.seek(0)
-            await storage.upload(asset.file_name, file_io)
-
-            if thumbnail:
-                await storage.upload(asset.thumb_file_name, thumbnail)
+        if file:
+            # The upload is spooled to disk by the server, stream it from there.
+            storage = Environment.get_asset_storage()
+            await storage.upload(asset.file_name, file.file)
 
     except Exception as e:
         log.exception(e)
@@ -243,104 +235,134 @@ async def create(
             asset.delete()
         raise HTTPException(status_code=500, detail="Error uploading asset")
 
+    if process_media:
+        await MediaWorkerPool.get_default().submit(asset.id)
+
     return Asset.from_model(asset)
 
 
-@router.post("/download")
-async def download_assets(
-    req: AssetDownloadRequest,
-    current_user: User = Depends(current_user),
-):
+class ZipChunks:
     """
-    Create a ZIP file containing the requested assets and return it for download.
-    Maintains folder structure based on asset.parent_id relationships.
+    A write-only file object that collects the bytes written by a ZipFile
+    until they are taken. It has no tell or seek, so ZipFile writes entries
+    with data descriptors and never goes back to patch headers.
     """
-    if not req.asset_ids:
-        raise HTTPException(status_code=400, detail="No asset IDs provided")
 
-    zip_buffer = BytesIO()
-    storage = Environment.get_asset_storage()
+    def __init__(self):
+        self.chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
 
-    # Dictionary to store asset paths
-    asset_paths: Dict[str, str] = {}
-    # Dictionary to store all assets
-    all_assets: Dict[str, AssetModel] = {}
-
-    def fetch_all_assets(asset_ids: List[str]):
-        for asset_id in asset_ids:
-            asset = AssetModel.get(asset_id)
-            if asset:
-                all_assets[asset.id] = asset
-                if asset.parent_id and asset.parent_id not in all_assets:
-                    fetch_all_assets([asset.parent_id])
-                # Fetch all child assets if the asset is a folder
-                if asset.content_type == "folder":
-                    child_assets = AssetModel.get_children(asset.id)
-                    child_asset_ids = [child.id for child in child_assets]
-                    if child_asset_ids:
-                        fetch_all_assets(child_asset_ids)
-
-    fetch_all_assets(req.asset_ids)
-
-    def get_asset_path(asset: AssetModel) -> str:
-        if asset.id in asset_paths:
-            return asset_paths[asset.id]
-
-        if not asset.parent_id or asset.parent_id not in all_assets:
-            path = asset.name
+    def flush(self):
+        pass
+
+    def take(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def zip_entry_paths(assets: List[AssetModel]) -> List[Tuple[str, AssetModel]]:
+    """
+    Returns the archive path of each asset, following parent_id relationships
+    up to the topmost asset of the export.
+    """
+    by_id = {asset.id: asset for asset in assets}
+    paths: Dict[str, str] = {}
+
+    def get_path(asset: AssetModel) -> str:
+        if asset.id not in paths:
+            parent = by_id.get(asset.parent_id)
+            if parent is None:
+                paths[asset.id] = asset.name
+            else:
+                paths[asset.id] = f"{get_path(parent)}/{asset.name}"
+        return paths[asset.id]
+
+    entries = []
+    for asset in assets:
+        if asset.content_type == "folder":
+            entries.append((f"{get_path(asset)}/", asset))
         else:
-            parent_path = get_asset_path(all_assets[asset.parent_id])
-            path = f"{parent_path}/{asset.name}"
+            entries.append((f"{get_path(asset)}.{asset.file_extension}", asset))
+    return entries
 
-        asset_paths[asset.id] = path
-        return path
 
-    async def fetch_asset_content(
-        asset: AssetModel,
-    ) -> Tuple[str, Union[BytesIO, None]]:
-        try:
-            if asset.user_id != current_user.id:
-                raise HTTPException(
-                    status_code=403,
-                    detail=f"You don't have permission to download asset: {asset.id}",
-                )
+# Already compressed media is stored as is.
+STORED_CONTENT_TYPES = ("image/", "video/", "audio/", "application/zip")
 
-            asset_path = get_asset_path(asset)
 
+async def stream_zip(
+    entries: List[Tuple[str, AssetModel]], chunk_size: int = 1024 * 1024
+) -> AsyncGenerator[bytes, None]:
+    """
+    Writes a ZIP archive of the given entries and yields it in chunks.
+
+    File contents are pulled from storage with download_stream and written as
+    they arrive, so at most about chunk_size bytes are buffered at a time.
+    Compression runs in a worker thread.
+    """
+    storage = Environment.get_asset_storage()
+    sink = ZipChunks()
+    now = datetime.datetime.now().timetuple()[:6]
+
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        for path, asset in entries:
+            info = zipfile.ZipInfo(path, date_time=now)
             if asset.content_type == "folder":
-                return f"{asset_path}/", None
-            else:
-                file_path = f"{asset_path}.{asset.file_extension}"
-                file_content = BytesIO()
-                await storage.download(asset.file_name, file_content)
-                file_content.seek(0)
-                return file_path, file_content
-        except Exception as e:
-            raise HTTPException(
-                status_code=500, detail=f"Error downloading asset {asset.id}: {str(e)}"
-            )
-
-    # Fetch all asset contents in parallel
-    asset_contents = await asyncio.gather(
-        *[fetch_asset_content(asset) for asset in all_assets.values()]
-    )
+                zip_file.writestr(info, "")
+                continue
 
-    # Write to zip file sequentially
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-        for file_path, content in asset_contents:
-            if content is None:
-                # This is a folder
-                zip_file.writestr(file_path, "")
+            if asset.content_type.startswith(STORED_CONTENT_TYPES):
+                info.compress_type = zipfile.ZIP_STORED
             else:
-                zip_file.writestr(file_path, content.getvalue())
+                info.compress_type = zipfile.ZIP_DEFLATED
+
+            with zip_file.open(info, "w", force_zip64=True) as entry:
+                buffer = bytearray()
+                async for chunk in storage.download_stream(asset.file_name):
+                    buffer += chunk
+                    if len(buffer) >= chunk_size:
+                        await asyncio.to_thread(entry.write, buffer)
+                        buffer = bytearray()
+                        if data := sink.take():
+                            yield data
+                if buffer:
+                    await asyncio.to_thread(entry.write, buffer)
+            if data := sink.take():
+                yield data
+
+    yield sink.take()
 
-    zip_buffer.seek(0)
+
+@router.post("/download")
+async def download_assets(
+    req: AssetDownloadRequest,
+    current_user: User = Depends(current_user),
+):
+    """
+    Stream a ZIP file containing the requested assets.
+    Folders are exported with their contents, maintaining the folder structure
+    based on asset.parent_id relationships.
+    """
+    if not req.asset_ids:
+        raise HTTPException(status_code=400, detail="No asset IDs provided")
+
+    assets = AssetModel.get_asset_tree(current_user.id, req.asset_ids)
+    found = {asset.id for asset in assets}
+    missing = [asset_id for asset_id in req.asset_ids if asset_id not in found]
+    if missing:
+        raise HTTPException(
+            status_code=404, detail=f"Assets not found: {', '.join(missing)}"
+        )
 
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"assets_{timestamp}.zip"
 
     return StreamingResponse(
-        zip_buffer,
+        stream_zip(zip_entry_paths(assets)),
         media_type="application/zip",
         headers={"Content-Disposition": f"attachment; filename={filename}"},
     )
@@ -127,6 +127,8 @@ async def run(
                 if msg.status == "completed":
                     result = msg.result
                     for key, value in result.items():
+                        if isinstance(value, AssetRef):
+                            value.encode_memory()
                         if isinstance(value, AssetRef) and value.data:
                             if isinstance(value.data, bytes):
                                 value.uri = f"data:application/octet-stream;base64,{base64.b64encode(value.data).decode('utf-8')}"
@@ -0,0 +1,147 @@
+import asyncio
+import os
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
+from nodetool.common.environment import Environment
+from nodetool.common.media_utils import (
+    create_image_thumbnail,
+    create_video_thumbnail_from_file,
+    get_audio_duration,
+    get_video_duration_from_file,
+)
+from nodetool.models.asset import Asset as AssetModel
+
+log = Environment.get_logger()
+
+THUMBNAIL_SIZE = 512
+
+
+def needs_media_processing(content_type: str) -> bool:
+    """
+    Returns True if assets of the content type get a thumbnail or a duration.
+    """
+    return content_type.startswith(("image/", "video/", "audio/"))
+
+
+class MediaWorkerPool:
+    """
+    Creates thumbnails and probes durations of uploaded assets in the
+    background, so uploads return as soon as the file is stored.
+
+    Jobs run on a small thread pool, each thread with its own event loop.
+    At most queue_size jobs wait for a thread. Further submissions wait for
+    a free slot, which slows down uploads instead of piling up work.
+
+    A job sets the media_status of its asset to "ready" or "failed" and
+    stores the duration. Clients poll the asset to see the result.
+
+    Attributes:
+        workers (int): Number of worker threads.
+        queue_size (int): Jobs that may wait for a worker.
+    """
+
+    _default: "MediaWorkerPool | None" = None
+
+    def __init__(self, workers: int = 2, queue_size: int = 100):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.workers = workers
+        self.queue_size = queue_size
+        self.slots = threading.BoundedSemaphore(workers + queue_size)
+        self.futures: set[Future] = set()
+        self.local = threading.local()
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="media"
+        )
+
+    @classmethod
+    def get_default(cls) -> "MediaWorkerPool":
+        """
+        Returns the shared pool, configured by MEDIA_WORKER_THREADS and
+        MEDIA_QUEUE_SIZE.
+        """
+        if cls._default is None:
+            cls._default = cls(
+                workers=int(Environment.get("MEDIA_WORKER_THREADS")),
+                queue_size=int(Environment.get("MEDIA_QUEUE_SIZE")),
+            )
+        return cls._default
+
+    async def submit(self, asset_id: str) -> Future:
+        """
+        Queues the media processing of an asset, waiting while the queue is full.
+        """
+        if not self.slots.acquire(blocking=False):
+            await asyncio.to_thread(self.slots.acquire)
+        future = self.executor.submit(self._run, asset_id)
+        self.futures.add(future)
+        future.add_done_callback(self._done)
+        return future
+
+    def wait(self, timeout: float | None = None):
+        """
+        Blocks until all submitted jobs are done.
+        """
+        wait(list(self.futures), timeout=timeout)
+
+    def _done(self, future: Future):
+        self.futures.discard(future)
+        self.slots.release()
+
+    def _run(self, asset_id: str):
+        loop = getattr(self.local, "loop", None)
+        if loop is None:
+            # Reusing one loop per thread keeps pooled storage connections.
+            loop = self.local.loop = asyncio.new_event_loop()
+        loop.run_until_complete(self.process(asset_id))
+
+    async def process(self, asset_id: str):
+        """
+        Creates the thumbnail and probes the duration of an asset.
+        """
+        asset = AssetModel.get(asset_id)
+        if asset is None:
+            return
+
+        storage = Environment.get_asset_storage()
+        fd, path = tempfile.mkstemp()
+        try:
+            with os.fdopen(fd, "wb") as f:
+                async for chunk in storage.download_stream(asset.file_name):
+                    f.write(chunk)
+
+            duration = None
+            thumbnail = None
+            if asset.content_type.startswith("video/"):
+                duration = await get_video_duration_from_file(path)
+                thumbnail = await create_video_thumbnail_from_file(
+                    path, THUMBNAIL_SIZE, THUMBNAIL_SIZE
+                )
+            elif asset.content_type.startswith("audio/"):
+                with open(path, "rb") as f:
+                    duration = get_audio_duration(f)  # type: ignore
+            elif asset.content_type.startswith("image/"):
+                with open(path, "rb") as f:
+                    thumbnail = await create_image_thumbnail(
+                        f, THUMBNAIL_SIZE, THUMBNAIL_SIZE
+                    )
+
+            if thumbnail is not None:
+                await storage.upload(asset.thumb_file_name, thumbnail)
+            status = "ready"
+        except Exception as e:
+            log.warning(f"Media processing failed for asset {asset_id}: {e}")
+            duration = None
+            status = "failed"
+        finally:
+            os.remove(path)
+
+        # Reload, as the asset may have been changed or deleted meanwhile.
+        asset = AssetModel.get(asset_id)
+        if asset is None:
+            return
+        if duration is not None:
+            asset.duration = duration
+        asset.update(media_status=status)
@@ -1,12 +1,13 @@
 #!/usr/bin/env python
 
-from datetime import timezone
+from datetime import datetime, timezone
+import hashlib
 from io import BytesIO
 import os
 import re
 from fastapi import APIRouter, Depends, Request, Response
 from fastapi import HTTPException
-from email.utils import parsedate_to_datetime
+from email.utils import format_datetime, parsedate_to_datetime
 from fastapi.responses import StreamingResponse
 from nodetool.api.utils import current_user
 from nodetool.models.user import User
@@ -25,91 +26,151 @@ def storage_for_bucket(bucket: str) -> AbstractStorage:
         raise ValueError(f"Invalid bucket: {bucket}")
 
 
-@router.head("/{bucket}/{key}")
-async def head(bucket: str, key: str):
+def to_utc(dt: datetime) -> datetime:
     """
-    Returns the metadata for the file with the given key.
+    Converts a datetime to UTC with second precision, as used in HTTP dates.
+    Naive datetimes are taken to be in local time.
     """
-    storage = storage_for_bucket(bucket)
-    if not storage.file_exists(key):
-        raise HTTPException(status_code=404)
+    return dt.astimezone(timezone.utc).replace(microsecond=0)
 
-    last_modified = await storage.get_mtime(key)
-    return Response(
-        status_code=200,
-        headers={
-            "Last-Modified": last_modified.strftime("%a, %d %b %Y %H:%M:%S GMT"),
-        },
-    )
 
+def parse_http_date(value: str) -> datetime | None:
+    try:
+        return to_utc(parsedate_to_datetime(value))
+    except (TypeError, ValueError):
+        return None
 
-from fastapi import HTTPException, Request, Response
-from fastapi.responses import StreamingResponse
-from email.utils import parsedate_to_datetime
-from datetime import timezone
-import os
-from typing import Optional
 
+def parse_range(range_header: str, size: int) -> tuple[int, int] | None:
+    """
+    Parses a single byte range, e.g. `bytes=0-99`, `bytes=100-` or `bytes=-100`.
 
-@router.get("/{bucket}/{key}")
-async def get(bucket: str, key: str, request: Request):
+    Returns:
+        The first and last byte position, both inclusive, or None if the
+        header is malformed or asks for several ranges.
+
+    Raises:
+        HTTPException: 416 if the range lies outside the object.
     """
-    Returns the file as a stream for the given key, supporting range queries.
+    match = re.fullmatch(r"\s*bytes=(\d*)-(\d*)\s*", range_header)
+    if match is None or match.group(1) == match.group(2) == "":
+        return None
+
+    if match.group(1) == "":
+        suffix = int(match.group(2))
+        start, end = max(size - suffix, 0), size - 1
+        if suffix == 0:
+            start = size
+    else:
+        start = int(match.group(1))
+        end = size - 1
+        if match.group(2):
+            if int(match.group(2)) < start:
+                return None
+            end = min(int(match.group(2)), size - 1)
+
+    if start >= size:
+        raise HTTPException(
+            status_code=416, headers={"Content-Range": f"bytes */{size}"}
+        )
+    return start, end
+
+
+async def object_headers(
+    storage: AbstractStorage, key: str
+) -> tuple[int, datetime, dict[str, str]]:
     """
-    storage = storage_for_bucket(bucket)
-    if not storage.file_exists(key):
+    Returns the size, last modified time and the metadata headers of a file.
+    """
+    if not await storage.file_exists(key):
         raise HTTPException(status_code=404)
 
     last_modified = await storage.get_mtime(key)
     if not last_modified:
         raise HTTPException(status_code=404)
+    last_modified = to_utc(last_modified)
+    size = await storage.get_size(key)
 
-    if "If-Modified-Since" in request.headers:
-        if_modified_since = parsedate_to_datetime(request.headers["If-Modified-Since"])
-        last_modified = last_modified.replace(tzinfo=timezone.utc)
-        if if_modified_since >= last_modified:
-            raise HTTPException(status_code=304)
-
-    ext = os.path.splitext(key)[-1]
-    media_type = EXTENSION_TO_CONTENT_TYPE.get(ext, "application/octet-stream")
+    etag = hashlib.md5(f"{key}-{last_modified.timestamp()}-{size}".encode())
+    ext = os.path.splitext(key)[-1].lstrip(".")
     headers = {
-        "Last-Modified": last_modified.strftime("%a, %d %b %Y %H:%M:%S GMT"),
+        "Last-Modified": format_datetime(last_modified, usegmt=True),
+        "ETag": f'"{etag.hexdigest()}"',
         "Accept-Ranges": "bytes",
-        "Content-Type": media_type,
+        "Content-Type": EXTENSION_TO_CONTENT_TYPE.get(ext, "application/octet-stream"),
     }
+    return size, last_modified, headers
+
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime) -> bool:
+    """
+    Evaluates If-None-Match, or If-Modified-Since if no entity tag is given.
+    """
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match is not None:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+
+    if_modified_since = request.headers.get("If-Modified-Since")
+    if if_modified_since is not None:
+        since = parse_http_date(if_modified_since)
+        return since is not None and last_modified <= since
+    return False
+
+
+def range_applies(request: Request, etag: str, last_modified: datetime) -> bool:
+    """
+    Evaluates If-Range. A stale validator means the full file is sent.
+    """
+    if_range = request.headers.get("If-Range")
+    if if_range is None:
+        return True
+    if if_range.startswith('"'):
+        return if_range == etag
+    return parse_http_date(if_range) == last_modified
+
+
+@router.head("/{bucket}/{key}")
+async def head(bucket: str, key: str):
+    """
+    Returns the metadata for the file with the given key.
+    """
+    storage = storage_for_bucket(bucket)
+    size, _, headers = await object_headers(storage, key)
+    headers["Content-Length"] = str(size)
+    return Response(status_code=200, headers=headers)
+
+
+@router.get("/{bucket}/{key}")
+async def get(bucket: str, key: str, request: Request):
+    """
+    Returns the file as a stream for the given key, supporting range queries
+    and conditional requests.
+
+    A satisfiable single byte range is answered with 206 and only the bytes
+    of that range are read from storage.
+    """
+    storage = storage_for_bucket(bucket)
+    size, last_modified, headers = await object_headers(storage, key)
+
+    if is_not_modified(request, headers["ETag"], last_modified):
+        del headers["Content-Type"]
+        return Response(status_code=304, headers=headers)
 
     range_header = request.headers.get("Range")
-    start: Optional[int] = 0
-    end: Optional[int] = None
-
-    if range_header:
-        try:
-            range_match = re.match(r"bytes=(\d+)-(\d*)", range_header)
-            if range_match:
-                start = int(range_match.group(1))
-                end_str = range_match.group(2)
-                end = int(end_str)
-            else:
-                raise ValueError("Invalid range format")
-
-            stream = BytesIO()
-            await storage.download(key, stream)
-            data = stream.getvalue()
-
-            headers["Content-Range"] = f"bytes {start}-{end}/{len(data)}"
+    if range_header and range_applies(request, headers["ETag"], last_modified):
+        byte_range = parse_range(range_header, size)
+        if byte_range is not None:
+            start, end = byte_range
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
             headers["Content-Length"] = str(end - start + 1)
-
-            return Response(
-                content=data[start : end + 1],
+            return StreamingResponse(
+                content=storage.download_range(key, start, end),
                 status_code=206,
                 headers=headers,
             )
-        except ValueError:
-            # If range is invalid, ignore it and return full content
-            pass
-
-    # TODO: Add Content-Length header
 
+    headers["Content-Length"] = str(size)
     return StreamingResponse(
         content=storage.download_stream(key),
         headers=headers,
@@ -138,6 +199,6 @@ async def delete(bucket: str, key: str, user: User = Depends(current_user)):
     Deletes the asset for the given key.
     """
     storage = storage_for_bucket(bucket)
-    if not storage.file_exists(key):
+    if not await storage.file_exists(key):
         return Response(status_code=404)
     await storage.delete(key)
@@ -9,7 +9,7 @@ from typing import Any
 from anthropic import BaseModel
 from fastapi import WebSocket, WebSocketDisconnect
 from nodetool.common.environment import Environment
-from nodetool.metadata.types import AssetRef
+from nodetool.metadata.types import AssetRef, tensors_to_json
 from nodetool.workflows.processing_context import ProcessingContext
 from nodetool.workflows.run_workflow import run_workflow
 from nodetool.workflows.run_job_request import RunJobRequest
@@ -153,6 +153,8 @@ class WebSocketRunner:
                             if msg.status == "completed":
                                 result = msg.result
                                 for key, value in result.items():
+                                    if isinstance(value, AssetRef):
+                                        value.encode_memory()
                                     if isinstance(value, AssetRef) and value.data:
                                         if isinstance(value.data, bytes):
                                             value.uri = f"data:application/octet-stream;base64,{base64.b64encode(value.data).decode('utf-8')}"
@@ -198,7 +200,7 @@ class WebSocketRunner:
                 await self.websocket.send_bytes(packed_message)  # type: ignore
                 log.debug(f"Sent binary message: {message.get('type', message)}")
             else:
-                await self.websocket.send_text(json.dumps(message))
+                await self.websocket.send_text(json.dumps(tensors_to_json(message)))
                 log.debug(f"Sent text message: {message.get('type', message)}")
         except Exception as e:
             log.error(f"Error sending message: {e}")
@@ -15,6 +15,8 @@ CONTENT_TYPE_TO_EXTENSION = {
     "application/json": "json",
     "application/pdf": "pdf",
     "application/zip": "zip",
+    "application/vnd.apache.arrow.file": "arrow",
+    "application/vnd.apache.parquet": "parquet",
     "application/x-7z-compressed": "7z",
     "application/x-rar-compressed": "rar",
     "application/x-tar": "tar",
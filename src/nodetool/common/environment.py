@@ -31,6 +31,20 @@ DEFAULT_ENV = {
     "ASSET_FOLDER": str(get_system_file_path("assets")),
     "MEMCACHE_HOST": None,
     "MEMCACHE_PORT": None,
+    "NODE_CACHE": "memory",
+    "NODE_CACHE_DIR": str(get_system_file_path("node_cache")),
+    "NODE_CACHE_MEMORY_LIMIT": 1024 * 1024 * 1024,
+    "NODE_CACHE_DISK_LIMIT": 10 * 1024 * 1024 * 1024,
+    "MODEL_CACHE_MEMORY_LIMIT": 16 * 1024 * 1024 * 1024,
+    "MODEL_EXECUTOR_THREADS": 1,
+    "MODEL_BATCH_SIZE": 32,
+    "MODEL_BATCH_WAIT": 0.01,
+    "AUDIO_CODEC": "mp3",
+    "DATAFRAME_PREVIEW_ROWS": 1000,
+    "WORKER_POOL_SIZE": 2,
+    "WORKER_MAX_JOBS": 50,
+    "MEDIA_WORKER_THREADS": 2,
+    "MEDIA_QUEUE_SIZE": 100,
     "DB_PATH": str(get_system_file_path("nodetool.sqlite3")),
     "REPLICATE_API_TOKEN": None,
     "OPENAI_API_KEY": None,
@@ -206,17 +220,50 @@ class Environment(object):
         """
         return os.environ.get("MEMCACHE_PORT")
 
+    @classmethod
+    def get_audio_codec(cls):
+        """
+        The audio codec is the format used to encode in-memory audio when it
+        leaves the workflow, e.g. "mp3", "wav", "flac" or "ogg".
+        """
+        return cls.get("AUDIO_CODEC")
+
+    @classmethod
+    def get_dataframe_preview_rows(cls) -> int:
+        """
+        The number of rows of an in-memory dataframe that are sent to the
+        client as a preview.
+        """
+        return int(cls.get("DATAFRAME_PREVIEW_ROWS"))
+
     @classmethod
     def set_node_cache(cls, node_cache: AbstractNodeCache):
         cls.node_cache = node_cache
 
+    @classmethod
+    def get_node_cache_type(cls):
+        """
+        The node cache type selects the node cache backend.
+        One of "memory" or "disk". Memcached is used whenever
+        a memcache host and port are configured and the type is not "disk".
+        """
+        return cls.get("NODE_CACHE")
+
     @classmethod
     def get_node_cache(cls) -> AbstractNodeCache:
         memcache_host = cls.get_memcache_host()
         memcache_port = cls.get_memcache_port()
 
         if not hasattr(cls, "node_cache"):
-            if memcache_host and memcache_port:
+            if cls.get_node_cache_type() == "disk":
+                from nodetool.storage.disk_node_cache import DiskNodeCache
+
+                cls.node_cache = DiskNodeCache(
+                    path=cls.get("NODE_CACHE_DIR"),
+                    max_memory_bytes=int(cls.get("NODE_CACHE_MEMORY_LIMIT")),
+                    max_disk_bytes=int(cls.get("NODE_CACHE_DISK_LIMIT")),
+                )
+            elif memcache_host and memcache_port:
                 from nodetool.storage.memcache_node_cache import MemcachedNodeCache
 
                 cls.node_cache = MemcachedNodeCache(
@@ -602,7 +649,6 @@ class Environment(object):
         Get the S3 service.
         """
         from nodetool.storage.s3_storage import S3Storage
-        import boto3
 
         endpoint_url = cls.get_s3_endpoint_url()
         access_key_id = cls.get_s3_access_key_id()
@@ -612,19 +658,13 @@ class Environment(object):
         assert secret_access_key is not None, "AWS secret access key is required"
         assert endpoint_url is not None, "S3 endpoint URL is required"
 
-        client = boto3.client(
-            "s3",
-            region_name=cls.get_s3_region(),
-            endpoint_url=endpoint_url,
-            aws_access_key_id=access_key_id,
-            aws_secret_access_key=secret_access_key,
-        )
-
         return S3Storage(
             bucket_name=bucket,
-            domain=domain,
             endpoint_url=endpoint_url,
-            client=client,
+            access_key_id=access_key_id,
+            secret_access_key=secret_access_key,
+            region_name=cls.get_s3_region(),
+            domain=domain,
         )
 
     @classmethod
@@ -0,0 +1,299 @@
+import asyncio
+import heapq
+import itertools
+import weakref
+from typing import Any, Awaitable, Callable
+
+from nodetool.common.environment import Environment
+
+log = Environment.get_logger()
+
+# Status requests per second allowed for each provider.
+DEFAULT_RATE_LIMITS = {
+    "replicate": 10.0,
+    "kling": 5.0,
+    "luma": 5.0,
+}
+
+
+class RateLimiter:
+    """
+    A token bucket that allows rate requests per second, with bursts of up
+    to burst requests.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        self.tokens = self.burst
+        self.updated_at: float | None = None
+
+    def reserve(self, now: float) -> float:
+        """
+        Takes a token if one is available and returns 0. Otherwise returns
+        the seconds until the next token is available.
+        """
+        if self.updated_at is not None:
+            elapsed = now - self.updated_at
+            self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class _Job:
+    def __init__(
+        self,
+        provider: str,
+        job_id: str,
+        poll: Callable[[], Awaitable[Any]],
+        is_done: Callable[[Any], bool],
+        on_update: Callable[[Any], None] | None,
+        deadline: float | None,
+        interval: float,
+        future: asyncio.Future,
+    ):
+        self.provider = provider
+        self.job_id = job_id
+        self.poll = poll
+        self.is_done = is_done
+        self.on_update = on_update
+        self.deadline = deadline
+        self.interval = interval
+        self.future = future
+        self.errors = 0
+
+
+class JobPoller:
+    """
+    Polls the status of remote jobs, e.g. generations running at Replicate,
+    Kling or Luma, until they are done.
+
+    All outstanding jobs share one scheduler task, which keeps them in a
+    queue ordered by their next poll time:
+
+    - The first poll is immediate. The interval then grows by backoff per
+      poll, from initial_interval up to max_interval.
+    - Requests to a provider are limited by a token bucket, see
+      DEFAULT_RATE_LIMITS. Polls beyond the limit are postponed.
+    - A job fails with TimeoutError when its deadline passes, and with the
+      poll error after max_errors failed polls in a row.
+    - complete and fail finish a job right away, e.g. from a webhook.
+
+    Use get_default to get the poller of the running event loop.
+
+    Attributes:
+        initial_interval (float): Seconds between the first polls of a job.
+        max_interval (float): Largest number of seconds between two polls.
+        backoff (float): Factor the interval grows by after each poll.
+        max_errors (int): Failed polls in a row before a job fails.
+        polls (int): Number of successful polls.
+    """
+
+    _pollers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, JobPoller]" = (
+        weakref.WeakKeyDictionary()
+    )
+
+    def __init__(
+        self,
+        initial_interval: float = 1.0,
+        max_interval: float = 10.0,
+        backoff: float = 1.5,
+        max_errors: int = 5,
+        rate_limits: dict[str, float] | None = None,
+    ):
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.max_errors = max_errors
+        self.limiters = {
+            provider: RateLimiter(rate)
+            for provider, rate in (
+                DEFAULT_RATE_LIMITS if rate_limits is None else rate_limits
+            ).items()
+        }
+        self.jobs: dict[tuple[str, str], _Job] = {}
+        self.queue: list[tuple[float, int, _Job]] = []
+        self.counter = itertools.count()
+        self.wakeup = asyncio.Event()
+        self.task: asyncio.Task | None = None
+        self.polling: set[asyncio.Task] = set()
+        self.polls = 0
+
+    @classmethod
+    def get_default(cls) -> "JobPoller":
+        """
+        Returns the shared poller of the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        poller = cls._pollers.get(loop)
+        if poller is None:
+            poller = cls._pollers[loop] = cls()
+        return poller
+
+    def set_rate_limit(self, provider: str, rate: float, burst: float | None = None):
+        """
+        Limits the status requests to a provider to rate per second.
+        """
+        self.limiters[provider] = RateLimiter(rate, burst)
+
+    async def wait(
+        self,
+        provider: str,
+        job_id: str,
+        poll: Callable[[], Awaitable[Any]],
+        is_done: Callable[[Any], bool],
+        timeout: float | None = None,
+        on_update: Callable[[Any], None] | None = None,
+    ) -> Any:
+        """
+        Polls a remote job until it is done.
+
+        Args:
+            provider (str): The provider, used for rate limits.
+            job_id (str): The id of the job at the provider.
+            poll: Fetches the current status of the job.
+            is_done: Returns True for a status that finishes the job.
+            timeout (float): Seconds after which the job fails with TimeoutError.
+            on_update: Called with every status that was fetched.
+
+        Returns:
+            The last status, or the value passed to complete.
+        """
+        loop = asyncio.get_running_loop()
+        key = (provider, job_id)
+        existing = self.jobs.get(key)
+        if existing is not None:
+            return await asyncio.shield(existing.future)
+
+        now = loop.time()
+        job = _Job(
+            provider=provider,
+            job_id=job_id,
+            poll=poll,
+            is_done=is_done,
+            on_update=on_update,
+            deadline=now + timeout if timeout is not None else None,
+            interval=self.initial_interval,
+            future=loop.create_future(),
+        )
+        self.jobs[key] = job
+        self._schedule(job, now)
+        if self.task is None or self.task.done():
+            self.task = loop.create_task(self._run())
+        try:
+            return await job.future
+        finally:
+            if self.jobs.get(key) is job:
+                del self.jobs[key]
+            if not job.future.done():
+                job.future.cancel()
+            # Lets the scheduler exit once no jobs are left.
+            self.wakeup.set()
+
+    def complete(self, provider: str, job_id: str, result: Any) -> bool:
+        """
+        Finishes a job with the given result without waiting for the next
+        poll. Returns False if no such job is being polled.
+        """
+        job = self.jobs.get((provider, job_id))
+        if job is None or job.future.done():
+            return False
+        job.future.set_result(result)
+        self.wakeup.set()
+        return True
+
+    def fail(self, provider: str, job_id: str, error: BaseException) -> bool:
+        """
+        Fails a job with the given error without waiting for the next poll.
+        Returns False if no such job is being polled.
+        """
+        job = self.jobs.get((provider, job_id))
+        if job is None or job.future.done():
+            return False
+        job.future.set_exception(error)
+        self.wakeup.set()
+        return True
+
+    def _schedule(self, job: _Job, at: float):
+        if job.deadline is not None:
+            at = min(at, job.deadline)
+        heapq.heappush(self.queue, (at, next(self.counter), job))
+        self.wakeup.set()
+
+    def _reschedule(self, job: _Job):
+        loop = asyncio.get_running_loop()
+        self._schedule(job, loop.time() + job.interval)
+        job.interval = min(job.interval * self.backoff, self.max_interval)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while self.jobs:
+            if not self.queue:
+                self.wakeup.clear()
+                await self.wakeup.wait()
+                continue
+
+            at, _, job = self.queue[0]
+            if job.future.done():
+                heapq.heappop(self.queue)
+                continue
+
+            now = loop.time()
+            if at > now:
+                self.wakeup.clear()
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), at - now)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self.queue)
+            if job.deadline is not None and now >= job.deadline:
+                job.future.set_exception(
+                    TimeoutError(f"{job.provider} job {job.job_id} timed out")
+                )
+                continue
+
+            limiter = self.limiters.get(job.provider)
+            delay = limiter.reserve(now) if limiter else 0.0
+            if delay > 0:
+                heapq.heappush(self.queue, (now + delay, next(self.counter), job))
+                continue
+
+            task = loop.create_task(self._poll(job))
+            self.polling.add(task)
+            task.add_done_callback(self.polling.discard)
+
+    async def _poll(self, job: _Job):
+        try:
+            status = await job.poll()
+        except Exception as e:
+            job.errors += 1
+            if job.future.done():
+                return
+            if job.errors >= self.max_errors:
+                job.future.set_exception(e)
+                return
+            log.warning(f"Polling {job.provider} job {job.job_id} failed: {e}")
+            self._reschedule(job)
+            return
+
+        self.polls += 1
+        job.errors = 0
+        if job.future.done():
+            return
+        try:
+            if job.on_update is not None:
+                job.on_update(status)
+            if job.is_done(status):
+                job.future.set_result(status)
+                return
+        except Exception as e:
+            job.future.set_exception(e)
+            return
+        self._reschedule(job)
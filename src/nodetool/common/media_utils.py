@@ -18,8 +18,12 @@ Functions:
     create_empty_video: Create a video file with empty frames.
     create_image_thumbnail: Generate a thumbnail image from an image using PIL.
     create_video_thumbnail: Generate a thumbnail image from a video file using OpenCV.
+    create_video_thumbnail_from_file: Generate a thumbnail image from a video file on disk.
     get_video_duration: Get the duration of a media file using ffprobe.
+    get_video_duration_from_file: Get the duration of a media file on disk using ffprobe.
     get_audio_duration: Get the duration of an audio file using pydub.
+    apply_video_filters: Run a chain of ffmpeg filters over a video in one ffmpeg call.
+    apply_video_filters_async: Asynchronous variant of apply_video_filters.
 
 The module relies on external libraries such as PIL, OpenCV, pydub, and ffmpeg for media processing tasks.
 It includes both synchronous and asynchronous functions to handle different types of media operations efficiently.
@@ -95,38 +99,47 @@ async def create_video_thumbnail(input_io: IO, width: int, height: int) -> Bytes
         temp_file_path = temp_file.name  # Store the temporary file path
 
     try:
-        # Use ffmpeg to generate thumbnail
-        # select the most representative frame in a given sequence of consecutive frames
-        # automatically from the video.
-        cmd = [
-            "ffmpeg",
-            "-i",
-            temp_file_path,
-            "-vf",
-            "thumbnail=300",
-            "-frames:v",
-            "1",
-            "-f",
-            "image2pipe",
-            "-",
-        ]
-
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-
-        output, errors = await process.communicate()
-
-        if process.returncode == 0:
-            return BytesIO(output)
-        else:
-            raise Exception(f"ffmpeg error: {errors.decode()}")
+        return await create_video_thumbnail_from_file(temp_file_path, width, height)
     finally:
         os.remove(temp_file_path)  # Ensure the temporary file is deleted
 
 
+async def create_video_thumbnail_from_file(
+    path: str, width: int, height: int
+) -> BytesIO:
+    """
+    Generate a thumbnail image from a video file on disk using ffmpeg.
+    """
+    # Use ffmpeg to generate thumbnail
+    # select the most representative frame in a given sequence of consecutive frames
+    # automatically from the video.
+    cmd = [
+        "ffmpeg",
+        "-i",
+        path,
+        "-vf",
+        "thumbnail=300",
+        "-frames:v",
+        "1",
+        "-f",
+        "image2pipe",
+        "-",
+    ]
+
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+
+    output, errors = await process.communicate()
+
+    if process.returncode == 0:
+        return BytesIO(output)
+    else:
+        raise Exception(f"ffmpeg error: {errors.decode()}")
+
+
 async def get_video_duration(input_io: BytesIO) -> Union[float, None]:
     """
     Get the duration of a media file using ffprobe.
@@ -146,40 +159,53 @@ async def get_video_duration(input_io: BytesIO) -> Union[float, None]:
         temp_file_path = temp_file.name  # Store the temporary file path
 
     try:
-        cmd = [
-            "ffprobe",
-            "-v",
-            "error",  # Set error log level
-            "-show_entries",
-            "format=duration",  # Show only the duration entry
-            "-of",
-            "default=noprint_wrappers=1:nokey=1",  # Output format for the duration
-            "-i",
-            temp_file_path,  # Read from the temporary file
-        ]
+        return await get_video_duration_from_file(temp_file_path)
+    finally:
+        os.remove(temp_file_path)
 
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
 
-        output, errors = await process.communicate()
+async def get_video_duration_from_file(path: str) -> Union[float, None]:
+    """
+    Get the duration of a media file on disk using ffprobe.
 
-        if process.returncode == 0:
-            duration = output.strip()
-            if duration:
-                try:
-                    return float(duration)
-                except ValueError as e:
-                    print(f"Error parsing duration: {e}")
-                    return None
-            return None
-        else:
-            print(f"ffprobe error: {errors.decode()}")
-            return None
-    finally:
-        os.remove(temp_file_path)
+    Args:
+        path: Path of the media file.
+
+    Returns:
+        float: The duration of the media file in seconds.
+    """
+    cmd = [
+        "ffprobe",
+        "-v",
+        "error",  # Set error log level
+        "-show_entries",
+        "format=duration",  # Show only the duration entry
+        "-of",
+        "default=noprint_wrappers=1:nokey=1",  # Output format for the duration
+        "-i",
+        path,
+    ]
+
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+
+    output, errors = await process.communicate()
+
+    if process.returncode == 0:
+        duration = output.strip()
+        if duration:
+            try:
+                return float(duration)
+            except ValueError as e:
+                print(f"Error parsing duration: {e}")
+                return None
+        return None
+    else:
+        print(f"ffprobe error: {errors.decode()}")
+        return None
 
 
 def get_audio_duration(source_io: BytesIO) -> float:
@@ -195,3 +221,81 @@ def get_audio_duration(source_io: BytesIO) -> float:
     audio = pydub.AudioSegment.from_file(source_io)
     duration = len(audio) / 1000.0
     return duration
+
+
+# A video filter is an ffmpeg filter name with its positional and keyword arguments.
+VideoFilter = tuple[str, tuple, dict]
+
+
+def _compile_video_filters(
+    input_path: str, filters: list[VideoFilter], output_path: str
+) -> list[str]:
+    import ffmpeg
+
+    stream = ffmpeg.input(input_path)
+    for name, args, kwargs in filters:
+        stream = stream.filter(name, *args, **kwargs)
+    return ffmpeg.output(stream, output_path).overwrite_output().compile()
+
+
+def apply_video_filters(source: bytes, filters: list[VideoFilter]) -> bytes:
+    """
+    Run a chain of ffmpeg filters over a video with a single ffmpeg invocation,
+    so the video is decoded and encoded only once.
+
+    Args:
+        source: The encoded input video.
+        filters: The filters to apply, in order.
+
+    Returns:
+        bytes: The encoded output video (mp4).
+    """
+    import ffmpeg
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_path = os.path.join(temp_dir, "input.mp4")
+        output_path = os.path.join(temp_dir, "output.mp4")
+        with open(input_path, "wb") as f:
+            f.write(source)
+
+        cmd = _compile_video_filters(input_path, filters, output_path)
+        process = subprocess.run(cmd, capture_output=True)
+        if process.returncode != 0:
+            raise ffmpeg.Error("ffmpeg", process.stdout, process.stderr)
+
+        with open(output_path, "rb") as f:
+            return f.read()
+
+
+async def apply_video_filters_async(source: bytes, filters: list[VideoFilter]) -> bytes:
+    """
+    Run a chain of ffmpeg filters over a video in an ffmpeg subprocess
+    without blocking the event loop.
+
+    Args:
+        source: The encoded input video.
+        filters: The filters to apply, in order.
+
+    Returns:
+        bytes: The encoded output video (mp4).
+    """
+    import ffmpeg
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_path = os.path.join(temp_dir, "input.mp4")
+        output_path = os.path.join(temp_dir, "output.mp4")
+        with open(input_path, "wb") as f:
+            f.write(source)
+
+        cmd = _compile_video_filters(input_path, filters, output_path)
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        output, errors = await process.communicate()
+        if process.returncode != 0:
+            raise ffmpeg.Error("ffmpeg", output, errors)
+
+        with open(output_path, "rb") as f:
+            return f.read()
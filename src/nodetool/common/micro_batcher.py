@@ -0,0 +1,92 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+BatchFunction = Callable[[list[Any]], Awaitable[list[Any]]]
+
+
+class _PendingBatch:
+    def __init__(self, run_batch: BatchFunction):
+        self.run_batch = run_batch
+        self.items: list[Any] = []
+        self.futures: list[asyncio.Future] = []
+        self.timer: asyncio.TimerHandle | None = None
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent calls with the same key into batched calls.
+
+    The first item submitted for a key opens a batch. Items submitted for the
+    same key within max_wait seconds join it, until it holds max_batch_size
+    items. The batch function of the first caller then runs once on all items
+    and each caller receives the result at the position of its item.
+
+    Attributes:
+        max_batch_size (int): Largest number of items in a batch.
+        max_wait (float): Seconds a batch waits for more items.
+    """
+
+    def __init__(self, max_batch_size: int = 32, max_wait: float = 0.01):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.pending: dict[Hashable, _PendingBatch] = {}
+        self.tasks: set[asyncio.Task] = set()
+
+    async def submit(self, key: Hashable, item: Any, run_batch: BatchFunction) -> Any:
+        """
+        Adds an item to the open batch for key and waits for its result.
+
+        Args:
+            key (Hashable): Calls with equal keys are batched together.
+            item (Any): The input of this call.
+            run_batch (BatchFunction): Computes the results for a list of
+                items, in the same order. Used if this call opens the batch.
+
+        Returns:
+            The result for item.
+        """
+        loop = asyncio.get_running_loop()
+        batch = self.pending.get(key)
+        if batch is None:
+            batch = _PendingBatch(run_batch)
+            self.pending[key] = batch
+            batch.timer = loop.call_later(self.max_wait, self._flush, key, batch)
+
+        future = loop.create_future()
+        batch.items.append(item)
+        batch.futures.append(future)
+        if len(batch.items) >= self.max_batch_size:
+            self._flush(key, batch)
+        return await future
+
+    def _flush(self, key: Hashable, batch: _PendingBatch):
+        if self.pending.get(key) is not batch:
+            return
+        del self.pending[key]
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def _run(self, batch: _PendingBatch):
+        try:
+            results = await batch.run_batch(batch.items)
+            if len(results) != len(batch.items):
+                raise ValueError(
+                    f"Batch returned {len(results)} results for {len(batch.items)} items"
+                )
+        except asyncio.CancelledError:
+            for future in batch.futures:
+                future.cancel()
+            raise
+        except Exception as e:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for future, result in zip(batch.futures, results):
+            if not future.done():
+                future.set_result(result)
@@ -3,7 +3,7 @@ import enum
 from pathlib import Path
 from types import NoneType
 import numpy as np
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SerializationInfo, model_serializer
 from typing import Any, Literal, Optional, Type, Union
 from typing import Literal
 
@@ -97,6 +97,63 @@ class AssetRef(BaseType):
     uri: str = ""
     asset_id: str | None = None
     data: bytes | list[bytes] | None = None
+    # Decoded value held in process memory, e.g. a PIL image. It is only
+    # encoded into `data` when the reference is serialized or pickled.
+    _memory: Any = None
+
+    @model_serializer(mode="wrap")
+    def serialize(self, handler, info: SerializationInfo):
+        if not (info.exclude and "data" in info.exclude):
+            self.encode_memory()
+        return handler(self)
+
+    def __getstate__(self):
+        self.encode_memory()
+        state = super().__getstate__()
+        private = state.get("__pydantic_private__")
+        if private:
+            state["__pydantic_private__"] = {**private, "_memory": None}
+        return state
+
+    def has_memory(self) -> bool:
+        """Returns True if the reference holds an in-memory decoded value."""
+        return self._memory is not None
+
+    def encode_memory(self):
+        """
+        Encodes the in-memory value into `data` unless the reference already
+        points to encoded content.
+        """
+        if self._has_unencoded_memory():
+            self.data = self._encode_memory(self._memory)
+
+    async def encode_memory_async(self):
+        """
+        Like encode_memory, for callers running on the event loop.
+        """
+        if self._has_unencoded_memory():
+            self.data = await self._encode_memory_async(self._memory)
+
+    def _has_unencoded_memory(self) -> bool:
+        return (
+            self._memory is not None
+            and self.data is None
+            and self.uri == ""
+            and self.asset_id is None
+        )
+
+    def memory_key(self) -> bytes:
+        """
+        Returns a raw representation of the in-memory value, used to derive
+        cache keys without encoding it.
+        """
+        raise NotImplementedError(f"{type(self).__name__} has no in-memory value")
+
+    def _encode_memory(self, value: Any) -> bytes:
+        raise NotImplementedError(f"{type(self).__name__} has no in-memory value")
+
+    async def _encode_memory_async(self, value: Any) -> bytes:
+        return self._encode_memory(value)
 
     def to_dict(self):
         res = {
@@ -107,7 +164,12 @@ class AssetRef(BaseType):
         return res
 
     def is_empty(self):
-        return self.uri == "" and self.asset_id is None and self.data is None
+        return (
+            self.uri == ""
+            and self.asset_id is None
+            and self.data is None
+            and self._memory is None
+        )
 
     def is_set(self):
         return not self.is_empty()
@@ -128,24 +190,138 @@ class ModelRef(AssetRef):
 
 
 class VideoRef(AssetRef):
+    """
+    A reference to a video asset.
+
+    Videos produced by ffmpeg filter nodes may carry the encoded source video
+    and a list of pending filters instead of the filtered result. Chained
+    filter nodes append to the list, and the whole chain is rendered with a
+    single ffmpeg invocation when the video is needed.
+    """
+
     type: Literal["video"] = "video"
     duration: Optional[float] = None  # Duration in seconds
     format: Optional[str] = None
 
+    @classmethod
+    def from_filters(
+        cls, source: bytes, filters: list[tuple[str, tuple, dict]]
+    ) -> "VideoRef":
+        ref = cls()
+        ref._memory = (source, filters)
+        return ref
+
+    def to_filters(self) -> tuple[bytes, list[tuple[str, tuple, dict]]] | None:
+        """
+        Returns the source video and its pending filters, or None if there
+        are none.
+        """
+        return self._memory
+
+    def memory_key(self) -> bytes:
+        import json
+
+        source, filters = self._memory
+        return json.dumps(filters, default=str).encode() + source
+
+    def _encode_memory(self, value: tuple[bytes, list]) -> bytes:
+        from nodetool.common.media_utils import apply_video_filters
+
+        return apply_video_filters(*value)
+
+    async def _encode_memory_async(self, value: tuple[bytes, list]) -> bytes:
+        from nodetool.common.media_utils import apply_video_filters_async
+
+        return await apply_video_filters_async(*value)
+
 
 class TextRef(AssetRef):
     type: Literal["text"] = "text"
 
 
 class AudioRef(AssetRef):
+    """
+    A reference to an audio asset.
+
+    Audio produced inside a workflow may carry raw float32 PCM samples
+    instead of encoded bytes, so that effect chains pass buffers without
+    encoding. The samples are interleaved and normalized to [-1, 1].
+    """
+
     type: Literal["audio"] = "audio"
 
+    @classmethod
+    def from_pcm(
+        cls, samples: np.ndarray, sample_rate: int, channels: int = 1
+    ) -> "AudioRef":
+        ref = cls()
+        ref._memory = (
+            np.ascontiguousarray(samples, dtype=np.float32).reshape(-1),
+            int(sample_rate),
+            int(channels),
+        )
+        return ref
+
+    def to_pcm(self) -> tuple[np.ndarray, int, int] | None:
+        """
+        Returns the in-memory samples, sample rate and number of channels,
+        or None if there are none.
+        """
+        return self._memory
+
+    def memory_key(self) -> bytes:
+        samples, sample_rate, channels = self._memory
+        return f"{sample_rate}:{channels}:".encode() + samples.tobytes()
+
+    def _encode_memory(self, pcm: tuple[np.ndarray, int, int]) -> bytes:
+        from io import BytesIO
+        from pydub import AudioSegment
+        from nodetool.common.environment import Environment
+
+        samples, sample_rate, channels = pcm
+        segment = AudioSegment(
+            data=(np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16).tobytes(),
+            frame_rate=sample_rate,
+            sample_width=2,
+            channels=channels,
+        )
+        buffer = BytesIO()
+        segment.export(buffer, format=Environment.get_audio_codec())
+        return buffer.getvalue()
+
 
 class ImageRef(AssetRef):
-    """A reference to an image asset."""
+    """
+    A reference to an image asset.
+
+    Images produced inside a workflow may carry the decoded PIL image instead
+    of PNG bytes, so that downstream nodes can use it without decoding.
+    """
 
     type: Literal["image"] = "image"
 
+    @classmethod
+    def from_pil(cls, image: Any) -> "ImageRef":
+        ref = cls()
+        ref._memory = image
+        return ref
+
+    def to_pil(self) -> Any:
+        """Returns the in-memory PIL image, or None if there is none."""
+        return self._memory
+
+    def memory_key(self) -> bytes:
+        image = self._memory
+        header = f"{image.mode}:{image.size[0]}x{image.size[1]}:".encode()
+        return header + image.tobytes()
+
+    def _encode_memory(self, image: Any) -> bytes:
+        from io import BytesIO
+
+        buffer = BytesIO()
+        image.save(buffer, format="png")
+        return buffer.getvalue()
+
 
 class WorkflowRef(BaseType):
     type: Literal["workflow"] = "workflow"
@@ -764,14 +940,40 @@ class Task(BaseType):
 
 
 class Tensor(BaseType):
+    """
+    An n-dimensional array.
+
+    Numeric tensors are stored as dtype + shape + a contiguous buffer in `data`,
+    which msgpack and pickle carry as raw bytes. The `value` list is only used
+    for tensors coming from JSON clients and for non-numeric dtypes.
+    JSON serialization always falls back to the nested `value` list.
+    """
+
     type: Literal["tensor"] = "tensor"
     value: list[Any] = []
     dtype: Optional[str] = None
+    shape: Optional[list[int]] = None
+    data: Optional[bytes] = None
+
+    @model_serializer(mode="wrap")
+    def serialize(self, handler, info: SerializationInfo):
+        if info.mode_is_json() and self.data is not None:
+            return {
+                "type": self.type,
+                "value": self.to_list(),
+                "dtype": self.dtype,
+                "shape": self.shape,
+                "data": None,
+            }
+        return handler(self)
 
     def is_empty(self):
-        return len(self.value) == 0
+        return self.data is None and len(self.value) == 0
 
     def to_numpy(self) -> np.ndarray:
+        # Binary tensors are returned as a read-only view on the buffer
+        if self.data is not None:
+            return np.frombuffer(self.data, dtype=self.dtype).reshape(self.shape)
         if self.value is None:
             raise ValueError("Tensor is empty")
         if type(self.value) != list:
@@ -784,13 +986,37 @@ class Tensor(BaseType):
 
     @staticmethod
     def from_numpy(tensor: np.ndarray, **kwargs):
-        return Tensor(value=tensor.tolist(), dtype=str(tensor.dtype), **kwargs)
+        if tensor.dtype.kind not in "biufc":
+            return Tensor(value=tensor.tolist(), dtype=str(tensor.dtype), **kwargs)
+        return Tensor(
+            data=np.ascontiguousarray(tensor).tobytes(),
+            dtype=str(tensor.dtype),
+            shape=list(tensor.shape),
+            **kwargs,
+        )
 
     @staticmethod
     def from_list(tensor: list, **kwargs):
         return Tensor(value=tensor, **kwargs)
 
 
+def tensors_to_json(value: Any) -> Any:
+    """
+    Replace binary tensor payloads in an already dumped structure with nested lists.
+
+    Used before encoding messages as JSON, as JSON has no binary type.
+    """
+    if isinstance(value, Tensor):
+        return value.model_dump(mode="json")
+    if isinstance(value, dict):
+        if value.get("type") == "tensor" and isinstance(value.get("data"), bytes):
+            return Tensor(**value).model_dump(mode="json")
+        return {k: tensors_to_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [tensors_to_json(v) for v in value]
+    return value
+
+
 def to_numpy(num: float | int | Tensor) -> np.ndarray:
     if type(num) in (float, int, list):
         return np.array(num)
@@ -850,11 +1076,71 @@ class RecordType(BaseType):
     columns: list[ColumnDef] = []
 
 
+def arrow_column_defs(schema: Any) -> list[ColumnDef]:
+    """
+    Returns the column definitions for the fields of an Arrow schema.
+    """
+    import pyarrow as pa
+
+    def column_type(t) -> ColumnType:
+        if pa.types.is_integer(t):
+            return "int"
+        if pa.types.is_floating(t):
+            return "float"
+        if pa.types.is_timestamp(t) or pa.types.is_date(t):
+            return "datetime"
+        if pa.types.is_string(t) or pa.types.is_large_string(t):
+            return "string"
+        return "object"
+
+    return [
+        ColumnDef(name=field.name, data_type=column_type(field.type))
+        for field in schema
+    ]
+
+
 class DataframeRef(AssetRef):
+    """
+    A reference to a dataframe.
+
+    Dataframes produced inside a workflow may carry an Arrow table, which is
+    passed between nodes without conversion. When such a reference is
+    serialized, only the first rows are written to `data` as a preview
+    (DATAFRAME_PREVIEW_ROWS). Pickled references keep the whole table.
+    """
+
     type: Literal["dataframe"] = "dataframe"
     columns: list[ColumnDef] | None = None
     data: list[list[Any]] | None = None
 
+    @classmethod
+    def from_arrow(cls, table: Any) -> "DataframeRef":
+        ref = cls(columns=arrow_column_defs(table.schema))
+        ref._memory = table
+        return ref
+
+    def to_arrow(self) -> Any:
+        """Returns the in-memory Arrow table, or None if there is none."""
+        return self._memory
+
+    def __getstate__(self):
+        return super(AssetRef, self).__getstate__()
+
+    def memory_key(self) -> bytes:
+        import pyarrow as pa
+
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, self._memory.schema) as writer:
+            writer.write_table(self._memory)
+        return sink.getvalue().to_pybytes()
+
+    def _encode_memory(self, table: Any) -> list[list[Any]]:  # type: ignore[override]
+        from nodetool.common.environment import Environment
+
+        preview = table.slice(0, Environment.get_dataframe_preview_rows())
+        columns = preview.to_pydict()
+        return [list(row) for row in zip(*columns.values())]
+
 
 class RankingResult(BaseType):
     type: Literal["ranking_result"] = "ranking_result"
@@ -916,7 +1202,11 @@ def asset_to_ref(asset: Asset):
         return AudioRef(asset_id=asset.id)
     elif asset.content_type.startswith("video"):
         return VideoRef(asset_id=asset.id)
-    elif asset.content_type == "text/csv":
+    elif asset.content_type in (
+        "text/csv",
+        "application/vnd.apache.arrow.file",
+        "application/vnd.apache.parquet",
+    ):
         return DataframeRef(asset_id=asset.id)
     elif asset.content_type.startswith("text"):
         return TextRef(asset_id=asset.id)
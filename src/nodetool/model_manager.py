@@ -1,5 +1,9 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 import torch
-from typing import Dict, Any
+from typing import Dict, Any, Iterator
 import logging
 
 from nodetool.common.environment import Environment
@@ -7,41 +11,195 @@ from nodetool.common.environment import Environment
 logger = Environment.get_logger()
 
 
+def estimate_model_size(model: Any) -> int:
+    """
+    Estimate the memory footprint of a model in bytes from the sizes of its
+    parameters and buffers.
+
+    Handles torch modules, objects with a `model` attribute (transformers
+    pipelines) and objects with a `components` dict (diffusers pipelines).
+    Tensors shared between modules are counted once.
+    """
+    modules: list[torch.nn.Module] = []
+    if isinstance(model, torch.nn.Module):
+        modules.append(model)
+    else:
+        inner = getattr(model, "model", None)
+        if isinstance(inner, torch.nn.Module):
+            modules.append(inner)
+        components = getattr(model, "components", None)
+        if isinstance(components, dict):
+            modules += [
+                c for c in components.values() if isinstance(c, torch.nn.Module)
+            ]
+
+    seen: set[int] = set()
+    size = 0
+    for module in modules:
+        for tensor in [*module.parameters(), *module.buffers()]:
+            key = id(tensor)
+            if key in seen:
+                continue
+            seen.add(key)
+            size += tensor.numel() * tensor.element_size()
+    return size
+
+
 class ModelManager:
-    _models: Dict[str, Any] = {}
-    _models_by_node: Dict[str, str] = {}
+    """
+    Keeps loaded models in memory so that repeated runs can reuse them.
+
+    Models are kept in least recently used order within a byte budget
+    (MODEL_CACHE_MEMORY_LIMIT), using the estimated size of each model.
+    Models used by a running node are pinned and are not evicted.
+
+    Model loading and inference run on a dedicated thread pool
+    (MODEL_EXECUTOR_THREADS), so they do not block the event loop.
+    """
+
+    _models: "OrderedDict[str, Any]" = OrderedDict()
+    _sizes: Dict[str, int] = {}
+    _models_by_node: Dict[str, set[str]] = {}
+    _running_nodes: Dict[str, int] = {}
+    _total_bytes: int = 0
+    _hits: int = 0
+    _misses: int = 0
+    _evictions: int = 0
+    _lock = threading.RLock()
+    _executor: ThreadPoolExecutor | None = None
 
     @classmethod
-    def get_model(cls, model_id: str, task: str, path: str | None = None) -> Any:
-        if not Environment.is_production():
-            key = f"{model_id}_{task}_{path}"
+    def get_executor(cls) -> ThreadPoolExecutor:
+        """
+        Returns the executor used for model loading and inference.
+        """
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=int(Environment.get("MODEL_EXECUTOR_THREADS")),
+                    thread_name_prefix="model",
+                )
+            return cls._executor
+
+    @classmethod
+    def get_memory_limit(cls) -> int:
+        return int(Environment.get("MODEL_CACHE_MEMORY_LIMIT"))
+
+    @classmethod
+    def get_model(
+        cls,
+        model_id: str,
+        task: str,
+        path: str | None = None,
+        node_id: str | None = None,
+    ) -> Any:
+        key = f"{model_id}_{task}_{path}"
+        with cls._lock:
             model = cls._models.get(key)
+            if model is None:
+                cls._misses += 1
+                return None
+            cls._models.move_to_end(key)
+            cls._hits += 1
+            if node_id is not None:
+                cls._models_by_node.setdefault(node_id, set()).add(key)
             return model
-        return None
 
     @classmethod
     def set_model(
         cls, node_id: str, model_id: str, task: str, model: Any, path: str | None = None
     ):
-        if not Environment.is_production():
-            key = f"{model_id}_{task}_{path}"
+        key = f"{model_id}_{task}_{path}"
+        size = estimate_model_size(model)
+        with cls._lock:
+            if key in cls._models:
+                cls._remove(key)
             cls._models[key] = model
-            cls._models_by_node[node_id] = key
+            cls._sizes[key] = size
+            cls._total_bytes += size
+            cls._models_by_node.setdefault(node_id, set()).add(key)
+            cls.trim()
+
+    @classmethod
+    @contextmanager
+    def running(cls, node_id: str) -> Iterator[None]:
+        """
+        Pins the models of a node while it runs. A node can run several times
+        at once, e.g. in the iterations of a loop.
+        """
+        with cls._lock:
+            cls._running_nodes[node_id] = cls._running_nodes.get(node_id, 0) + 1
+        try:
+            yield
+        finally:
+            with cls._lock:
+                cls._running_nodes[node_id] -= 1
+                if cls._running_nodes[node_id] == 0:
+                    del cls._running_nodes[node_id]
+                cls.trim()
+
+    @classmethod
+    def trim(cls):
+        """
+        Evicts least recently used models that are not pinned until the
+        models fit into the memory budget.
+        """
+        limit = cls.get_memory_limit()
+        with cls._lock:
+            if cls._total_bytes <= limit:
+                return
+            pinned = set().union(
+                *(cls._models_by_node.get(n, set()) for n in cls._running_nodes)
+            )
+            for key in list(cls._models):
+                if cls._total_bytes <= limit:
+                    break
+                if key in pinned:
+                    continue
+                logger.info(f"Evicting model {key} ({cls._sizes[key]} bytes)")
+                cls._remove(key)
+                cls._evictions += 1
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        """
+        Returns hit, miss and eviction counters with the current model count
+        and estimated size.
+        """
+        with cls._lock:
+            return {
+                "hits": cls._hits,
+                "misses": cls._misses,
+                "evictions": cls._evictions,
+                "models": len(cls._models),
+                "bytes": cls._total_bytes,
+            }
 
     @classmethod
     def clear_unused(cls, node_ids: list[str]):
         cleared_count = 0
-        for node_id in node_ids:
-            key = cls._models_by_node.pop(node_id, None)
-            if key:
-                del cls._models[key]
-                cleared_count += 1
+        with cls._lock:
+            for node_id in node_ids:
+                for key in cls._models_by_node.pop(node_id, set()):
+                    if key in cls._models:
+                        cls._remove(key)
+                        cleared_count += 1
         logger.info(f"Cleared {cleared_count} unused models")
 
     @classmethod
     def clear(cls):
-        model_count = len(cls._models)
-        node_count = len(cls._models_by_node)
-        cls._models.clear()
-        cls._models_by_node.clear()
+        with cls._lock:
+            model_count = len(cls._models)
+            node_count = len(cls._models_by_node)
+            cls._models.clear()
+            cls._sizes.clear()
+            cls._models_by_node.clear()
+            cls._total_bytes = 0
         logger.info(f"Cleared all models: {model_count} models, {node_count} nodes")
+
+    @classmethod
+    def _remove(cls, key: str):
+        del cls._models[key]
+        cls._total_bytes -= cls._sizes.pop(key)
+        for keys in cls._models_by_node.values():
+            keys.discard(key)
@@ -26,6 +26,8 @@ class Asset(DBModel):
     metadata: dict | None = DBField(default=None)
     created_at: datetime = DBField(default_factory=datetime.now)
     duration: Optional[float] = DBField(default=None)
+    # "pending", "ready" or "failed" for assets with background media processing.
+    media_status: Optional[str] = DBField(default=None)
 
     @property
     def file_extension(self) -> str:
@@ -148,31 +150,35 @@ class Asset(DBModel):
         items, _ = cls.query(Field("parent_id").equals(parent_id))
         return items
 
+    @classmethod
+    def get_asset_tree(cls, user_id: str, asset_ids: Sequence[str]) -> list["Asset"]:
+        """
+        Fetch the given assets of a user together with all their descendants
+        in one recursive query. Parents come before their children.
+        """
+        return cls.query_tree(
+            list(dict.fromkeys(asset_ids)),
+            parent_field="parent_id",
+            condition=Field("user_id").equals(user_id),
+        )
+
     @classmethod
     def get_assets_recursive(cls, user_id: str, folder_id: str) -> Dict:
         """
         Fetch all assets recursively for a given folder_id.
         """
-        def recursive_fetch(current_folder_id):
-            assets, _ = cls.paginate(user_id=user_id, parent_id=current_folder_id, limit=10000)
-            result = []
-            for asset in assets:
-                if asset.user_id != user_id:
-                    continue
-                
-                asset_dict = asset.dict()
-                if asset.content_type == "folder":
-                    asset_dict["children"] = recursive_fetch(asset.id)
-                result.append(asset_dict)
-            
-            return result
-
-        folder = cls.find(user_id, folder_id)
-        if not folder:
+        tree = cls.get_asset_tree(user_id, [folder_id])
+        if not tree or tree[0].id != folder_id:
             log.warning(f"Folder {folder_id} not found for user {user_id}")
             return {"assets": []}
 
-        folder_dict = folder.model_dump()
-        folder_dict["children"] = recursive_fetch(folder_id)
-        
-        return {"assets": [folder_dict]}
+        dicts = {asset.id: asset.model_dump() for asset in tree}
+        for asset in tree:
+            if asset.content_type == "folder" or asset.id == folder_id:
+                dicts[asset.id]["children"] = []
+        for asset in tree[1:]:
+            parent = dicts.get(asset.parent_id)
+            if parent is not None and "children" in parent:
+                parent["children"].append(dicts[asset.id])
+
+        return {"assets": [dicts[folder_id]]}
@@ -91,6 +91,37 @@ class DBModel(BaseModel):
         )
         return [cls(**item) for item in items], key
 
+    @classmethod
+    def query_tree(
+        cls,
+        root_keys: list[Any],
+        parent_field: str,
+        condition: ConditionBuilder | None = None,
+    ):
+        """
+        Retrieve the items with the given keys and all their descendants in
+        one query. Parents come before their children.
+
+        Args:
+            root_keys: The primary keys of the roots of the tree.
+            parent_field: The field holding the primary key of the parent.
+            condition: A condition every item of the tree must match.
+
+        Returns:
+            A list of items, ordered by depth.
+        """
+        items = cls.adapter().query_tree(
+            root_keys=root_keys, parent_field=parent_field, condition=condition
+        )
+        return [cls(**item) for item in items]
+
+    @classmethod
+    def delete_many(cls, keys: list[Any]):
+        """
+        Delete the items with the given primary keys from the DB.
+        """
+        cls.adapter().delete_many(keys)
+
     @classmethod
     def create(cls, **kwargs):
         """
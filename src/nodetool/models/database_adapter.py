@@ -4,6 +4,9 @@ from typing import Any, Dict, List, Tuple, Type
 from nodetool.models.condition_builder import ConditionBuilder
 from pydantic.fields import FieldInfo
 
+# Tree queries stop descending at this depth, so cycles cannot recurse forever.
+MAX_TREE_DEPTH = 256
+
 
 class DatabaseAdapter(ABC):
     fields: Dict[str, FieldInfo]
@@ -40,6 +43,31 @@ class DatabaseAdapter(ABC):
     ) -> tuple[list[dict[str, Any]], str]:
         pass
 
+    @abstractmethod
+    def query_tree(
+        self,
+        root_keys: List[Any],
+        parent_field: str,
+        condition: ConditionBuilder | None = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch the rows with the given primary keys and all their descendants
+        in one recursive query. A row is a child of the row whose primary key
+        is in its parent_field. The condition applies to every row, roots
+        included, and rows that fail it are not descended into.
+
+        Rows are ordered by depth, so parents come before their children.
+        Descent stops at MAX_TREE_DEPTH levels.
+        """
+        pass
+
+    def delete_many(self, primary_keys: List[Any]) -> None:
+        """
+        Delete the rows with the given primary keys.
+        """
+        for key in primary_keys:
+            self.delete(key)
+
     @abstractmethod
     def execute_sql(
         self, sql: str, params: dict[str, Any] = {}
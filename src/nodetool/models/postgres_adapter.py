@@ -14,7 +14,7 @@ from nodetool.models.condition_builder import (
     Operator,
 )
 from contextlib import contextmanager
-from .database_adapter import DatabaseAdapter
+from .database_adapter import MAX_TREE_DEPTH, DatabaseAdapter
 from typing import Any, Type, Union, get_origin, get_args
 from psycopg2.extras import Json
 from psycopg2.extras import RealDictCursor
@@ -350,6 +350,69 @@ class PostgresAdapter(DatabaseAdapter):
             cursor.execute(query, (primary_key,))
         self.connection.commit()
 
+    def delete_many(self, primary_keys: List[Any]) -> None:
+        if not primary_keys:
+            return
+        query = SQL("DELETE FROM {} WHERE {} = ANY(%s)").format(
+            Identifier(self.table_name), Identifier(self.get_primary_key())
+        )
+        with self.connection.cursor() as cursor:
+            cursor.execute(query, (list(primary_keys),))
+        self.connection.commit()
+
+    def query_tree(
+        self,
+        root_keys: List[Any],
+        parent_field: str,
+        condition: ConditionBuilder | None = None,
+    ) -> List[Dict[str, Any]]:
+        if not root_keys:
+            return []
+        table = Identifier(self.table_name)
+        pk = Identifier(self.get_primary_key())
+        if condition is not None:
+            where_clause, params = self._build_condition(condition.build())
+        else:
+            where_clause, params = SQL("TRUE"), []
+
+        cols = SQL(", ").join(
+            [SQL("{}.{}").format(table, Identifier(col)) for col in self.fields.keys()]
+        )
+        # Roots may be nested in each other, so each row is kept at its
+        # smallest depth.
+        query = SQL(
+            """
+            WITH RECURSIVE tree(node_key, node_depth) AS (
+                SELECT {pk}, 0 FROM {table}
+                WHERE {pk} = ANY(%s) AND ({where})
+                UNION
+                SELECT child.{pk}, tree.node_depth + 1
+                FROM {table} AS child
+                JOIN tree ON child.{parent} = tree.node_key
+                WHERE ({where}) AND tree.node_depth < {max_depth}
+            )
+            SELECT {cols} FROM {table}
+            JOIN (
+                SELECT node_key, MIN(node_depth) AS node_depth
+                FROM tree GROUP BY node_key
+            ) AS nodes ON {table}.{pk} = nodes.node_key
+            ORDER BY nodes.node_depth, {table}.{pk}
+            """
+        ).format(
+            pk=pk,
+            table=table,
+            parent=Identifier(parent_field),
+            where=where_clause,
+            max_depth=SQL(str(MAX_TREE_DEPTH)),
+            cols=cols,
+        )
+        with self.connection.cursor(cursor_factory=RealDictCursor) as cursor:
+            cursor.execute(query, [list(root_keys), *params, *params])
+            return [
+                convert_from_postgres_attributes(dict(row), self.fields)
+                for row in cursor.fetchall()
+            ]
+
     def _build_condition(
         self, condition: Union[Condition, ConditionGroup]
     ) -> tuple[Composed, list[Any]]:
@@ -13,12 +13,15 @@ from nodetool.models.condition_builder import (
     Operator,
 )
 
-from .database_adapter import DatabaseAdapter
+from .database_adapter import MAX_TREE_DEPTH, DatabaseAdapter
 from typing import Any, Type, Union, get_origin, get_args
 import json
 from enum import EnumMeta as EnumType
 from enum import Enum
 
+# Bound parameters per statement, the default limit of older SQLite builds.
+MAX_VARIABLES = 999
+
 
 def convert_to_sqlite_format(
     value: Any, py_type: Type
@@ -338,6 +341,58 @@ class SQLiteAdapter(DatabaseAdapter):
         self.connection.execute(query, (primary_key,))
         self.connection.commit()
 
+    def delete_many(self, primary_keys: List[Any]) -> None:
+        pk_column = self.get_primary_key()
+        for i in range(0, len(primary_keys), MAX_VARIABLES):
+            keys = primary_keys[i : i + MAX_VARIABLES]
+            placeholders = ", ".join(["?" for _ in keys])
+            query = (
+                f"DELETE FROM {self.table_name} WHERE {pk_column} IN ({placeholders})"
+            )
+            self.connection.execute(query, keys)
+        self.connection.commit()
+
+    def query_tree(
+        self,
+        root_keys: List[Any],
+        parent_field: str,
+        condition: ConditionBuilder | None = None,
+    ) -> List[Dict[str, Any]]:
+        if not root_keys:
+            return []
+        pk = self.get_primary_key()
+        if condition is not None:
+            where_clause, params = self._build_condition(condition.build())
+        else:
+            where_clause, params = "1 = 1", []
+
+        cols = ", ".join([f"{self.table_name}.{col}" for col in self.fields.keys()])
+        placeholders = ", ".join(["?" for _ in root_keys])
+        # Roots may be nested in each other, so each row is kept at its
+        # smallest depth.
+        query = f"""
+            WITH RECURSIVE tree(node_key, node_depth) AS (
+                SELECT {pk}, 0 FROM {self.table_name}
+                WHERE {pk} IN ({placeholders}) AND ({where_clause})
+                UNION
+                SELECT child.{pk}, tree.node_depth + 1
+                FROM {self.table_name} AS child
+                JOIN tree ON child.{parent_field} = tree.node_key
+                WHERE ({where_clause}) AND tree.node_depth < {MAX_TREE_DEPTH}
+            )
+            SELECT {cols} FROM {self.table_name}
+            JOIN (
+                SELECT node_key, MIN(node_depth) AS node_depth
+                FROM tree GROUP BY node_key
+            ) AS nodes ON {self.table_name}.{pk} = nodes.node_key
+            ORDER BY nodes.node_depth, {self.table_name}.{pk}
+        """
+        cursor = self.connection.execute(query, [*root_keys, *params, *params])
+        return [
+            convert_from_sqlite_attributes(dict(row), self.fields)
+            for row in cursor.fetchall()
+        ]
+
     def _build_condition(
         self, condition: Union[Condition, ConditionGroup]
     ) -> tuple[str, list[Any]]:
@@ -143,6 +143,7 @@ class SaveImage(ComfyNode):
     async def process(self, context: ProcessingContext):
         if self.images.is_empty():
             raise ValueError("The input image is not connected.")
+        self.images.encode_memory()
         if isinstance(self.images.data, list):
             images = await asyncio.gather(
                 *[self._save_image(context, image) for image in self.images.data]
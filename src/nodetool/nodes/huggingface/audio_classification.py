@@ -73,7 +73,8 @@ class AudioClassifier(HuggingFacePipelineNode):
 
     async def process(self, context: ProcessingContext) -> dict[str, float]:
         samples, _, _ = await context.audio_to_numpy(self.audio)
-        result = self._pipeline(
+        result = await context.run_model(
+            self._pipeline,
             samples,
             top_k=self.top_k,
         )  # type: ignore
@@ -139,7 +140,7 @@ class ZeroShotAudioClassifier(HuggingFacePipelineNode):
     async def process(self, context: ProcessingContext) -> dict[str, float]:
         assert self._pipeline is not None, "Pipeline not initialized"
         samples, _, _ = await context.audio_to_numpy(self.audio)
-        result = self._pipeline(
-            samples, candidate_labels=self.candidate_labels.split(",")
+        result = await context.run_model(
+            self._pipeline, samples, candidate_labels=self.candidate_labels.split(",")
         )
         return {item["label"]: item["score"] for item in result}  # type: ignore
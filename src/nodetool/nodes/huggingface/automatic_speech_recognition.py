@@ -255,7 +255,7 @@ class Whisper(HuggingFacePipelineNode):
             },
         }
 
-        result = self._pipeline(samples, **pipeline_kwargs)
+        result = await context.run_model(self._pipeline, samples, **pipeline_kwargs)
 
         assert isinstance(result, dict)
 
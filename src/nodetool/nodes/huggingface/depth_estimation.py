@@ -79,6 +79,6 @@ class DepthEstimation(HuggingFacePipelineNode):
     async def process(self, context: ProcessingContext) -> ImageRef:
         assert self._pipeline is not None
         image = await context.image_to_pil(self.image)
-        result = self._pipeline(image)
+        result = await context.run_model(self._pipeline, image)
         depth_map = result["depth"]  # type: ignore
         return await context.image_from_pil(depth_map)  # type: ignore
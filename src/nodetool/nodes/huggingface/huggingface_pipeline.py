@@ -1,5 +1,8 @@
+import asyncio
+import functools
 import torch
 from nodetool.common.environment import Environment
+from nodetool.common.micro_batcher import MicroBatcher
 from nodetool.providers.huggingface.huggingface_node import HuggingfaceNode
 from nodetool.types.job import JobUpdate
 from nodetool.workflows.processing_context import ProcessingContext
@@ -14,6 +17,22 @@ T = TypeVar("T")
 
 log = Environment.get_logger()
 
+_batcher: MicroBatcher | None = None
+
+
+def get_pipeline_batcher() -> MicroBatcher:
+    """
+    Returns the batcher shared by all pipeline nodes, configured by
+    MODEL_BATCH_SIZE and MODEL_BATCH_WAIT.
+    """
+    global _batcher
+    if _batcher is None:
+        _batcher = MicroBatcher(
+            max_batch_size=int(Environment.get("MODEL_BATCH_SIZE")),
+            max_wait=float(Environment.get("MODEL_BATCH_WAIT")),
+        )
+    return _batcher
+
 
 class HuggingFacePipelineNode(HuggingfaceNode):
     @classmethod
@@ -37,7 +56,7 @@ class HuggingFacePipelineNode(HuggingfaceNode):
         if model_id == "" or model_id is None:
             raise ValueError("Please select a model")
 
-        cached_model = ModelManager.get_model(model_id, pipeline_task)
+        cached_model = ModelManager.get_model(model_id, pipeline_task, node_id=self.id)
         if cached_model:
             return cached_model
 
@@ -53,7 +72,8 @@ class HuggingFacePipelineNode(HuggingfaceNode):
                 message=f"Loading pipeline {type(model_id) == str and model_id or pipeline_task} from HuggingFace",
             )
         )
-        model = pipeline(
+        model = await context.run_model(
+            pipeline,
             pipeline_task,
             model=model_id,
             torch_dtype=torch_dtype,
@@ -78,7 +98,9 @@ class HuggingFacePipelineNode(HuggingfaceNode):
             raise ValueError("Please select a model")
 
         if not skip_cache and not self.should_skip_cache():
-            cached_model = ModelManager.get_model(model_id, model_class.__name__, path)
+            cached_model = ModelManager.get_model(
+                model_id, model_class.__name__, path, node_id=self.id
+            )
             if cached_model:
                 return cached_model
 
@@ -93,7 +115,8 @@ class HuggingFacePipelineNode(HuggingfaceNode):
                     message=f"Loading model {model_id} from {cache_path}",
                 )
             )
-            model = model_class.from_single_file(  # type: ignore
+            model = await context.run_model(
+                model_class.from_single_file,  # type: ignore
                 cache_path,
                 torch_dtype=torch_dtype,
                 variant=variant,
@@ -109,7 +132,8 @@ class HuggingFacePipelineNode(HuggingfaceNode):
                     message=f"Loading model {model_id} from HuggingFace",
                 )
             )
-            model = model_class.from_pretrained(  # type: ignore
+            model = await context.run_model(
+                model_class.from_pretrained,  # type: ignore
                 model_id,
                 torch_dtype=torch_dtype,
                 variant=variant,
@@ -119,6 +143,49 @@ class HuggingFacePipelineNode(HuggingfaceNode):
         ModelManager.set_model(self.id, model_id, model_class.__name__, model, path)
         return model
 
+    async def run_pipeline_batched(
+        self, context: ProcessingContext, inputs: Any, **params: Any
+    ) -> Any:
+        """
+        Runs the pipeline on a single input. Concurrent calls that use the
+        same pipeline with the same parameters, for example from the
+        iterations of a loop, are coalesced into one batched pipeline call.
+
+        A batch of one runs the pipeline on the input itself. Larger batches
+        run it on the list of inputs, so the result is the list element for
+        this input, which some pipelines unwrap compared to a single call.
+
+        Args:
+            context (ProcessingContext): The processing context.
+            inputs (Any): A single input for the pipeline.
+            **params: Parameters of the pipeline call.
+
+        Returns:
+            The pipeline output for inputs.
+        """
+        assert self._pipeline is not None, "Pipeline not initialized"
+        pipeline = self._pipeline
+        # The pipeline instance is shared by all nodes using the same model
+        # and task, see ModelManager.
+        key = (id(pipeline), repr(sorted(params.items())))
+
+        async def run_batch(items: list[Any]) -> list[Any]:
+            if len(items) == 1:
+                call = functools.partial(pipeline, items[0], **params)
+            else:
+                call = functools.partial(
+                    pipeline, items, batch_size=len(items), **params
+                )
+            result = await asyncio.get_running_loop().run_in_executor(
+                ModelManager.get_executor(), call
+            )
+            return [result] if len(items) == 1 else list(result)
+
+        context.check_cancelled()
+        result = await get_pipeline_batcher().submit(key, inputs, run_batch)
+        context.check_cancelled()
+        return result
+
     async def move_to_device(self, device: str):
         if self._pipeline is not None:
             self._pipeline.to(device)  # type: ignore
@@ -91,7 +91,7 @@ class ImageClassifier(HuggingFacePipelineNode):
 
     async def process(self, context: ProcessingContext) -> dict[str, float]:
         image = await context.image_to_pil(self.image)
-        result = self._pipeline(image)  # type: ignore
+        result = await self.run_pipeline_batched(context, image)
         return {str(item["label"]): float(item["score"]) for item in result}  # type: ignore
 
 
@@ -182,7 +182,7 @@ class ZeroShotImageClassifier(HuggingFacePipelineNode):
 
     async def process(self, context: ProcessingContext) -> dict[str, float]:
         image = await context.image_to_pil(self.image)
-        result = self._pipeline(
-            image, candidate_labels=self.candidate_labels.split(",")
+        result = await context.run_model(
+            self._pipeline, image, candidate_labels=self.candidate_labels.split(",")
         )  # type: ignore
         return {str(item["label"]): float(item["score"]) for item in result}  # type: ignore
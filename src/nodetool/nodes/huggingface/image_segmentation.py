@@ -87,7 +87,7 @@ class Segmentation(HuggingFacePipelineNode):
         assert self._pipeline is not None
 
         image = await context.image_to_pil(self.image)
-        result = self._pipeline(image)
+        result = await context.run_model(self._pipeline, image)
 
         async def convert_output(item: dict[str, Any]):
             mask = await context.image_from_pil(item["mask"])
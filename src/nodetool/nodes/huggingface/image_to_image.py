@@ -151,7 +151,7 @@ class BaseImageToImage(HuggingFacePipelineNode):
 
     async def process(self, context: ProcessingContext) -> ImageRef:
         image = await context.image_to_pil(self.image)
-        result = self._pipeline(image, prompt=self.prompt)  # type: ignore
+        result = await context.run_model(self._pipeline, image, prompt=self.prompt)  # type: ignore
         return await context.image_from_pil(result)  # type: ignore
 
 
@@ -378,7 +378,8 @@ class Kandinsky3Img2Img(HuggingFacePipelineNode):
         self._pipeline.enable_sequential_cpu_offload()
 
         input_image = await context.image_to_pil(self.image)
-        output = self._pipeline(
+        output = await context.run_model(
+            self._pipeline,
             prompt=self.prompt,
             num_inference_steps=self.num_inference_steps,
             generator=generator,
@@ -859,13 +860,16 @@ class StableDiffusionUpscale(HuggingFacePipelineNode):
         if self.seed != -1:
             generator = generator.manual_seed(self.seed)
 
-        upscaled_image = self._pipeline(
-            prompt=self.prompt,
-            negative_prompt=self.negative_prompt,
-            image=input_image,
-            num_inference_steps=self.num_inference_steps,
-            guidance_scale=self.guidance_scale,
-            callback=progress_callback(self.id, self.num_inference_steps, context),  # type: ignore
+        upscaled_image = (
+            await context.run_model(
+                self._pipeline,
+                prompt=self.prompt,
+                negative_prompt=self.negative_prompt,
+                image=input_image,
+                num_inference_steps=self.num_inference_steps,
+                guidance_scale=self.guidance_scale,
+                callback=progress_callback(self.id, self.num_inference_steps, context),  # type: ignore
+            )
         ).images[  # type: ignore
             0
         ]
@@ -104,7 +104,9 @@ class ObjectDetection(HuggingFacePipelineNode):
     async def process(self, context: ProcessingContext) -> list[ObjectDetectionResult]:
         assert self._pipeline is not None
         image = await context.image_to_pil(self.image)
-        result = self._pipeline(image, threshold=self.threshold)
+        result = await context.run_model(
+            self._pipeline, image, threshold=self.threshold
+        )
         if isinstance(result, list):
             return [
                 ObjectDetectionResult(
@@ -299,7 +301,8 @@ class ZeroShotObjectDetection(HuggingFacePipelineNode):
     async def process(self, context: ProcessingContext) -> list[ObjectDetectionResult]:
         assert self._pipeline is not None
         image = await context.image_to_pil(self.image)
-        result = self._pipeline(
+        result = await context.run_model(
+            self._pipeline,
             image,
             candidate_labels=self.candidate_labels.split(","),
             threshold=self.threshold,
@@ -77,7 +77,7 @@ class QuestionAnswering(HuggingFacePipelineNode):
             "context": self.context,
         }
 
-        result = self._pipeline(inputs)
+        result = await context.run_model(self._pipeline, inputs)
         assert result is not None
         return {
             "answer": result["answer"],  # type: ignore
@@ -161,7 +161,7 @@ class TableQuestionAnswering(HuggingFacePipelineNode):
             "query": self.question,
         }
 
-        result = self._pipeline(inputs)
+        result = await context.run_model(self._pipeline, inputs)
         assert result is not None
         return {
             "answer": result["answer"],  # type: ignore
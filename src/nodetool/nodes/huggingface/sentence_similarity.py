@@ -66,7 +66,7 @@ class SentenceSimilarity(HuggingFacePipelineNode):
 
         assert self._pipeline is not None
 
-        result = self._pipeline(self.inputs)
+        result = await self.run_pipeline_batched(context, self.inputs)
 
         assert isinstance(result, list)
 
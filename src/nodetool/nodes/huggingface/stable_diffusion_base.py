@@ -560,6 +560,7 @@ class StableDiffusionBaseNode(HuggingFacePipelineNode):
             total = self.num_inference_steps
 
         def callback(step: int, timestep: int, latents: torch.Tensor) -> None:
+            context.check_cancelled()
             context.post_message(
                 NodeProgress(
                     node_id=self.id,
@@ -652,7 +653,8 @@ class StableDiffusionBaseNode(HuggingFacePipelineNode):
             upscale_guidance_scale = max(1.0, min(2.0, upscale_guidance_scale))
 
             # Generate low-res latents
-            low_res_result = self._pipeline(
+            low_res_result = await context.run_model(
+                self._pipeline,
                 prompt=self.prompt,
                 negative_prompt=self.negative_prompt,
                 num_inference_steps=low_res_steps,
@@ -722,17 +724,22 @@ class StableDiffusionBaseNode(HuggingFacePipelineNode):
                 0
             ]
         else:
-            image = self._pipeline(
-                prompt=self.prompt,
-                negative_prompt=self.negative_prompt,
-                num_inference_steps=self.num_inference_steps,
-                guidance_scale=self.guidance_scale,
-                generator=generator,
-                ip_adapter_image=ip_adapter_image,
-                cross_attention_kwargs={"scale": 1.0},
-                callback=self.progress_callback(context, 0, self.num_inference_steps),
-                callback_steps=1,
-                **kwargs,
+            image = (
+                await context.run_model(
+                    self._pipeline,
+                    prompt=self.prompt,
+                    negative_prompt=self.negative_prompt,
+                    num_inference_steps=self.num_inference_steps,
+                    guidance_scale=self.guidance_scale,
+                    generator=generator,
+                    ip_adapter_image=ip_adapter_image,
+                    cross_attention_kwargs={"scale": 1.0},
+                    callback=self.progress_callback(
+                        context, 0, self.num_inference_steps
+                    ),
+                    callback_steps=1,
+                    **kwargs,
+                )
             ).images[0]
 
         return await context.image_from_pil(image)
@@ -869,6 +876,7 @@ class StableDiffusionXLBase(HuggingFacePipelineNode):
 
     def progress_callback(self, context: ProcessingContext):
         def callback(step: int, timestep: int, latents: torch.FloatTensor) -> None:
+            context.check_cancelled()
             context.post_message(
                 NodeProgress(
                     node_id=self.id,
@@ -896,20 +904,23 @@ class StableDiffusionXLBase(HuggingFacePipelineNode):
             else None
         )
 
-        image = self._pipeline(
-            prompt=self.prompt,
-            negative_prompt=self.negative_prompt,
-            num_inference_steps=self.num_inference_steps,
-            guidance_scale=self.guidance_scale,
-            width=self.width,
-            height=self.height,
-            ip_adapter_image=ip_adapter_image,
-            ip_adapter_scale=self.ip_adapter_scale,
-            cross_attention_kwargs={"scale": self.lora_scale},
-            callback=self.progress_callback(context),
-            callback_steps=1,
-            generator=generator,
-            **kwargs,
+        image = (
+            await context.run_model(
+                self._pipeline,
+                prompt=self.prompt,
+                negative_prompt=self.negative_prompt,
+                num_inference_steps=self.num_inference_steps,
+                guidance_scale=self.guidance_scale,
+                width=self.width,
+                height=self.height,
+                ip_adapter_image=ip_adapter_image,
+                ip_adapter_scale=self.ip_adapter_scale,
+                cross_attention_kwargs={"scale": self.lora_scale},
+                callback=self.progress_callback(context),
+                callback_steps=1,
+                generator=generator,
+                **kwargs,
+            )
         ).images[0]
 
         return await context.image_from_pil(image)
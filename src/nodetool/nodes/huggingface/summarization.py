@@ -61,6 +61,8 @@ class Summarize(HuggingFacePipelineNode):
             "do_sample": self.do_sample,
         }
 
-        result = self._pipeline(inputs, **params)
+        result = await self.run_pipeline_batched(context, inputs, **params)
         assert result is not None
+        if isinstance(result, dict):
+            result = [result]
         return result[0]["summary_text"]  # type: ignore
@@ -40,7 +40,9 @@ class TextClassifier(HuggingFacePipelineNode):
 
     async def process(self, context: ProcessingContext) -> dict[str, float]:
         assert self._pipeline is not None
-        result = self._pipeline(self.prompt)
+        result = await self.run_pipeline_batched(context, self.prompt)
+        if isinstance(result, dict):
+            result = [result]
         return {i["label"]: i["score"] for i in list(result)}  # type: ignore
 
 
@@ -108,7 +110,8 @@ class ZeroShotTextClassifier(HuggingFacePipelineNode):
 
     async def process(self, context: ProcessingContext) -> dict[str, float]:
         assert self._pipeline is not None
-        result = self._pipeline(
+        result = await context.run_model(
+            self._pipeline,
             self.inputs,
             candidate_labels=self.candidate_labels.split(","),
             multi_label=self.multi_label,
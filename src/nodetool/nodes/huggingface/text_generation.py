@@ -83,7 +83,8 @@ class TextGeneration(HuggingFacePipelineNode):
 
     async def process(self, context: ProcessingContext) -> str:
         assert self._pipeline is not None
-        result = self._pipeline(
+        result = await context.run_model(
+            self._pipeline,
             self.prompt,
             max_new_tokens=self.max_new_tokens,
             temperature=self.temperature,
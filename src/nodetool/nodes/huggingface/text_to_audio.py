@@ -108,8 +108,8 @@ class MusicGen(HuggingFacePipelineNode):
         inputs["input_ids"] = inputs["input_ids"].to(context.device)
         inputs["attention_mask"] = inputs["attention_mask"].to(context.device)
 
-        audio_values = self._model.generate(
-            **inputs, max_new_tokens=self.max_new_tokens
+        audio_values = await context.run_model(
+            self._model.generate, **inputs, max_new_tokens=self.max_new_tokens
         )
         sampling_rate = self._model.config.audio_encoder.sampling_rate
 
@@ -173,10 +173,13 @@ class MusicLDM(HuggingFacePipelineNode):
 
     async def process(self, context: ProcessingContext) -> AudioRef:
         assert self._pipeline is not None, "Pipeline not initialized"
-        audio = self._pipeline(
-            self.prompt,
-            num_inference_steps=self.num_inference_steps,
-            audio_length_in_s=self.audio_length_in_s,
+        audio = (
+            await context.run_model(
+                self._pipeline,
+                self.prompt,
+                num_inference_steps=self.num_inference_steps,
+                audio_length_in_s=self.audio_length_in_s,
+            )
         ).audios[  # type: ignore
             0
         ]
@@ -245,6 +248,7 @@ class AudioLDM(HuggingFacePipelineNode):
         def progress_callback(
             step: int, timestep: int, latents: torch.FloatTensor
         ) -> None:
+            context.check_cancelled()
             context.post_message(
                 NodeProgress(
                     node_id=self.id,
@@ -253,13 +257,16 @@ class AudioLDM(HuggingFacePipelineNode):
                 )
             )
 
-        audio = self._pipeline(
-            self.prompt,
-            num_inference_steps=self.num_inference_steps,
-            audio_length_in_s=self.audio_length_in_s,
-            generator=generator,
-            callback=progress_callback,  # type: ignore
-            callback_steps=1,
+        audio = (
+            await context.run_model(
+                self._pipeline,
+                self.prompt,
+                num_inference_steps=self.num_inference_steps,
+                audio_length_in_s=self.audio_length_in_s,
+                generator=generator,
+                callback=progress_callback,  # type: ignore
+                callback_steps=1,
+            )
         ).audios[  # type: ignore
             0
         ]
@@ -338,6 +345,7 @@ class AudioLDM2(HuggingFacePipelineNode):
         def progress_callback(
             step: int, timestep: int, latents: torch.FloatTensor
         ) -> None:
+            context.check_cancelled()
             context.post_message(
                 NodeProgress(
                     node_id=self.id,
@@ -346,15 +354,18 @@ class AudioLDM2(HuggingFacePipelineNode):
                 )
             )
 
-        audio = self._pipeline(
-            self.prompt,
-            negative_prompt=self.negative_prompt,
-            num_inference_steps=self.num_inference_steps,
-            audio_length_in_s=self.audio_length_in_s,
-            num_waveforms_per_prompt=self.num_waveforms_per_prompt,
-            generator=generator,
-            callback=progress_callback,  # type: ignore
-            callback_steps=1,
+        audio = (
+            await context.run_model(
+                self._pipeline,
+                self.prompt,
+                negative_prompt=self.negative_prompt,
+                num_inference_steps=self.num_inference_steps,
+                audio_length_in_s=self.audio_length_in_s,
+                num_waveforms_per_prompt=self.num_waveforms_per_prompt,
+                generator=generator,
+                callback=progress_callback,  # type: ignore
+                callback_steps=1,
+            )
         ).audios[  # type: ignore
             0
         ]
@@ -416,10 +427,13 @@ class DanceDiffusion(HuggingFacePipelineNode):
         if self.seed != -1:
             generator = generator.manual_seed(self.seed)
 
-        audio = self._pipeline(
-            audio_length_in_s=self.audio_length_in_s,
-            num_inference_steps=self.num_inference_steps,
-            generator=generator,
+        audio = (
+            await context.run_model(
+                self._pipeline,
+                audio_length_in_s=self.audio_length_in_s,
+                num_inference_steps=self.num_inference_steps,
+                generator=generator,
+            )
         ).audios[  # type: ignore
             0
         ]
@@ -492,6 +506,7 @@ class StableAudioNode(HuggingFacePipelineNode):
         def progress_callback(
             step: int, timestep: int, latents: torch.FloatTensor
         ) -> None:
+            context.check_cancelled()
             context.post_message(
                 NodeProgress(
                     node_id=self.id,
@@ -500,14 +515,17 @@ class StableAudioNode(HuggingFacePipelineNode):
                 )
             )
 
-        audio = self._pipeline(
-            self.prompt,
-            negative_prompt=self.negative_prompt,
-            num_inference_steps=self.num_inference_steps,
-            audio_end_in_s=self.duration,
-            num_waveforms_per_prompt=1,
-            generator=generator,
-            callback=progress_callback,  # type: ignore
+        audio = (
+            await context.run_model(
+                self._pipeline,
+                self.prompt,
+                negative_prompt=self.negative_prompt,
+                num_inference_steps=self.num_inference_steps,
+                audio_end_in_s=self.duration,
+                num_waveforms_per_prompt=1,
+                generator=generator,
+                callback=progress_callback,  # type: ignore
+            )
         ).audios[  # type: ignore
             0
         ]
@@ -260,6 +260,7 @@ class PixArtAlpha(HuggingFacePipelineNode):
             generator = torch.Generator(device="cpu").manual_seed(self.seed)
 
         def callback(step: int, timestep: int, latents: torch.Tensor) -> None:
+            context.check_cancelled()
             context.post_message(
                 NodeProgress(
                     node_id=self.id,
@@ -269,7 +270,8 @@ class PixArtAlpha(HuggingFacePipelineNode):
             )
 
         # Generate the image
-        output = self._pipeline(
+        output = await context.run_model(
+            self._pipeline,
             prompt=self.prompt,
             negative_prompt=self.negative_prompt,
             num_inference_steps=self.num_inference_steps,
@@ -364,6 +366,7 @@ class PixArtSigma(HuggingFacePipelineNode):
             generator = torch.Generator(device="cpu").manual_seed(self.seed)
 
         def callback(step: int, timestep: int, latents: torch.FloatTensor) -> None:
+            context.check_cancelled()
             context.post_message(
                 NodeProgress(
                     node_id=self.id,
@@ -373,7 +376,8 @@ class PixArtSigma(HuggingFacePipelineNode):
             )
 
         # Generate the image
-        output = self._pipeline(
+        output = await context.run_model(
+            self._pipeline,
             prompt=self.prompt,
             negative_prompt=self.negative_prompt,
             num_inference_steps=self.num_inference_steps,
@@ -463,7 +467,8 @@ class Kandinsky3(HuggingFacePipelineNode):
         self._pipeline.enable_sequential_cpu_offload()
 
         # Generate the image
-        output = self._pipeline(
+        output = await context.run_model(
+            self._pipeline,
             prompt=self.prompt,
             num_inference_steps=self.num_inference_steps,
             generator=generator,
@@ -626,7 +631,8 @@ class PlaygroundV2(HuggingFacePipelineNode):
             else None
         )
 
-        output = self._pipeline(
+        output = await context.run_model(
+            self._pipeline,
             prompt=self.prompt,
             num_inference_steps=self.num_inference_steps,
             generator=generator,
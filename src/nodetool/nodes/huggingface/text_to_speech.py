@@ -60,7 +60,9 @@ class Bark(HuggingFacePipelineNode):
 
     async def process(self, context: ProcessingContext) -> AudioRef:
         assert self._pipeline is not None, "Pipeline not initialized"
-        result = self._pipeline(self.prompt, forward_params={"do_sample": True})
+        result = await context.run_model(
+            self._pipeline, self.prompt, forward_params={"do_sample": True}
+        )
         audio = await context.audio_from_numpy(result["audio"], 24_000)  # type: ignore
         return audio
 
@@ -207,7 +209,7 @@ class TextToSpeech(HuggingFacePipelineNode):
     async def process(self, context: ProcessingContext) -> AudioRef:
         assert self._pipeline is not None, "Pipeline not initialized"
 
-        result = self._pipeline(self.text)
+        result = await context.run_model(self._pipeline, self.text)
 
         if isinstance(result, dict) and "audio" in result:
             audio_array = result["audio"]
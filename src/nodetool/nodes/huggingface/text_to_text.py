@@ -72,10 +72,13 @@ class TextToText(HuggingFacePipelineNode):
         self._pipeline.model.to(device)  # type: ignore
 
     async def process(self, context: ProcessingContext) -> str:
-        result = self._pipeline(
+        result = await self.run_pipeline_batched(
+            context,
             self.text,
             max_length=self.max_length,
-        )  # type: ignore
+        )
+        if isinstance(result, dict):
+            result = [result]
         assert isinstance(result, list)
         assert len(result) == 1
         return result[0]["generated_text"]  # type: ignore
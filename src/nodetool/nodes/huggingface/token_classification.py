@@ -50,8 +50,10 @@ class TokenClassification(HuggingFacePipelineNode):
 
     async def process(self, context: ProcessingContext) -> DataframeRef:
         assert self._pipeline is not None
-        result = self._pipeline(
-            self.inputs, aggregation_strategy=self.aggregation_strategy.value
+        result = await self.run_pipeline_batched(
+            context,
+            self.inputs,
+            aggregation_strategy=self.aggregation_strategy.value,
         )
         data = [
             [
@@ -134,7 +134,8 @@ class Translation(HuggingFacePipelineNode):
 
         try:
             # Invoke the pipeline
-            result = self._pipeline(
+            result = await context.run_model(
+                self._pipeline,
                 self.inputs,
                 src_lang=self.source_lang.value,
                 tgt_lang=self.target_lang.value,
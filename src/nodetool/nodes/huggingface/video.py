@@ -166,7 +166,8 @@ class AnimateDiffNode(HuggingFacePipelineNode):
         if self.seed != -1:
             generator = generator.manual_seed(self.seed)
 
-        output = self._pipeline(
+        output = await context.run_model(
+            self._pipeline,
             prompt=self.prompt,
             negative_prompt=self.negative_prompt,
             num_frames=self.num_frames,
@@ -253,6 +254,7 @@ class StableVideoDiffusion(HuggingFacePipelineNode):
             generator = generator.manual_seed(self.seed)
 
         def callback(pipe: StableVideoDiffusionPipeline, step: int, *args):
+            context.check_cancelled()
             context.post_message(
                 NodeProgress(
                     node_id=self.id,
@@ -263,12 +265,15 @@ class StableVideoDiffusion(HuggingFacePipelineNode):
             return {}
 
         # Generate the video frames
-        frames = self._pipeline(
-            input_image,
-            num_frames=self.num_frames,
-            decode_chunk_size=self.decode_chunk_size,
-            generator=generator,
-            callback_on_step_end=callback,  # type: ignore
+        frames = (
+            await context.run_model(
+                self._pipeline,
+                input_image,
+                num_frames=self.num_frames,
+                decode_chunk_size=self.decode_chunk_size,
+                generator=generator,
+                callback_on_step_end=callback,  # type: ignore
+            )
         ).frames[  # type: ignore
             0
         ]
@@ -3,12 +3,16 @@ import time
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field
 from enum import Enum
-import asyncio
 import base64
 import json
 import hmac
 import hashlib
 
+from nodetool.common.job_poller import JobPoller
+
+# Seconds a Kling task may take before waiting for it fails.
+TASK_TIMEOUT = 1800
+
 
 class TaskStatus(str, Enum):
     SUBMITTED = "submitted"
@@ -97,10 +101,12 @@ class KlingAIAPI:
         access_key: str,
         secret_key: str,
         base_url: str = "https://api.klingai.com",
+        poller: JobPoller | None = None,
     ):
         self.access_key = access_key
         self.secret_key = secret_key
         self.base_url = base_url
+        self.poller = poller
         self.client = httpx.AsyncClient()
 
     def _generate_token(self) -> str:
@@ -140,12 +146,15 @@ class KlingAIAPI:
         return response.json()
 
     async def _poll_task(self, task_id: str, get_task_func) -> TaskResponse:
-        while True:
-            response: TaskResponse = await get_task_func(task_id)
-            task_status = response.data.task_status
-            if task_status in [TaskStatus.SUCCEED, TaskStatus.FAILED]:
-                return response
-            await asyncio.sleep(1)
+        poller = self.poller or JobPoller.get_default()
+        return await poller.wait(
+            "kling",
+            task_id,
+            poll=lambda: get_task_func(task_id),
+            is_done=lambda response: response.data.task_status
+            in [TaskStatus.SUCCEED, TaskStatus.FAILED],
+            timeout=TASK_TIMEOUT,
+        )
 
     # Image Generation
     async def create_image_generation_task(
@@ -10,6 +10,7 @@ from nodetool.workflows.base_node import BaseNode
 from nodetool.workflows.processing_context import ProcessingContext
 from nodetool.metadata.types import VideoRef, ImageRef, TextRef
 from nodetool.common.environment import Environment
+from nodetool.common.job_poller import JobPoller
 import asyncio
 import aiohttp
 
@@ -61,22 +62,20 @@ class TextToVideo(BaseNode):
 async def poll_for_completion(
     client: lumaai.AsyncClient,
     generation_id: str,
-    max_attempts: int = 600,
-    delay: int = 1,
+    timeout: float = 600,
 ) -> str:
-    for _ in range(max_attempts):
-        generation = await client.generations.get(id=generation_id)
-        print(generation)
-        if generation.state == "dreaming":
-            pass
-        elif generation.state == "completed":
-            assert generation.assets
-            assert generation.assets.video
-            return generation.assets.video
-        elif generation.state == "failed":
-            raise RuntimeError(f"Video generation failed: {generation.failure_reason}")
-        await asyncio.sleep(delay)
-    raise TimeoutError("Video generation timed out")
+    generation = await JobPoller.get_default().wait(
+        "luma",
+        generation_id,
+        poll=lambda: client.generations.get(id=generation_id),
+        is_done=lambda generation: generation.state in ("completed", "failed"),
+        timeout=timeout,
+    )
+    if generation.state == "failed":
+        raise RuntimeError(f"Video generation failed: {generation.failure_reason}")
+    assert generation.assets
+    assert generation.assets.video
+    return generation.assets.video
 
 
 class ImageToVideo(BaseNode):
@@ -54,7 +54,7 @@ class ConvertToTensor(BaseNode):
 
     async def process(self, context: ProcessingContext) -> Tensor:
         audio = await context.audio_to_audio_segment(self.audio)
-        samples = np.array(audio.get_array_of_samples().tolist())
+        samples = np.array(audio.get_array_of_samples())
         return Tensor.from_numpy(samples)
 
 
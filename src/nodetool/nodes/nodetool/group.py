@@ -13,9 +13,16 @@ class Loop(GroupNode):
 
     Use cases:
     - Loop over a list of items and process the nodes inside the group
+    - Map a model over many items, several at a time
     """
 
     input: Any = Field(default_factory=list, description="The input data to loop over.")
+    max_concurrency: int = Field(
+        default=1,
+        ge=1,
+        le=64,
+        description="Maximum number of items processed at the same time. Results keep the order of the input.",
+    )
 
     async def process(self, context: ProcessingContext) -> Any:
         raise NotImplementedError()
@@ -224,32 +224,16 @@ class Trim(BaseNode):
     )
 
     async def process(self, context: ProcessingContext) -> VideoRef:
-        import ffmpeg
-
         if self.video.is_empty():
             raise ValueError("Input video must be connected.")
 
-        video_file = await context.asset_to_io(self.video)
-
-        with tempfile.NamedTemporaryFile(suffix=".mp4") as temp:
-            temp.write(video_file.read())
-
-            input_stream = ffmpeg.input(temp.name)
-
-            # Apply trimming
-            if self.end_time > 0:
-                trimmed = input_stream.trim(start=self.start_time, end=self.end_time)
-            else:
-                trimmed = input_stream.trim(start=self.start_time)
-
-            with tempfile.NamedTemporaryFile(suffix=".mp4") as output_temp:
-                ffmpeg.output(trimmed, output_temp.name).overwrite_output().run(
-                    quiet=False
-                )
-
-                # Read the trimmed video and create a VideoRef
-                with open(output_temp.name, "rb") as f:
-                    return await context.video_from_io(f)
+        if self.end_time > 0:
+            return await context.video_apply_filter(
+                self.video, "trim", start=self.start_time, end=self.end_time
+            )
+        return await context.video_apply_filter(
+            self.video, "trim", start=self.start_time
+        )
 
 
 class VideoResizeNode(BaseNode):
@@ -274,29 +258,12 @@ class VideoResizeNode(BaseNode):
     )
 
     async def process(self, context: ProcessingContext) -> VideoRef:
-        import ffmpeg
-
         if self.video.is_empty():
             raise ValueError("Input video must be connected.")
 
-        video_file = await context.asset_to_io(self.video)
-
-        with tempfile.NamedTemporaryFile(suffix=".mp4") as temp:
-            temp.write(video_file.read())
-
-            input_stream = ffmpeg.input(temp.name)
-
-            # Apply resizing
-            resized = input_stream.filter("scale", self.width, self.height)
-
-            with tempfile.NamedTemporaryFile(suffix=".mp4") as output_temp:
-                ffmpeg.output(resized, output_temp.name).overwrite_output().run(
-                    quiet=False
-                )
-
-                # Read the resized video and create a VideoRef
-                with open(output_temp.name, "rb") as f:
-                    return await context.video_from_io(f)
+        return await context.video_apply_filter(
+            self.video, "scale", self.width, self.height
+        )
 
 
 class Rotate(BaseNode):
@@ -318,30 +285,12 @@ class Rotate(BaseNode):
     )
 
     async def process(self, context: ProcessingContext) -> VideoRef:
-        import ffmpeg
-
         if self.video.is_empty():
             raise ValueError("Input video must be connected.")
 
-        video_file = await context.asset_to_io(self.video)
-
-        with tempfile.NamedTemporaryFile(suffix=".mp4") as temp:
-            temp.write(video_file.read())
-
-            input_stream = ffmpeg.input(temp.name)
-
-            # translate angle to radians
-            angle = np.radians(self.angle)
-            rotated = input_stream.filter("rotate", angle=angle)
-
-            with tempfile.NamedTemporaryFile(suffix=".mp4") as output_temp:
-                ffmpeg.output(rotated, output_temp.name).overwrite_output().run(
-                    quiet=False
-                )
-
-                # Read the rotated video and create a VideoRef
-                with open(output_temp.name, "rb") as f:
-                    return await context.video_from_io(f)
+        # translate angle to radians
+        angle = np.radians(self.angle)
+        return await context.video_apply_filter(self.video, "rotate", angle=angle)
 
 
 class SetSpeed(BaseNode):
@@ -365,29 +314,12 @@ class SetSpeed(BaseNode):
     )
 
     async def process(self, context: ProcessingContext) -> VideoRef:
-        import ffmpeg
-
         if self.video.is_empty():
             raise ValueError("Input video must be connected.")
 
-        video_file = await context.asset_to_io(self.video)
-
-        with tempfile.NamedTemporaryFile(suffix=".mp4") as temp:
-            temp.write(video_file.read())
-
-            input_stream = ffmpeg.input(temp.name)
-
-            # Apply speed adjustment
-            adjusted = input_stream.filter("setpts", f"{1/self.speed_factor}*PTS")
-
-            with tempfile.NamedTemporaryFile(suffix=".mp4") as output_temp:
-                ffmpeg.output(adjusted, output_temp.name).overwrite_output().run(
-                    quiet=False
-                )
-
-                # Read the speed-adjusted video and create a VideoRef
-                with open(output_temp.name, "rb") as f:
-                    return await context.video_from_io(f)
+        return await context.video_apply_filter(
+            self.video, "setpts", f"{1/self.speed_factor}*PTS"
+        )
 
 
 class Overlay(BaseNode):
@@ -472,34 +404,16 @@ class ColorBalance(BaseNode):
     )
 
     async def process(self, context: ProcessingContext) -> VideoRef:
-        import ffmpeg
-
         if self.video.is_empty():
             raise ValueError("Input video must be connected.")
 
-        video_file = await context.asset_to_io(self.video)
-
-        with tempfile.NamedTemporaryFile(suffix=".mp4") as temp:
-            temp.write(video_file.read())
-
-            input_stream = ffmpeg.input(temp.name)
-
-            # Apply color balance adjustment
-            adjusted = input_stream.filter(
-                "colorbalance",
-                rs=self.red_adjust - 1,
-                gs=self.green_adjust - 1,
-                bs=self.blue_adjust - 1,
-            )
-
-            with tempfile.NamedTemporaryFile(suffix=".mp4") as output_temp:
-                ffmpeg.output(adjusted, output_temp.name).overwrite_output().run(
-                    quiet=False
-                )
-
-                # Read the color-adjusted video and create a VideoRef
-                with open(output_temp.name, "rb") as f:
-                    return await context.video_from_io(f)
+        return await context.video_apply_filter(
+            self.video,
+            "colorbalance",
+            rs=self.red_adjust - 1,
+            gs=self.green_adjust - 1,
+            bs=self.blue_adjust - 1,
+        )
 
 
 class Denoise(BaseNode):
@@ -524,29 +438,10 @@ class Denoise(BaseNode):
     )
 
     async def process(self, context: ProcessingContext) -> VideoRef:
-        import ffmpeg
-
         if self.video.is_empty():
             raise ValueError("Input video must be connected.")
 
-        video_file = await context.asset_to_io(self.video)
-
-        with tempfile.NamedTemporaryFile(suffix=".mp4") as temp:
-            temp.write(video_file.read())
-
-            input_stream = ffmpeg.input(temp.name)
-
-            # Apply denoising filter
-            denoised = input_stream.filter("nlmeans", s=self.strength)
-
-            with tempfile.NamedTemporaryFile(suffix=".mp4") as output_temp:
-                ffmpeg.output(denoised, output_temp.name).overwrite_output().run(
-                    quiet=False
-                )
-
-                # Read the denoised video and create a VideoRef
-                with open(output_temp.name, "rb") as f:
-                    return await context.video_from_io(f)
+        return await context.video_apply_filter(self.video, "nlmeans", s=self.strength)
 
 
 class Stabilize(BaseNode):
@@ -575,33 +470,19 @@ class Stabilize(BaseNode):
     )
 
     async def process(self, context: ProcessingContext) -> VideoRef:
-        import ffmpeg
-
         if self.video.is_empty():
             raise ValueError("Input video must be connected.")
 
-        video_file = await context.asset_to_io(self.video)
-
-        with tempfile.NamedTemporaryFile(suffix=".mp4") as temp:
-            temp.write(video_file.read())
-
-            input_stream = ffmpeg.input(temp.name)
+        stabilized = await context.video_apply_filter(
+            self.video, "deshake", smooth=self.smoothing
+        )
 
-            # Apply video stabilization
-            stabilized = input_stream.filter("deshake", smooth=self.smoothing)
+        # Optionally crop black borders
+        if self.crop_black:
+            stabilized = await context.video_apply_filter(stabilized, "cropdetect")
+            stabilized = await context.video_apply_filter(stabilized, "crop")
 
-            # Optionally crop black borders
-            if self.crop_black:
-                stabilized = stabilized.filter("cropdetect").filter("crop")
-
-            with tempfile.NamedTemporaryFile(suffix=".mp4") as output_temp:
-                ffmpeg.output(stabilized, output_temp.name).overwrite_output().run(
-                    quiet=False
-                )
-
-                # Read the stabilized video and create a VideoRef
-                with open(output_temp.name, "rb") as f:
-                    return await context.video_from_io(f)
+        return stabilized
 
 
 class Sharpness(BaseNode):
@@ -632,37 +513,20 @@ class Sharpness(BaseNode):
     )
 
     async def process(self, context: ProcessingContext) -> VideoRef:
-        import ffmpeg
-
         if self.video.is_empty():
             raise ValueError("Input video must be connected.")
 
-        video_file = await context.asset_to_io(self.video)
-
-        with tempfile.NamedTemporaryFile(suffix=".mp4") as temp:
-            temp.write(video_file.read())
-
-            input_stream = ffmpeg.input(temp.name)
-
-            # Apply unsharp mask filter for sharpening
-            sharpened = input_stream.filter(
-                "unsharp",
-                luma_msize_x=5,  # 5x5 matrix for luma
-                luma_msize_y=5,
-                luma_amount=self.luma_amount,
-                chroma_msize_x=5,  # 5x5 matrix for chroma
-                chroma_msize_y=5,
-                chroma_amount=self.chroma_amount,
-            )
-
-            with tempfile.NamedTemporaryFile(suffix=".mp4") as output_temp:
-                ffmpeg.output(sharpened, output_temp.name).overwrite_output().run(
-                    quiet=False
-                )
-
-                # Read the sharpened video and create a VideoRef
-                with open(output_temp.name, "rb") as f:
-                    return await context.video_from_io(f)
+        # Apply unsharp mask filter for sharpening
+        return await context.video_apply_filter(
+            self.video,
+            "unsharp",
+            luma_msize_x=5,  # 5x5 matrix for luma
+            luma_msize_y=5,
+            luma_amount=self.luma_amount,
+            chroma_msize_x=5,  # 5x5 matrix for chroma
+            chroma_msize_y=5,
+            chroma_amount=self.chroma_amount,
+        )
 
 
 class Blur(BaseNode):
@@ -687,29 +551,12 @@ class Blur(BaseNode):
     )
 
     async def process(self, context: ProcessingContext) -> VideoRef:
-        import ffmpeg
-
         if self.video.is_empty():
             raise ValueError("Input video must be connected.")
 
-        video_file = await context.asset_to_io(self.video)
-
-        with tempfile.NamedTemporaryFile(suffix=".mp4") as temp:
-            temp.write(video_file.read())
-
-            input_stream = ffmpeg.input(temp.name)
-
-            # Apply boxblur filter
-            blurred = input_stream.filter("boxblur", luma_radius=self.strength)
-
-            with tempfile.NamedTemporaryFile(suffix=".mp4") as output_temp:
-                ffmpeg.output(blurred, output_temp.name).overwrite_output().run(
-                    quiet=False
-                )
-
-                # Read the blurred video and create a VideoRef
-                with open(output_temp.name, "rb") as f:
-                    return await context.video_from_io(f)
+        return await context.video_apply_filter(
+            self.video, "boxblur", luma_radius=self.strength
+        )
 
 
 class Saturation(BaseNode):
@@ -734,29 +581,12 @@ class Saturation(BaseNode):
     )
 
     async def process(self, context: ProcessingContext) -> VideoRef:
-        import ffmpeg
-
         if self.video.is_empty():
             raise ValueError("Input video must be connected.")
 
-        video_file = await context.asset_to_io(self.video)
-
-        with tempfile.NamedTemporaryFile(suffix=".mp4") as temp:
-            temp.write(video_file.read())
-
-            input_stream = ffmpeg.input(temp.name)
-
-            # Apply saturation adjustment
-            saturated = input_stream.filter("eq", saturation=self.saturation)
-
-            with tempfile.NamedTemporaryFile(suffix=".mp4") as output_temp:
-                ffmpeg.output(saturated, output_temp.name).overwrite_output().run(
-                    quiet=False
-                )
-
-                # Read the saturation-adjusted video and create a VideoRef
-                with open(output_temp.name, "rb") as f:
-                    return await context.video_from_io(f)
+        return await context.video_apply_filter(
+            self.video, "eq", saturation=self.saturation
+        )
 
 
 class AddSubtitles(BaseNode):
@@ -915,28 +745,10 @@ class Reverse(BaseNode):
     )
 
     async def process(self, context: ProcessingContext) -> VideoRef:
-        import ffmpeg
-
         if self.video.is_empty():
             raise ValueError("Input video must be connected.")
 
-        video_file = await context.asset_to_io(self.video)
-
-        with tempfile.NamedTemporaryFile(suffix=".mp4") as temp:
-            temp.write(video_file.read())
-
-            input_stream = ffmpeg.input(temp.name)
-
-            reversed_video = input_stream.filter("reverse")
-
-            with tempfile.NamedTemporaryFile(suffix=".mp4") as output_temp:
-                ffmpeg.output(reversed_video, output_temp.name).overwrite_output().run(
-                    quiet=False
-                )
-
-                # Read the reversed video and create a VideoRef
-                with open(output_temp.name, "rb") as f:
-                    return await context.video_from_io(f)
+        return await context.video_apply_filter(self.video, "reverse")
 
 
 class Transition(BaseNode):
@@ -1160,34 +972,16 @@ class ChromaKey(BaseNode):
     )
 
     async def process(self, context: ProcessingContext) -> VideoRef:
-        import ffmpeg
-
         if self.video.is_empty():
             raise ValueError("Input video must be connected.")
 
-        video_file = await context.asset_to_io(self.video)
-
-        with tempfile.NamedTemporaryFile(suffix=".mp4") as temp:
-            temp.write(video_file.read())
-
-            input_stream = ffmpeg.input(temp.name)
-
-            # Apply chroma key filter
-            keyed = input_stream.filter(
-                "chromakey",
-                color=self.key_color,
-                similarity=self.similarity,
-                blend=self.blend,
-            )
-
-            with tempfile.NamedTemporaryFile(suffix=".mp4") as output_temp:
-                ffmpeg.output(keyed, output_temp.name).overwrite_output().run(
-                    quiet=False
-                )
-
-                # Read the chroma keyed video and create a VideoRef
-                with open(output_temp.name, "rb") as f:
-                    return await context.video_from_io(f)
+        return await context.video_apply_filter(
+            self.video,
+            "chromakey",
+            color=self.key_color,
+            similarity=self.similarity,
+            blend=self.blend,
+        )
 
 
 import os
@@ -75,6 +75,7 @@ class HuggingfaceNode(BaseNode):
 
 def progress_callback(node_id: str, total_steps: int, context: ProcessingContext):
     def callback(step: int, timestep: int, latents: torch.FloatTensor) -> None:
+        context.check_cancelled()
         context.post_message(
             NodeProgress(
                 node_id=node_id,
@@ -7,6 +7,7 @@ from nodetool.providers.replicate.cost_calculation import (
     calculate_llm_cost,
 )
 from nodetool.common.environment import Environment
+from nodetool.common.job_poller import JobPoller
 from nodetool.providers.replicate.replicate_node import (
     REPLICATE_MODELS,
     log,
@@ -35,6 +36,9 @@ This module is used to automate the process of creating Python classes that repr
 making it easier to interact with these models in a type-safe manner within the nodetool framework.
 """
 
+# Seconds a prediction may take before waiting for it fails.
+PREDICTION_TIMEOUT = 1800
+
 REPLICATE_STATUS_MAP = {
     "starting": "starting",
     "succeeded": "completed",
@@ -91,29 +95,49 @@ async def run_replicate(
     else:
         current_status = "starting"
 
-    for i in range(1800):
-        replicate_pred = replicate.predictions.get(replicate_pred.id)
+    prediction_id = replicate_pred.id
+    updates: asyncio.Queue = asyncio.Queue()
+    waiter = asyncio.create_task(
+        JobPoller.get_default().wait(
+            "replicate",
+            prediction_id,
+            poll=lambda: replicate.predictions.async_get(prediction_id),
+            is_done=lambda p: p.status in ("succeeded", "failed", "canceled"),
+            timeout=PREDICTION_TIMEOUT,
+            on_update=updates.put_nowait,
+        )
+    )
+    # Wakes up the loop below if waiting fails, e.g. on timeout.
+    waiter.add_done_callback(lambda _: updates.put_nowait(None))
 
-        if current_status == "booting" and replicate_pred.status == "starting":
-            prediction.status = "booting"
+    try:
+        while True:
+            update = await updates.get()
+            if update is None:
+                replicate_pred = await waiter
+                break
+            replicate_pred = update
 
-        elif replicate_pred.status != current_status:
-            current_status = replicate_pred.status
-            prediction.status = REPLICATE_STATUS_MAP[replicate_pred.status]
+            if current_status == "booting" and replicate_pred.status == "starting":
+                prediction.status = "booting"
 
-        prediction.logs = replicate_pred.logs
-        prediction.error = replicate_pred.error
-        prediction.duration = (datetime.now() - started_at).total_seconds()
+            elif replicate_pred.status != current_status:
+                current_status = replicate_pred.status
+                prediction.status = REPLICATE_STATUS_MAP[replicate_pred.status]
 
-        yield prediction
+            prediction.logs = replicate_pred.logs
+            prediction.error = replicate_pred.error
+            prediction.duration = (datetime.now() - started_at).total_seconds()
 
-        if replicate_pred.status in ("failed", "canceled"):
-            raise ValueError(replicate_pred.error or "Prediction failed")
+            yield prediction
 
-        if replicate_pred.status in ("succeeded", "failed", "canceled"):
-            break
+            if replicate_pred.status in ("succeeded", "failed", "canceled"):
+                break
+    finally:
+        waiter.cancel()
 
-        await asyncio.sleep(1)
+    if replicate_pred.status in ("failed", "canceled"):
+        raise ValueError(replicate_pred.error or "Prediction failed")
 
     assert replicate_pred.metrics, "Prediction metrics not found"
 
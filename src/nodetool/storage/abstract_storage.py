@@ -21,10 +21,21 @@ class AbstractStorage(ABC):
     async def get_mtime(self, key: str) -> datetime:
         pass
 
+    @abstractmethod
+    async def get_size(self, key: str) -> int:
+        pass
+
     @abstractmethod
     def download_stream(self, key: str) -> AsyncIterator[bytes]:
         pass
 
+    @abstractmethod
+    def download_range(self, key: str, start: int, end: int) -> AsyncIterator[bytes]:
+        """
+        Streams the bytes from start to end of the object, both inclusive.
+        """
+        pass
+
     @abstractmethod
     async def download(self, key: str, stream: IO):
         pass
@@ -0,0 +1,235 @@
+import hashlib
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from .abstract_node_cache import AbstractNodeCache
+
+log = logging.getLogger(__name__)
+
+
+class DiskNodeCache(AbstractNodeCache):
+    """
+    A bounded node cache with an in-memory LRU tier that spills to local disk.
+
+    Values are kept in memory until the memory budget is exceeded. The least
+    recently used entries are then pickled and moved to the disk tier, which
+    stores content-addressed blob files next to an SQLite index. When the disk
+    budget is exceeded, the least recently used blobs are deleted.
+
+    Sizes are measured as the length of the pickled value.
+
+    Attributes:
+        path (Path): Directory holding the SQLite index and the blob files.
+        max_memory_bytes (int): Byte budget of the in-memory tier.
+        max_disk_bytes (int): Byte budget of the disk tier.
+        hits (int): Number of lookups answered from memory or disk.
+        misses (int): Number of lookups that found no valid entry.
+        evictions (int): Number of entries moved out of memory or deleted from disk
+            because a budget was exceeded.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_memory_bytes: int = 1024 * 1024 * 1024,
+        max_disk_bytes: int = 10 * 1024 * 1024 * 1024,
+    ):
+        self.path = Path(path)
+        self.blob_path = self.path / "blobs"
+        self.blob_path.mkdir(parents=True, exist_ok=True)
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+
+        # key -> (value, size, expires_at)
+        self.memory: OrderedDict[str, tuple[Any, int, float | None]] = OrderedDict()
+        self.memory_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.lock = threading.RLock()
+        self.db = sqlite3.connect(
+            self.path / "index.sqlite3", check_same_thread=False, isolation_level=None
+        )
+        self.db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                digest TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self.db.execute(
+            "CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)"
+        )
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns hit, miss and eviction counters together with the current tier sizes.
+        """
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "memory_entries": len(self.memory),
+                "memory_bytes": self.memory_bytes,
+                "disk_entries": self._disk_count(),
+                "disk_bytes": self._disk_bytes(),
+            }
+
+    def get(self, key: str) -> Any:
+        now = time.time()
+        with self.lock:
+            if key in self.memory:
+                value, size, expires_at = self.memory[key]
+                if expires_at is None or now < expires_at:
+                    self.memory.move_to_end(key)
+                    self.hits += 1
+                    return value
+                self._remove_from_memory(key)
+
+            row = self.db.execute(
+                "SELECT digest, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            digest, expires_at = row
+            if expires_at is not None and now >= expires_at:
+                self._remove_from_disk(key, digest)
+                self.misses += 1
+                return None
+
+            try:
+                data = self._blob_file(digest).read_bytes()
+                value = pickle.loads(data)
+            except Exception as e:
+                log.warning(f"Dropping unreadable node cache entry {key}: {e}")
+                self._remove_from_disk(key, digest)
+                self.misses += 1
+                return None
+
+            # Promote the entry back into the memory tier.
+            self._remove_from_disk(key, digest)
+            self._add_to_memory(key, value, len(data), expires_at)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: int = 3600):
+        try:
+            size = len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception as e:
+            log.warning(f"Value for node cache key {key} is not picklable: {e}")
+            return
+
+        expires_at = time.time() + ttl if ttl else None
+
+        with self.lock:
+            if key in self.memory:
+                self._remove_from_memory(key)
+            row = self.db.execute(
+                "SELECT digest FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self._remove_from_disk(key, row[0])
+            self._add_to_memory(key, value, size, expires_at)
+
+    def clear(self):
+        with self.lock:
+            self.memory.clear()
+            self.memory_bytes = 0
+            digests = [row[0] for row in self.db.execute("SELECT digest FROM entries")]
+            self.db.execute("DELETE FROM entries")
+            for digest in set(digests):
+                self._blob_file(digest).unlink(missing_ok=True)
+
+    def close(self):
+        """Close the SQLite index."""
+        with self.lock:
+            self.db.close()
+
+    def _blob_file(self, digest: str) -> Path:
+        return self.blob_path / digest[:2] / digest
+
+    def _add_to_memory(self, key: str, value: Any, size: int, expires_at):
+        self.memory[key] = (value, size, expires_at)
+        self.memory_bytes += size
+        while self.memory_bytes > self.max_memory_bytes and self.memory:
+            evicted_key, (evicted, evicted_size, evicted_expires_at) = (
+                self.memory.popitem(last=False)
+            )
+            self.memory_bytes -= evicted_size
+            self.evictions += 1
+            self._spill(evicted_key, evicted, evicted_expires_at)
+
+    def _remove_from_memory(self, key: str):
+        _, size, _ = self.memory.pop(key)
+        self.memory_bytes -= size
+
+    def _spill(self, key: str, value: Any, expires_at: float | None):
+        if expires_at is not None and time.time() >= expires_at:
+            return
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_disk_bytes:
+            return
+
+        digest = hashlib.blake2b(data, digest_size=20).hexdigest()
+        blob_file = self._blob_file(digest)
+        if not blob_file.exists():
+            blob_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = blob_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, blob_file)
+
+        self.db.execute(
+            "INSERT OR REPLACE INTO entries (key, digest, size, expires_at, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (key, digest, len(data), expires_at, time.time()),
+        )
+        self._evict_disk()
+
+    def _remove_from_disk(self, key: str, digest: str):
+        self.db.execute("DELETE FROM entries WHERE key = ?", (key,))
+        referenced = self.db.execute(
+            "SELECT 1 FROM entries WHERE digest = ? LIMIT 1", (digest,)
+        ).fetchone()
+        if referenced is None:
+            self._blob_file(digest).unlink(missing_ok=True)
+
+    def _evict_disk(self):
+        now = time.time()
+        for key, digest in self.db.execute(
+            "SELECT key, digest FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (now,),
+        ).fetchall():
+            self._remove_from_disk(key, digest)
+
+        while self._disk_bytes() > self.max_disk_bytes:
+            row = self.db.execute(
+                "SELECT key, digest FROM entries ORDER BY accessed_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                break
+            self._remove_from_disk(*row)
+            self.evictions += 1
+
+    def _disk_bytes(self) -> int:
+        return self.db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[
+            0
+        ]
+
+    def _disk_count(self) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
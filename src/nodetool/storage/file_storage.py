@@ -37,11 +37,27 @@ class FileStorage(AbstractStorage):
         except FileNotFoundError:
             return None
 
+    async def get_size(self, key: str) -> int:
+        return os.path.getsize(os.path.join(self.base_path, key))
+
     async def download_stream(self, key: str) -> AsyncIterator[bytes]:
         with open(os.path.join(self.base_path, key), "rb") as f:
             while chunk := f.read(8192):
                 yield chunk
 
+    async def download_range(
+        self, key: str, start: int, end: int
+    ) -> AsyncIterator[bytes]:
+        async with aiofiles.open(os.path.join(self.base_path, key), "rb") as f:
+            await f.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = await f.read(min(remaining, 1024 * 1024))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
     async def download(self, key: str, stream: IO):
         async with aiofiles.open(os.path.join(self.base_path, key), "rb") as f:
             async for chunk in f:
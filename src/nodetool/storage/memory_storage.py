@@ -32,18 +32,31 @@ class MemoryStorage(AbstractStorage):
     async def get_mtime(self, key: str):
         return self.mtimes.get(key, datetime.now())
 
+    async def get_size(self, key: str) -> int:
+        if key in self.storage:
+            return len(self.storage[key])
+        else:
+            raise FileNotFoundError(f"File {key} not found")
+
     def download_stream(self, key: str) -> AsyncIterator[bytes]:
         if key in self.storage:
             return AsyncByteStream(self.storage[key])
         else:
             raise FileNotFoundError(f"File {key} not found")
 
+    def download_range(self, key: str, start: int, end: int) -> AsyncIterator[bytes]:
+        if key in self.storage:
+            return AsyncByteStream(self.storage[key][start : end + 1])
+        else:
+            raise FileNotFoundError(f"File {key} not found")
+
     def upload_stream(self, key: str, content: Iterator[bytes]) -> str:
         bytes_io = io.BytesIO()
         for chunk in content:
             bytes_io.write(chunk)
         bytes_io.seek(0)
         self.storage[key] = bytes_io.getvalue()
+        self.mtimes[key] = datetime.now()
         return self.generate_presigned_url("get_object", key)
 
     async def download(self, key: str, stream: io.BytesIO):
@@ -54,8 +67,10 @@ class MemoryStorage(AbstractStorage):
 
     async def upload(self, key: str, content: io.BytesIO) -> str:
         self.storage[key] = content.read()
+        self.mtimes[key] = datetime.now()
         return self.generate_presigned_url("get_object", key)
 
     async def delete(self, file_name: str):
         if file_name in self.storage:
             del self.storage[file_name]
+            self.mtimes.pop(file_name, None)
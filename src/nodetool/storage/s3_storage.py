@@ -1,41 +1,64 @@
 import asyncio
-from logging import Logger
-from typing import IO, Any, AsyncIterator
+from email.utils import parsedate_to_datetime
+from typing import IO, AsyncIterator
+from urllib.parse import quote
+from xml.etree import ElementTree
 
-import boto3
-from botocore.exceptions import ClientError
+import httpx
+from botocore.auth import S3SigV4Auth
+from botocore.awsrequest import AWSRequest
+from botocore.credentials import Credentials
 
 from .abstract_storage import AbstractStorage
-from nodetool.models.asset import Asset
+
+S3_NAMESPACE = "{http://s3.amazonaws.com/doc/2006-03-01/}"
+# S3 rejects multipart parts smaller than 5 MiB, except for the last part.
+MIN_PART_SIZE = 5 * 1024 * 1024
 
 
 class S3Storage(AbstractStorage):
     """
     This class, named `S3Storage`, is an implementation of the `AbstractStorage` class
     specifically designed to interact with Amazon S3 (Simple Storage Service) or
-    compatible storage systems using boto3 with asyncio for asynchronous operations.
+    compatible storage systems.
 
     The main purpose of this class is to provide methods for uploading, downloading,
     and deleting files (referred to as "objects" in S3 terminology) from an S3 bucket.
+
+    Requests are signed with botocore and sent with an async httpx client, so no
+    call blocks the event loop. Connections are pooled per event loop. Objects
+    larger than part_size are uploaded as parallel multipart uploads and
+    downloaded with parallel ranged GETs, with up to max_concurrency requests in
+    flight. Objects are addressed path-style, `{endpoint_url}/{bucket}/{key}`.
     """
 
     def __init__(
         self,
         bucket_name: str,
         endpoint_url: str,
-        client: Any,
+        access_key_id: str,
+        secret_access_key: str,
+        region_name: str = "us-east-1",
         domain: str | None = None,
+        part_size: int = 8 * 1024 * 1024,
+        max_concurrency: int = 8,
     ):
+        if part_size < MIN_PART_SIZE:
+            raise ValueError(f"part_size must be at least {MIN_PART_SIZE} bytes")
         self.bucket_name = bucket_name
-        self.endpoint_url = endpoint_url
+        self.endpoint_url = endpoint_url.rstrip("/")
+        self.region_name = region_name
         self.domain = domain
-        self.s3 = client
+        self.part_size = part_size
+        self.max_concurrency = max_concurrency
+        self.credentials = Credentials(access_key_id, secret_access_key)
+        self._clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
 
     def get_base_url(self):
         """
         Get the base URL for the S3 bucket.
         """
-        return f"https://{self.bucket_name}.s3.{self.s3.meta.region_name}.amazonaws.com"
+        return f"https://{self.bucket_name}.s3.{self.region_name}.amazonaws.com"
 
     def get_url(self, key: str):
         """
@@ -50,56 +73,228 @@ class S3Storage(AbstractStorage):
         """
         Check if an asset exists in S3.
         """
-        try:
-            await asyncio.to_thread(
-                self.s3.head_object, Bucket=self.bucket_name, Key=file_name
-            )
-            return True
-        except ClientError:
+        response = await self._request("HEAD", file_name, check=False)
+        if response.is_client_error:
             return False
+        response.raise_for_status()
+        return True
 
     async def get_mtime(self, key: str):
         """
         Get the last modified time of the file.
         """
-        response = await asyncio.to_thread(
-            self.s3.head_object, Bucket=self.bucket_name, Key=key
-        )
-        return response["LastModified"]
+        response = await self._request("HEAD", key)
+        return parsedate_to_datetime(response.headers["Last-Modified"])
+
+    async def get_size(self, key: str) -> int:
+        """
+        Get the size of the file in bytes.
+        """
+        response = await self._request("HEAD", key)
+        return int(response.headers["Content-Length"])
 
     async def download(self, key: str, stream: IO):
         """
         Downloads a blob from the bucket.
         """
-        response = await asyncio.to_thread(
-            self.s3.get_object, Bucket=self.bucket_name, Key=key
-        )
-        body = response["Body"]
-        for chunk in body.iter_chunks(chunk_size=8192):
+        async for chunk in self.download_stream(key):
             stream.write(chunk)
 
-    async def upload(self, key: str, content: IO):
+    async def download_stream(self, key: str) -> AsyncIterator[bytes]:
         """
-        Uploads a blob to the bucket.
+        Downloads a blob from the bucket as a stream.
+
+        Large objects are fetched as parallel ranged GETs. Parts are yielded in
+        order, and at most max_concurrency parts are fetched ahead.
         """
-        await asyncio.to_thread(self.s3.upload_fileobj, content, self.bucket_name, key)
-        return self.get_url(key)
+        size = await self.get_size(key)
 
-    async def download_stream(self, key: str) -> AsyncIterator[bytes]:
+        if size <= self.part_size:
+            async for chunk in self._stream("GET", key):
+                yield chunk
+            return
+
+        async def get_range(start: int) -> bytes:
+            end = min(start + self.part_size, size) - 1
+            response = await self._request(
+                "GET", key, headers={"Range": f"bytes={start}-{end}"}
+            )
+            return response.content
+
+        starts = iter(range(0, size, self.part_size))
+        pending: list[asyncio.Task[bytes]] = []
+        try:
+            for start in starts:
+                pending.append(asyncio.create_task(get_range(start)))
+                if len(pending) >= self.max_concurrency:
+                    break
+            while pending:
+                part = await pending.pop(0)
+                next_start = next(starts, None)
+                if next_start is not None:
+                    pending.append(asyncio.create_task(get_range(next_start)))
+                yield part
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def download_range(
+        self, key: str, start: int, end: int
+    ) -> AsyncIterator[bytes]:
         """
-        Downloads a blob from the bucket as a stream.
+        Streams a byte range of a blob with a single ranged GET.
         """
-        response = await asyncio.to_thread(
-            self.s3.get_object, Bucket=self.bucket_name, Key=key
-        )
-        body = response["Body"]
-        for chunk in body.iter_chunks(chunk_size=8192):
+        async for chunk in self._stream(
+            "GET", key, headers={"Range": f"bytes={start}-{end}"}
+        ):
             yield chunk
 
+    async def upload(self, key: str, content: IO):
+        """
+        Uploads a blob to the bucket.
+
+        Content larger than part_size is sent as a multipart upload with up to
+        max_concurrency parts in flight.
+        """
+        first = content.read(self.part_size)
+        if len(first) < self.part_size:
+            await self._request("PUT", key, content=first)
+            return self.get_url(key)
+
+        response = await self._request("POST", key, params={"uploads": ""})
+        upload_id = ElementTree.fromstring(response.content).findtext(
+            f"{S3_NAMESPACE}UploadId"
+        )
+        assert upload_id, "S3 did not return an upload id"
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        etags: dict[int, str] = {}
+
+        async def upload_part(number: int, data: bytes):
+            try:
+                response = await self._request(
+                    "PUT",
+                    key,
+                    params={"partNumber": str(number), "uploadId": upload_id},
+                    content=data,
+                )
+                etags[number] = response.headers["ETag"]
+            finally:
+                semaphore.release()
+
+        tasks: list[asyncio.Task] = []
+        try:
+            data, number = first, 1
+            while data:
+                # Bounds the parts held in memory to the parts in flight.
+                await semaphore.acquire()
+                tasks.append(asyncio.create_task(upload_part(number, data)))
+                data, number = content.read(self.part_size), number + 1
+            await asyncio.gather(*tasks)
+
+            parts = "".join(
+                f"<Part><PartNumber>{n}</PartNumber><ETag>{etags[n]}</ETag></Part>"
+                for n in sorted(etags)
+            )
+            await self._request(
+                "POST",
+                key,
+                params={"uploadId": upload_id},
+                content=f"<CompleteMultipartUpload>{parts}</CompleteMultipartUpload>".encode(),
+            )
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self._request(
+                "DELETE", key, params={"uploadId": upload_id}, check=False
+            )
+            raise
+        return self.get_url(key)
+
     async def delete(self, file_name: str):
         """
         Deletes a blob from the bucket.
         """
-        await asyncio.to_thread(
-            self.s3.delete_object, Bucket=self.bucket_name, Key=file_name
+        await self._request("DELETE", file_name)
+
+    async def close(self):
+        """
+        Closes the pooled connections of all event loops.
+        """
+        clients, self._clients = self._clients, {}
+        for loop, client in clients.items():
+            if loop is asyncio.get_running_loop():
+                await client.aclose()
+
+    def _client(self) -> httpx.AsyncClient:
+        # Pooled connections belong to the event loop that opened them.
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            for closed in [l for l in list(self._clients) if l.is_closed()]:
+                self._clients.pop(closed, None)
+            client = httpx.AsyncClient(
+                timeout=httpx.Timeout(60.0, connect=10.0),
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency * 2,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+            )
+            self._clients[loop] = client
+        return client
+
+    async def _signed_request(
+        self,
+        method: str,
+        key: str,
+        params: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+        content: bytes = b"",
+    ) -> AWSRequest:
+        url = f"{self.endpoint_url}/{self.bucket_name}/{quote(key, safe='/~')}"
+        request = AWSRequest(
+            method=method,
+            url=url,
+            params=params or {},
+            headers=headers or {},
+            data=content,
+        )
+        signer = S3SigV4Auth(self.credentials, "s3", self.region_name)
+        if len(content) > 1024 * 1024:
+            # Hashing large payloads would hold up the event loop.
+            await asyncio.to_thread(signer.add_auth, request)
+        else:
+            signer.add_auth(request)
+        return request.prepare()
+
+    async def _stream(
+        self, method: str, key: str, headers: dict[str, str] | None = None
+    ) -> AsyncIterator[bytes]:
+        request = await self._signed_request(method, key, headers=headers)
+        async with self._client().stream(
+            request.method, request.url, headers=dict(request.headers)
+        ) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                yield chunk
+
+    async def _request(
+        self,
+        method: str,
+        key: str,
+        params: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+        content: bytes = b"",
+        check: bool = True,
+    ) -> httpx.Response:
+        request = await self._signed_request(method, key, params, headers, content)
+        response = await self._client().request(
+            request.method,
+            request.url,
+            headers=dict(request.headers),
+            content=request.body or None,
         )
+        if check:
+            response.raise_for_status()
+        return response
@@ -18,6 +18,7 @@ class Asset(BaseModel):
     get_url: str | None
     thumb_url: str | None
     duration: float | None = None
+    media_status: str | None = None
 
     @property
     def file_extension(self) -> str:
@@ -47,7 +48,7 @@ class Asset(BaseModel):
         else:
             get_url = None
 
-        if asset.has_thumbnail:
+        if asset.has_thumbnail and asset.media_status in (None, "ready"):
             thumb_url = storage.get_url(asset.thumb_file_name)
         else:
             thumb_url = None
@@ -64,6 +65,7 @@ class Asset(BaseModel):
             get_url=get_url,
             thumb_url=thumb_url,
             duration=asset.duration,
+            media_status=asset.media_status,
         )
 
 
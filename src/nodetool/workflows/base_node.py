@@ -1,5 +1,7 @@
 from enum import EnumMeta
 import functools
+import hashlib
+import inspect
 import re
 import sys
 from types import UnionType
@@ -302,6 +304,29 @@ class BaseNode(BaseModel):
 
         return cls.get_namespace() + "." + class_name
 
+    @memoized_class_method
+    def get_version(cls) -> str:
+        """
+        Get a version identifier for the node implementation.
+
+        Derived from the source code of the class and its node base classes,
+        so that any change to a node's code produces a new version.
+        Used to invalidate cached results when a node changes.
+
+        Returns:
+            str: A short hex digest identifying the node implementation.
+        """
+        digest = hashlib.blake2b(digest_size=8)
+        for klass in cls.__mro__:
+            if klass is BaseNode or not issubclass(klass, BaseNode):
+                continue
+            try:
+                source = inspect.getsource(klass)
+            except (OSError, TypeError):
+                source = f"{klass.__module__}.{klass.__qualname__}"
+            digest.update(source.encode("utf-8"))
+        return digest.hexdigest()
+
     @classmethod
     def get_namespace(cls) -> str:
         """
@@ -509,9 +534,7 @@ class BaseNode(BaseModel):
                     del value_without_model["model"]
                     props[p] = value_without_model
                 elif isinstance(value, AssetRef):
-                    value_without_data = value.model_dump()
-                    del value_without_data["data"]
-                    props[p] = value_without_data
+                    props[p] = value.model_dump(exclude={"data"})
                 else:
                     props[p] = value
         update = NodeUpdate(
@@ -865,6 +888,13 @@ class OutputNode(BaseNode):
     def is_cacheable(cls):
         return False
 
+    async def convert_output(self, context: Any, output: Any) -> Any:
+        # Outputs leave the workflow, so encode in-memory assets here rather
+        # than synchronously during serialization.
+        if isinstance(output, AssetRef):
+            await output.encode_memory_async()
+        return await super().convert_output(context, output)
+
 
 class Comment(BaseNode):
     """
@@ -35,8 +35,14 @@ class Graph(BaseModel):
         nodes (list[BaseNode]): A list of nodes in the graph.
         edges (list[Edge]): A list of edges connecting the nodes.
 
+    Lookups by node id and edge direction go through indexes that are built once
+    and rebuilt lazily when `nodes` or `edges` are replaced or change in size.
+
     Methods:
         find_node: Locates a node by its ID.
+        with_nodes: Returns a graph sharing the edge indexes with other node instances.
+        incoming_edges: Returns the edges ending at a node.
+        outgoing_edges: Returns the edges starting at a node.
         from_dict: Creates a Graph instance from a dictionary representation.
         inputs: Returns a list of input nodes.
         outputs: Returns a list of output nodes.
@@ -52,14 +58,81 @@ class Graph(BaseModel):
     nodes: Sequence[BaseNode] = Field(default_factory=list)
     edges: Sequence[Edge] = Field(default_factory=list)
 
+    _index_key: tuple[int, int, int, int] | None = None
+    _nodes_by_id: dict[str, BaseNode] = {}
+    _incoming: dict[str, list[Edge]] = {}
+    _outgoing: dict[str, list[Edge]] = {}
+
+    def model_post_init(self, __context: Any) -> None:
+        self._build_indexes()
+
+    def _build_indexes(self):
+        """
+        Build the id -> node, incoming edge and outgoing edge indexes.
+        """
+        nodes_by_id: dict[str, BaseNode] = {}
+        for node in self.nodes:
+            nodes_by_id.setdefault(node._id, node)
+
+        incoming: dict[str, list[Edge]] = {}
+        outgoing: dict[str, list[Edge]] = {}
+        for edge in self.edges:
+            incoming.setdefault(edge.target, []).append(edge)
+            outgoing.setdefault(edge.source, []).append(edge)
+
+        self._nodes_by_id = nodes_by_id
+        self._incoming = incoming
+        self._outgoing = outgoing
+        self._index_key = self._current_index_key()
+
+    def _current_index_key(self) -> tuple[int, int, int, int]:
+        return (id(self.nodes), len(self.nodes), id(self.edges), len(self.edges))
+
+    def _ensure_indexes(self):
+        if self._index_key != self._current_index_key():
+            self._build_indexes()
+
+    def invalidate_indexes(self):
+        """
+        Force a rebuild of the lookup indexes.
+        Only needed after nodes or edges were modified in place without
+        changing the number of elements.
+        """
+        self._index_key = None
+
     def find_node(self, node_id: str) -> BaseNode | None:
         """
         Find a node by its id.
         """
-        for node in self.nodes:
-            if node._id == node_id:
-                return node
-        return None
+        self._ensure_indexes()
+        return self._nodes_by_id.get(node_id)
+
+    def incoming_edges(self, node_id: str) -> List[Edge]:
+        """
+        Returns the edges whose target is the given node, in graph order.
+        """
+        self._ensure_indexes()
+        return self._incoming.get(node_id, [])
+
+    def outgoing_edges(self, node_id: str) -> List[Edge]:
+        """
+        Returns the edges whose source is the given node, in graph order.
+        """
+        self._ensure_indexes()
+        return self._outgoing.get(node_id, [])
+
+    def with_nodes(self, nodes: Sequence[BaseNode]) -> "Graph":
+        """
+        Returns a graph with the same edges and edge indexes but other node
+        instances, e.g. copies of the nodes for one iteration of a loop.
+        """
+        self._ensure_indexes()
+        graph = self.model_copy(update={"nodes": nodes})
+        graph._nodes_by_id = {}
+        for node in nodes:
+            graph._nodes_by_id.setdefault(node._id, node)
+        graph._index_key = graph._current_index_key()
+        return graph
 
     @classmethod
     def from_dict(cls, graph: dict[str, Any]):
@@ -115,7 +188,7 @@ class Graph(BaseModel):
 
         This method implements a modified version of Kahn's algorithm for topological sorting.
         It sorts the nodes of the graph into levels, where each level contains nodes
-        that can be processed in parallel.
+        that can be processed in parallel. Runs in O(V + E) using the outgoing edge index.
 
         Args:
             parent_id (str | None, optional): The ID of the parent node to filter results. Defaults to None.
@@ -143,17 +216,15 @@ class Graph(BaseModel):
         ]
         node_ids = {node.id for node in nodes}
 
-        # Filter edges to only include those connected to the filtered nodes
-        edges = [
-            edge
-            for edge in self.edges
-            if edge.source in node_ids and edge.target in node_ids
-        ]
-
         indegree: dict[str, int] = {node.id: 0 for node in nodes}
+        successors: dict[str, list[str]] = {node.id: [] for node in nodes}
 
-        for edge in edges:
-            indegree[edge.target] += 1
+        # Only edges between filtered nodes take part in the sort
+        for node_id in indegree:
+            for edge in self.outgoing_edges(node_id):
+                if edge.target in node_ids:
+                    indegree[edge.target] += 1
+                    successors[node_id].append(edge.target)
 
         queue = deque(node_id for node_id, degree in indegree.items() if degree == 0)
 
@@ -163,12 +234,10 @@ class Graph(BaseModel):
             for _ in range(len(queue)):
                 n = queue.popleft()
                 level_nodes.append(n)
-                for edge in edges[:]:  # Iterate over a copy of the list
-                    if edge.source == n:
-                        edges.remove(edge)
-                        indegree[edge.target] -= 1
-                        if indegree[edge.target] == 0:
-                            queue.append(edge.target)
+                for target in successors[n]:
+                    indegree[target] -= 1
+                    if indegree[target] == 0:
+                        queue.append(target)
 
             if level_nodes:
                 sorted_nodes.append(level_nodes)
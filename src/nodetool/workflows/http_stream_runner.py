@@ -4,6 +4,7 @@ import time
 import uuid
 from typing import Any, AsyncGenerator
 from nodetool.common.environment import Environment
+from nodetool.metadata.types import tensors_to_json
 from nodetool.workflows.processing_context import ProcessingContext
 from nodetool.workflows.run_workflow import run_workflow
 from nodetool.workflows.run_job_request import RunJobRequest
@@ -77,7 +78,7 @@ class HTTPStreamRunner:
                     if req.explicit_types and "result" in msg_dict:
                         msg_dict["result"] = wrap_primitive_types(msg_dict["result"])
 
-                    yield json.dumps(msg_dict) + "\n"
+                    yield json.dumps(tensors_to_json(msg_dict)) + "\n"
                 except Exception as e:
                     log.exception(f"Error processing message in job {self.job_id}: {e}")
                     yield json.dumps({"error": str(e)}) + "\n"
@@ -1,8 +1,12 @@
+import asyncio
+import importlib
+import logging
 import multiprocessing
-from queue import Empty
+import threading
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
 import msgpack
 from typing import Any, AsyncGenerator
-import asyncio
 
 from nodetool.api.types.wrap_primitive_types import wrap_primitive_types
 from nodetool.common.environment import Environment
@@ -12,79 +16,305 @@ from nodetool.workflows.processing_context import ProcessingContext
 from nodetool.workflows.types import Error, ProcessingMessage
 from nodetool.types.job import JobUpdate
 
+log = logging.getLogger(__name__)
 
-class MultiprocessRunner:
-    def __init__(self, req: RunJobRequest):
-        self.req = req
-        self.queue = multiprocessing.Queue()
-        self.process = multiprocessing.Process(
-            target=self._run_workflow, args=(req, self.queue)
-        )
+# Node packages imported by every worker before it accepts jobs.
+DEFAULT_PRELOAD = [
+    "nodetool.nodes.anthropic",
+    "nodetool.nodes.comfy",
+    "nodetool.nodes.huggingface",
+    "nodetool.nodes.nodetool",
+    "nodetool.nodes.openai",
+    "nodetool.nodes.replicate",
+    "nodetool.nodes.ollama",
+    "nodetool.nodes.luma",
+    "nodetool.nodes.kling",
+]
 
-    def start_workflow(self):
-        self.process.start()
 
-    @staticmethod
-    def _run_workflow(
-        req: RunJobRequest,
-        queue: multiprocessing.Queue,
+class PipeMessageQueue:
+    """
+    Message queue for a ProcessingContext that sends messages through a pipe.
+    """
+
+    def __init__(self, conn: Connection):
+        self.conn = conn
+        self.lock = threading.Lock()
+
+    def put_nowait(self, message: Any):
+        with self.lock:
+            self.conn.send(message)
+
+    def put(self, message: Any):
+        self.put_nowait(message)
+
+    def empty(self) -> bool:
+        return True
+
+
+async def _run_job(req: RunJobRequest, message_queue: Any):
+    runner = WorkflowRunner(job_id=req.workflow_id)
+    context = ProcessingContext(
+        user_id=req.user_id,
+        auth_token=req.auth_token,
+        workflow_id=req.workflow_id,
+        message_queue=message_queue,
+    )
+    try:
+        if Environment.is_production():
+            res = await context.api_client.post(
+                "api/auth/verify", json={"token": req.auth_token}
+            )
+            if res.json()["valid"] == False:
+                raise ValueError("Invalid auth token")
+
+        if req.graph is None:
+            workflow = await context.get_workflow(req.workflow_id)
+            req.graph = workflow.graph
+
+        await runner.run(req, context)
+    except Exception as e:
+        message_queue.put(Error(error=str(e)))
+
+
+def _worker_main(conn: Connection, preload: list[str]):
+    """
+    Entry point of a pool worker. Imports the node packages once, then runs
+    jobs received over the pipe until it gets None or the pipe is closed.
+    After each job, None is sent back to mark the end of its messages.
+    """
+    for module in preload:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            log.warning(f"Worker could not import {module}: {e}")
+
+    message_queue = PipeMessageQueue(conn)
+    while True:
+        try:
+            req = conn.recv()
+        except EOFError:
+            break
+        if req is None:
+            break
+        try:
+            asyncio.run(_run_job(req, message_queue))
+        finally:
+            message_queue.put_nowait(None)
+
+
+class _Worker:
+    def __init__(self, process: BaseProcess, conn: Connection):
+        self.process = process
+        self.conn = conn
+        self.jobs = 0
+
+
+class WorkerPool:
+    """
+    A pool of long-lived worker processes that run workflow jobs.
+
+    Workers are started ahead of time and keep their imports and model
+    state between jobs. Each job is sent to an idle worker over a pipe, and
+    its messages are streamed back through the same pipe. The event loop
+    watches the pipe, so messages are delivered as soon as they arrive.
+
+    A worker is replaced after max_jobs_per_worker jobs. It is also replaced
+    when it exits unexpectedly, which fails only the job it was running, or
+    when its job is abandoned before it finished.
+
+    Attributes:
+        size (int): Number of worker processes.
+        max_jobs_per_worker (int): Jobs a worker runs before it is recycled.
+        preload (list[str]): Modules imported by each worker at startup.
+        workers (list): The live workers.
+    """
+
+    _default: "WorkerPool | None" = None
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_jobs_per_worker: int = 50,
+        preload: list[str] | None = None,
     ):
-        async def run():
-            runner = WorkflowRunner(job_id=req.workflow_id)
-            context = ProcessingContext(
-                user_id=req.user_id,
-                auth_token=req.auth_token,
-                workflow_id=req.workflow_id,
-                message_queue=queue,
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        if max_jobs_per_worker < 1:
+            raise ValueError("max_jobs_per_worker must be at least 1")
+        self.size = size
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.preload = DEFAULT_PRELOAD if preload is None else preload
+        # Workers are forked from a server process that has already imported
+        # the runner and the preloaded packages, so new workers start warm.
+        self.mp_context = multiprocessing.get_context("forkserver")
+        self.mp_context.set_forkserver_preload([__name__, *self.preload])
+        self.workers: list[_Worker] = []
+        self.idle: asyncio.Queue[_Worker] | None = None
+
+    @classmethod
+    def get_default(cls) -> "WorkerPool":
+        """
+        Returns the shared pool, configured by WORKER_POOL_SIZE and
+        WORKER_MAX_JOBS.
+        """
+        if cls._default is None:
+            cls._default = cls(
+                size=int(Environment.get("WORKER_POOL_SIZE")),
+                max_jobs_per_worker=int(Environment.get("WORKER_MAX_JOBS")),
             )
-            if Environment.is_production():
-                res = await context.api_client.post(
-                    "api/auth/verify", json={"token": req.auth_token}
-                )
-                if res.json()["valid"] == False:
-                    raise ValueError("Invalid auth token")
+        return cls._default
 
-            if req.graph is None:
-                workflow = await context.get_workflow(req.workflow_id)
-                req.graph = workflow.graph
+    def start(self):
+        """
+        Starts the worker processes. Must be called from the event loop that
+        runs the jobs. Called by run if the pool was not started yet.
+        """
+        if self.idle is not None:
+            return
+        self.idle = asyncio.Queue()
+        for _ in range(self.size):
+            self.idle.put_nowait(self._spawn())
 
-            try:
-                await runner.run(req, context)
-            except Exception as e:
-                queue.put(Error(error=str(e)))
+    async def run(self, req: RunJobRequest) -> AsyncGenerator[ProcessingMessage, None]:
+        """
+        Runs a job on an idle worker and yields its messages.
+        """
+        self.start()
+        assert self.idle is not None
 
-        asyncio.run(run())
+        worker = await self.idle.get()
+        loop = asyncio.get_running_loop()
+        messages: asyncio.Queue[Any] = asyncio.Queue()
+        exited = object()
+        fd = worker.conn.fileno()
 
-    async def get_messages(self) -> AsyncGenerator[bytes, None]:
-        while True:
+        def on_readable():
             try:
-                msg = self.queue.get(timeout=0.1)
+                messages.put_nowait(worker.conn.recv())
+            except (EOFError, OSError):
+                loop.remove_reader(fd)
+                messages.put_nowait(exited)
+
+        loop.add_reader(fd, on_readable)
+        worker.jobs += 1
+        finished = False
+        try:
+            worker.conn.send(req)
+            while True:
+                msg = await messages.get()
                 if msg is None:
+                    finished = True
                     break
+                if msg is exited:
+                    await loop.run_in_executor(None, worker.process.join)
+                    yield Error(
+                        error=f"Worker process exited unexpectedly ({worker.process.exitcode})"
+                    )
+                    break
+                yield msg
+        finally:
+            loop.remove_reader(fd)
+            if (
+                self.idle is not None
+                and finished
+                and worker.jobs < self.max_jobs_per_worker
+            ):
+                self.idle.put_nowait(worker)
+            else:
+                self._retire(worker, graceful=finished)
+                if self.idle is not None:
+                    self.idle.put_nowait(self._spawn())
+
+    def shutdown(self):
+        """
+        Stops all workers. The pool can be started again afterwards.
+        """
+        for worker in list(self.workers):
+            self._retire(worker, graceful=True)
+        for worker in list(self.workers):
+            worker.process.join(timeout=5)
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join()
+        self.workers.clear()
+        self.idle = None
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self.mp_context.Pipe()
+        process = self.mp_context.Process(
+            target=_worker_main, args=(child_conn, self.preload), daemon=True
+        )
+        process.start()
+        child_conn.close()
+        worker = _Worker(process, parent_conn)
+        self.workers.append(worker)
+        return worker
 
-                msg_dict = msg.model_dump()
+    def _retire(self, worker: _Worker, graceful: bool):
+        if worker in self.workers:
+            self.workers.remove(worker)
+        if graceful and worker.process.is_alive():
+            try:
+                worker.conn.send(None)
+            except OSError:
+                worker.process.terminate()
+        else:
+            worker.process.terminate()
+        worker.conn.close()
+        # Reap the process without blocking the event loop.
+        threading.Thread(target=worker.process.join, daemon=True).start()
 
-                # Only wrap the result if explicit_types is True
-                if self.req.explicit_types and "result" in msg_dict:
-                    msg_dict["result"] = wrap_primitive_types(msg_dict["result"])
 
-                yield msgpack.packb(msg_dict, use_bin_type=True)  # type: ignore
-            except Empty:
-                await asyncio.sleep(0.1)
+class MultiprocessRunner:
+    """
+    Runs a workflow job in a worker process of a WorkerPool and streams its
+    messages as msgpack.
+    """
+
+    def __init__(self, req: RunJobRequest, pool: WorkerPool | None = None):
+        self.req = req
+        self.pool = pool if pool is not None else WorkerPool.get_default()
+        self.messages: asyncio.Queue[ProcessingMessage | None] = asyncio.Queue()
+        self.task: asyncio.Task | None = None
+
+    def start_workflow(self):
+        self.task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        try:
+            async for msg in self.pool.run(self.req):
+                self.messages.put_nowait(msg)
+        finally:
+            self.messages.put_nowait(None)
+
+    async def get_messages(self) -> AsyncGenerator[bytes, None]:
+        while True:
+            msg = await self.messages.get()
+            if msg is None:
+                break
+
+            msg_dict = msg.model_dump()
+
+            # Only wrap the result if explicit_types is True
+            if self.req.explicit_types and "result" in msg_dict:
+                msg_dict["result"] = wrap_primitive_types(msg_dict["result"])
+
+            yield msgpack.packb(msg_dict, use_bin_type=True)  # type: ignore
 
     def cancel_workflow(self):
-        if self.process and self.process.is_alive():
-            self.process.terminate()
-            self.process.join()
+        if self.task and not self.task.done():
+            # Abandoning the job replaces its worker.
+            self.task.cancel()
 
         if self.req:
-            self.queue.put(JobUpdate(job_id=self.req.workflow_id, status="cancelled"))
+            self.messages.put_nowait(
+                JobUpdate(job_id=self.req.workflow_id, status="cancelled")
+            )
 
     def is_running(self):
-        return self.process and self.process.is_alive()
+        return self.task is not None and not self.task.done()
 
     def cleanup(self):
-        if self.process:
-            self.process.terminate()
-            self.process.join()
-        self.queue.close()
+        if self.task and not self.task.done():
+            self.task.cancel()
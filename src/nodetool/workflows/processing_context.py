@@ -1,9 +1,13 @@
 import asyncio
 from enum import Enum
+import functools
+import hashlib
 import io
 import json
 import multiprocessing
+import os
 import queue
+import threading
 import urllib.parse
 import uuid
 import httpx
@@ -12,8 +16,11 @@ import base64
 import PIL.Image
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pydub import AudioSegment
 import torch
+from pydantic import BaseModel
 from starlette.datastructures import URL
 
 from huggingface_hub.file_download import try_to_load_from_cache
@@ -54,7 +61,10 @@ from nodetool.metadata.types import (
     VideoRef,
     dtype_name,
 )
+from nodetool.common.content_types import EXTENSION_TO_CONTENT_TYPE
 from nodetool.common.environment import Environment
+from nodetool.model_manager import ModelManager
+from nodetool.storage.file_storage import FileStorage
 from nodetool.workflows.base_node import BaseNode
 from nodetool.workflows.property import Property
 from nodetool.metadata.types import ImageRef
@@ -62,17 +72,101 @@ from nodetool.common.environment import Environment
 
 
 from io import BytesIO
-from typing import IO, Any, Literal, Union
+from typing import IO, Any, Callable, Literal, TypeVar, Union
 from pickle import dumps, loads
 
 
 log = Environment.get_logger()
 
+T = TypeVar("T")
+
 HTTP_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/1"
 }
 
 
+ARROW_MAGIC = b"ARROW1"
+PARQUET_MAGIC = b"PAR1"
+
+
+def read_dataframe(data: bytes) -> pd.DataFrame:
+    """
+    Reads a stored dataframe. Supports Arrow IPC files, Parquet files,
+    pickled frames of older assets and CSV.
+    """
+    if data.startswith(ARROW_MAGIC):
+        return pa.ipc.open_file(pa.BufferReader(data)).read_all().to_pandas()
+    if data.startswith(PARQUET_MAGIC):
+        return pq.read_table(pa.BufferReader(data)).to_pandas()
+    if data.startswith(b"\x80"):
+        df = loads(data)
+        assert isinstance(df, pd.DataFrame), "Is not a dataframe"
+        return df
+    return pd.read_csv(BytesIO(data))
+
+
+def _bytes_digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def cache_key_value(value: Any) -> Any:
+    """
+    Convert a node property value into a JSON compatible structure for cache keys.
+
+    Inline binary payloads (asset data, bytes, arrays, tensors) are replaced
+    by a digest, so large values do not end up in the key material.
+    """
+    if isinstance(value, AssetRef):
+        data = value.data
+        if value.has_memory():
+            # The in-memory value is authoritative, `data` may only hold a preview.
+            data_digest = {"memory": _bytes_digest(value.memory_key())}
+        elif isinstance(data, bytes):
+            data_digest = _bytes_digest(data)
+        elif isinstance(data, list):
+            data_digest = [
+                _bytes_digest(d) if isinstance(d, bytes) else cache_key_value(d)
+                for d in data
+            ]
+        else:
+            data_digest = cache_key_value(data)
+        fields = {
+            name: getattr(value, name)
+            for name in value.model_fields
+            if name not in ("uri", "asset_id", "data")
+        }
+        return {
+            "type": value.type,
+            "uri": value.uri,
+            "asset_id": value.asset_id,
+            "data": data_digest,
+            "fields": cache_key_value(fields),
+        }
+    elif isinstance(value, BaseModel):
+        return cache_key_value(
+            {name: getattr(value, name) for name in value.model_fields}
+        )
+    elif isinstance(value, dict):
+        return {str(k): cache_key_value(v) for k, v in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return [cache_key_value(v) for v in value]
+    elif isinstance(value, (bytes, bytearray)):
+        return {"bytes": _bytes_digest(bytes(value))}
+    elif isinstance(value, Enum):
+        return cache_key_value(value.value)
+    elif isinstance(value, torch.Tensor):
+        value = value.detach().cpu().numpy()
+    if isinstance(value, np.ndarray):
+        return {
+            "ndarray": _bytes_digest(np.ascontiguousarray(value).tobytes()),
+            "dtype": str(value.dtype),
+            "shape": list(value.shape),
+        }
+    elif isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
 class ProcessingContext:
     """
     The processing context is the workflow's interface to the outside world.
@@ -116,6 +210,7 @@ class ProcessingContext:
         http_client: httpx.AsyncClient | None = None,
         device: str | None = None,
         endpoint_url: URL | None = None,
+        cancelled: threading.Event | None = None,
     ):
         self.user_id = user_id
         self.auth_token = auth_token
@@ -127,6 +222,8 @@ class ProcessingContext:
         self.device = device
         self.variables: dict[str, Any] = variables if variables else {}
         self.endpoint_url = endpoint_url
+        self.cancelled = cancelled if cancelled else threading.Event()
+        self.loop: asyncio.AbstractEventLoop | None = None
         self.http_client = (
             httpx.AsyncClient(follow_redirects=True, timeout=600, verify=False)
             if http_client is None
@@ -145,6 +242,7 @@ class ProcessingContext:
             device=self.device,
             variables=self.variables,
             http_client=self.http_client,
+            cancelled=self.cancelled,
         )
 
     @property
@@ -194,11 +292,62 @@ class ProcessingContext:
         """
         Posts a message to the message queue.
 
+        Can be called from model executor threads. Messages for an asyncio
+        queue are then handed over to the event loop of the context.
+
         Args:
             message (ProcessingMessage): The message to be posted.
         """
+        if isinstance(self.message_queue, asyncio.Queue) and self.loop is not None:
+            try:
+                running_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                running_loop = None
+            if running_loop is not self.loop:
+                self.loop.call_soon_threadsafe(self.message_queue.put_nowait, message)
+                return
         self.message_queue.put_nowait(message)
 
+    def cancel(self):
+        """
+        Marks the context as cancelled. Model code running in the model
+        executor stops at its next cancellation check.
+        """
+        self.cancelled.set()
+
+    def check_cancelled(self):
+        """
+        Raises JobCancelledException if the context was cancelled.
+        Called between steps of long running model code.
+        """
+        if self.cancelled.is_set():
+            raise JobCancelledException()
+
+    async def run_model(self, fn: Callable[..., T], /, *args, **kwargs) -> T:
+        """
+        Runs model loading or inference on the model executor, so that CPU
+        bound torch work does not block the event loop.
+
+        Args:
+            fn (Callable): The function to run, e.g. a pipeline.
+            *args: Positional arguments for fn.
+            **kwargs: Keyword arguments for fn.
+
+        Returns:
+            The result of fn.
+
+        Raises:
+            JobCancelledException: If the context is cancelled before fn starts
+                or while it runs.
+        """
+        self.check_cancelled()
+        self.loop = asyncio.get_running_loop()
+        result = await self.loop.run_in_executor(
+            ModelManager.get_executor(), functools.partial(fn, *args, **kwargs)
+        )
+        self.check_cancelled()
+        return result
+
     def has_messages(self) -> bool:
         """
         Checks if the processing context has any messages in the message queue.
@@ -221,8 +370,22 @@ class ProcessingContext:
         self,
         node: BaseNode,
     ) -> str:
-        """Generate a cache key for a node based on current user, node type and properties."""
-        return f"{self.user_id}:{node.get_node_type()}:{hash(repr(node.model_dump()))}"
+        """
+        Generate a cache key for a node based on current user, node type, node version and properties.
+
+        The properties are serialized to canonical JSON (sorted keys) and hashed with BLAKE2,
+        so the key is identical across processes. Assets contribute their uri, asset id
+        and a digest of any inline data instead of the data itself.
+        """
+        payload = {
+            "version": node.get_version(),
+            "properties": cache_key_value(node.node_properties()),
+        }
+        encoded = json.dumps(
+            payload, sort_keys=True, separators=(",", ":"), default=str
+        ).encode("utf-8")
+        digest = hashlib.blake2b(encoded, digest_size=16).hexdigest()
+        return f"{self.user_id}:{node.get_node_type()}:{digest}"
 
     def get_cached_result(self, node: BaseNode) -> Any:
         """Get the cached result for a node."""
@@ -333,8 +496,7 @@ class ProcessingContext:
 
         return {
             edge.targetHandle: output_type(edge.source, edge.sourceHandle)
-            for edge in self.graph.edges
-            if edge.target == node_id
+            for edge in self.graph.incoming_edges(node_id)
         }
 
     def get_node_inputs(self, node_id: str) -> dict[str, Any]:
@@ -350,8 +512,7 @@ class ProcessingContext:
         """
         return {
             edge.targetHandle: self.get_result(edge.source, edge.sourceHandle)
-            for edge in self.graph.edges
-            if edge.target == node_id
+            for edge in self.graph.incoming_edges(node_id)
         }
 
     def find_node(self, node_id: str) -> BaseNode:
@@ -779,6 +940,7 @@ class ProcessingContext:
         """
         # Date takes precedence over anything else as it is the most up-to-date
         # and already in memory
+        await asset_ref.encode_memory_async()
         if asset_ref.data:
             if isinstance(asset_ref.data, bytes):
                 return BytesIO(asset_ref.data)
@@ -799,6 +961,7 @@ class ProcessingContext:
         if asset.uri:
             return asset.uri
 
+        await asset.encode_memory_async()
         assert asset.data
         assert isinstance(asset.data, bytes)
 
@@ -815,6 +978,10 @@ class ProcessingContext:
         Args:
             context (ProcessingContext): The processing context.
         """
+        image = image_ref.to_pil()
+        if image is not None:
+            # convert returns a copy, so callers may modify the image in place.
+            return image.convert("RGB")
         buffer = await self.asset_to_io(image_ref)
         return PIL.Image.open(buffer).convert("RGB")
 
@@ -870,6 +1037,17 @@ class ProcessingContext:
         """
         import pydub
 
+        pcm = audio_ref.to_pcm()
+        if pcm is not None:
+            samples, sample_rate, channels = pcm
+            data = np.clip(samples, -1.0, 1.0) * (2**31 - 1)
+            return pydub.AudioSegment(
+                data=data.astype(np.int32).tobytes(),
+                frame_rate=sample_rate,
+                sample_width=4,
+                channels=channels,
+            )
+
         audio_bytes = await self.asset_to_io(audio_ref)
         return pydub.AudioSegment.from_file(audio_bytes)
 
@@ -879,9 +1057,19 @@ class ProcessingContext:
         """
         Converts the audio to a np.float32 array.
 
+        In-memory samples at the requested sample rate are returned without
+        decoding.
+
         Args:
             context (ProcessingContext): The processing context.
         """
+        pcm = audio_ref.to_pcm()
+        if pcm is not None and pcm[1] == sample_rate:
+            samples, _, channels = pcm
+            if mono and channels > 1:
+                return samples.reshape(-1, channels).mean(axis=1), sample_rate, 1
+            return samples.copy(), sample_rate, channels
+
         segment = await self.audio_to_audio_segment(audio_ref)
         segment = segment.set_frame_rate(sample_rate)
         if mono and segment.channels > 1:
@@ -897,6 +1085,7 @@ class ProcessingContext:
         buffer: IO,
         name: str | None = None,
         parent_id: str | None = None,
+        content_type: str = "audio/mp3",
     ) -> AudioRef:
         """
         Creates an AudioRef from an IO object.
@@ -905,13 +1094,17 @@ class ProcessingContext:
             buffer (IO): The IO object.
             name (Optional[str], optional): The name of the asset. Defaults to None
             parent_id (Optional[str], optional): The parent ID of the asset. Defaults to None.
+            content_type (str, optional): The content type of the asset. Defaults to "audio/mp3".
 
         Returns:
             AudioRef: The AudioRef object.
         """
         if name:
             asset = await self.create_asset(
-                name=name, content_type="audio/mp3", content=buffer, parent_id=parent_id
+                name=name,
+                content_type=content_type,
+                content=buffer,
+                parent_id=parent_id,
             )
             return AudioRef(asset_id=asset.id, uri=asset.get_url or "")
         else:
@@ -947,6 +1140,10 @@ class ProcessingContext:
         """
         Creates an AudioRef from a numpy array.
 
+        Without a name, the samples are kept in memory as float32 PCM and only
+        encoded with the configured audio codec when the reference leaves
+        the workflow.
+
         Args:
             context (ProcessingContext): The processing context.
             data (np.ndarray): The numpy array.
@@ -956,24 +1153,34 @@ class ProcessingContext:
             parent_id (Optional[str], optional): The parent ID of the asset. Defaults to None.
         """
         if data.dtype == np.int16:
-            data_bytes = data.tobytes()
+            samples = data.astype(np.float32) / 2**15
         elif (
             data.dtype == np.float32
             or data.dtype == np.float64
             or data.dtype == np.float16
         ):
-            data_bytes = (data * (2**14)).astype(np.int16).tobytes()
+            samples = data
         else:
             raise ValueError(f"Unsupported dtype {data.dtype}")
 
-        audio_segment = AudioSegment(
-            data=data_bytes,
-            frame_rate=sample_rate,
-            sample_width=2,  # 16-bit
-            channels=num_channels,
+        return await self._audio_from_pcm(
+            AudioRef.from_pcm(samples, sample_rate, num_channels),
+            name=name,
+            parent_id=parent_id,
         )
-        return await self.audio_from_segment(
-            audio_segment, name=name, parent_id=parent_id
+
+    async def _audio_from_pcm(
+        self, audio: AudioRef, name: str | None, parent_id: str | None
+    ) -> AudioRef:
+        if not name:
+            return audio
+        codec = Environment.get_audio_codec()
+        audio.encode_memory()
+        return await self.audio_from_io(
+            BytesIO(audio.data),  # type: ignore
+            name=name,
+            parent_id=parent_id,
+            content_type=EXTENSION_TO_CONTENT_TYPE.get(codec, f"audio/{codec}"),
         )
 
     async def audio_from_segment(
@@ -996,29 +1203,46 @@ class ProcessingContext:
             AudioRef: The converted AudioRef object.
 
         """
-        buffer = BytesIO()
-        audio_segment.export(buffer, format="mp3")
-        buffer.seek(0)
-        return await self.audio_from_io(buffer, name=name, parent_id=parent_id)
+        samples = np.array(audio_segment.get_array_of_samples(), dtype=np.float32)
+        samples /= float(2 ** (8 * audio_segment.sample_width - 1))
+        return await self._audio_from_pcm(
+            AudioRef.from_pcm(
+                samples, audio_segment.frame_rate, audio_segment.channels
+            ),
+            name=name,
+            parent_id=parent_id,
+        )
 
     async def dataframe_to_pandas(self, df: DataframeRef) -> pd.DataFrame:
         """
         Converts a DataframeRef object to a pandas DataFrame.
 
+        Stored Arrow files are memory-mapped when the asset storage is local.
+
         Args:
             df (DataframeRef): The DataframeRef object to convert.
 
         Returns:
             pandas.DataFrame: The converted pandas DataFrame.
         """
+        table = df.to_arrow()
+        if table is not None:
+            return table.to_pandas()
         if df.columns:
             column_names = [col.name for col in df.columns]
             return pd.DataFrame(df.data, columns=column_names)
-        else:
-            io = await self.asset_to_io(df)
-            df = loads(io.read())
-            assert isinstance(df, pd.DataFrame), "Is not a dataframe"
-            return df
+
+        storage = Environment.get_asset_storage()
+        if df.asset_id is not None and isinstance(storage, FileStorage):
+            asset = await self.find_asset(df.asset_id)
+            path = os.path.join(storage.base_path, asset.file_name)
+            with open(path, "rb") as f:
+                magic = f.read(6)
+            if magic == ARROW_MAGIC:
+                return pa.ipc.open_file(pa.memory_map(path)).read_all().to_pandas()
+
+        io = await self.asset_to_io(df)
+        return read_dataframe(io.read())
 
     async def dataframe_from_pandas(
         self, data: pd.DataFrame, name: str | None = None, parent_id: str | None = None
@@ -1026,6 +1250,11 @@ class ProcessingContext:
         """
         Converts a pandas DataFrame to a DataframeRef object.
 
+        Without a name, the reference holds the frame as an Arrow table. With a
+        name, the frame is stored as an Arrow IPC file asset. Frames that Arrow
+        cannot represent, e.g. columns of mixed types, fall back to rows or a
+        pickled asset.
+
         Args:
             data (pd.DataFrame): The pandas DataFrame to convert.
             name (str | None, optional): The name of the asset. Defaults to None.
@@ -1033,14 +1262,29 @@ class ProcessingContext:
         Returns:
             DataframeRef: The converted DataframeRef object.
         """
-        buffer = BytesIO(dumps(data))
+        try:
+            table = pa.Table.from_pandas(data, preserve_index=None if name else False)
+        except (pa.ArrowException, ValueError) as e:
+            log.info(f"Dataframe is not representable in Arrow: {e}")
+            table = None
+
         if name:
+            if table is not None:
+                sink = pa.BufferOutputStream()
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+                buffer = BytesIO(sink.getvalue().to_pybytes())
+                content_type = "application/vnd.apache.arrow.file"
+            else:
+                buffer = BytesIO(dumps(data))
+                content_type = "application/octet-stream"
             asset = await self.create_asset(
-                name, "application/octet-stream", buffer, parent_id=parent_id
+                name, content_type, buffer, parent_id=parent_id
             )
             return DataframeRef(asset_id=asset.id, uri=asset.get_url or "")
+        elif table is not None:
+            return DataframeRef.from_arrow(table)
         else:
-            # TODO: avoid for large tables
             rows = data.values.tolist()
             column_defs = [
                 ColumnDef(name=name, data_type=dtype_name(dtype.name))
@@ -1144,6 +1388,9 @@ class ProcessingContext:
         """
         Creates an ImageRef from a PIL Image object.
 
+        Without a name, the image is kept in memory and only encoded as PNG
+        when the reference is serialized or pickled.
+
         Args:
             image (Image.Image): The PIL Image object.
             name (Optional[str], optional): The name of the asset. Defaults to None.
@@ -1152,6 +1399,8 @@ class ProcessingContext:
         Returns:
             ImageRef: The ImageRef object.
         """
+        if not name:
+            return ImageRef.from_pil(image)
         buffer = BytesIO()
         image.save(buffer, format="png")
         buffer.seek(0)
@@ -1171,7 +1420,9 @@ class ProcessingContext:
         Returns:
             ImageRef: The ImageRef object.
         """
-        return await self.image_from_pil(PIL.Image.fromarray(image), name=name)
+        return await self.image_from_pil(
+            PIL.Image.fromarray(image), name=name, parent_id=parent_id
+        )
 
     async def image_from_tensor(
         self,
@@ -1271,6 +1522,33 @@ class ProcessingContext:
         buffer.seek(0)
         return await self.video_from_io(buffer, name=name, parent_id=parent_id)
 
+    async def video_apply_filter(
+        self, video: VideoRef, name: str, *args: Any, **kwargs: Any
+    ) -> VideoRef:
+        """
+        Applies an ffmpeg filter to a video.
+
+        The filter is not run right away but appended to the pending filters of
+        the video. A chain of filter nodes is therefore rendered with a single
+        ffmpeg invocation when the result is read, serialized or output.
+
+        Args:
+            video (VideoRef): The input video.
+            name (str): The name of the ffmpeg filter.
+            *args: Positional arguments of the filter.
+            **kwargs: Keyword arguments of the filter.
+
+        Returns:
+            VideoRef: The filtered video.
+        """
+        pending = video.to_filters()
+        if pending is None:
+            source = (await self.asset_to_io(video)).read()
+            filters = []
+        else:
+            source, filters = pending
+        return VideoRef.from_filters(source, [*filters, (name, args, kwargs)])
+
     async def video_from_io(
         self,
         buffer: IO,
@@ -1,4 +1,5 @@
 import asyncio
+from collections import deque
 from contextlib import contextmanager
 from datetime import datetime
 import gc
@@ -41,7 +42,8 @@ class WorkflowRunner:
 
     Key Features:
     1. Topological Execution: Processes nodes in an order that respects their dependencies.
-    2. Parallel Processing: Executes independent nodes concurrently within each topological level.
+    2. Parallel Processing: Starts each node as soon as all of its upstream nodes have completed,
+       so independent branches never wait on each other.
     3. Result Caching: Stores and retrieves node outputs to optimize repeated executions.
     4. Special Node Handling: Supports both regular nodes and GroupNodes (e.g., loop nodes).
     5. Resource Management: Allocates appropriate computational resources (e.g., GPU) based on node requirements.
@@ -53,25 +55,38 @@ class WorkflowRunner:
         job_id (str): Unique identifier for the current workflow execution.
         status (str): Current state of the workflow. Possible values: "running", "completed", "cancelled", "error".
         current_node (Optional[str]): Identifier of the node currently being processed, or None if no node is active.
+        max_concurrency (Optional[int]): Maximum number of nodes processed at the same time, or None for no limit.
 
     Note:
         - This class does not handle the definition of the workflow graph. The graph must be provided externally.
         - The class relies on an external ProcessingContext for managing execution state and inter-node communication.
     """
 
-    def __init__(self, job_id: str, device: str | None = None):
+    def __init__(
+        self,
+        job_id: str,
+        device: str | None = None,
+        max_concurrency: int | None = None,
+    ):
         """
         Initializes a new WorkflowRunner instance.
 
         Args:
             job_id (str): Unique identifier for this workflow execution.
             device (str): The device to run the workflow on.
+            max_concurrency (int | None): Maximum number of nodes running at the same time.
+                Defaults to None, which runs every ready node immediately.
         """
         import torch
 
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
         self.job_id = job_id
         self.status = "running"
         self.current_node: Optional[str] = None
+        self.context: Optional[ProcessingContext] = None
+        self.max_concurrency = max_concurrency
         if device:
             self.device = device
         else:
@@ -102,6 +117,8 @@ class WorkflowRunner:
             and acted upon at specific points during the workflow execution.
         """
         self.status = "cancelled"
+        if self.context:
+            self.context.cancel()
         # send node update to cancel the current node
         if self.current_node and self.context:
             self.context.post_message(
@@ -222,7 +239,7 @@ class WorkflowRunner:
         is_valid = True
 
         for node in graph.nodes:
-            input_edges = [edge for edge in graph.edges if edge.target == node.id]
+            input_edges = graph.incoming_edges(node.id)
             errors = node.validate(input_edges)
             if len(errors) > 0:
                 is_valid = False
@@ -240,15 +257,15 @@ class WorkflowRunner:
 
     async def clear_unused_models(self, graph: Graph):
         """
-        Clears unused models from the model manager.
+        Evicts models from the model manager until they fit into its memory
+        budget. Models of previous runs stay loaded while they fit.
         """
         log.info("Clearing unused models")
-        if not Environment.is_production():
-            ModelManager.clear_unused(node_ids=[node.id for node in graph.nodes])
-            # run garbage collection
-            gc.collect()
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
+        ModelManager.trim()
+        # run garbage collection
+        gc.collect()
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
 
     async def initialize_graph(self, context: ProcessingContext, graph: Graph):
         """
@@ -284,7 +301,12 @@ class WorkflowRunner:
         self, context: ProcessingContext, graph: Graph, parent_id: str | None = None
     ):
         """
-        Processes the graph by executing nodes in topological order with parallel execution at each level.
+        Processes the graph by starting each node as soon as its dependencies are resolved.
+
+        The scheduler keeps an in-degree count per node. Nodes without pending upstream
+        edges are put on a ready queue and started right away (bounded by max_concurrency).
+        Whenever a node completes, the in-degree of its successors is decremented and
+        newly ready nodes are started, so a slow node only delays its own descendants.
 
         Args:
             context (ProcessingContext): Manages the execution state and inter-node communication.
@@ -295,22 +317,68 @@ class WorkflowRunner:
             JobCancelledException: If the job is cancelled during graph processing.
 
         Note:
-            - Uses topological sorting to determine the execution order.
-            - Executes nodes at each level in parallel using asyncio.gather.
-            - Checks for cancellation before processing each level.
+            - Uses topological sorting to determine the set of nodes to execute.
+            - Checks for cancellation before starting each node.
+            - If a node fails, all nodes still running are cancelled and the error is re-raised.
         """
         log.info(f"Processing graph (parent_id: {parent_id})")
-        sorted_nodes = graph.topological_sort(parent_id)
-        for level in sorted_nodes:
-            log.debug(f"Processing level: {level}")
-            nodes = [graph.find_node(i) for i in level if i]
-            if self.status == "cancelled":
-                log.info(f"Job {self.job_id} cancelled")
-                context.post_message(JobUpdate(job_id=self.job_id, status="cancelled"))
-                raise JobCancelledException()
-            await asyncio.gather(
-                *[self.process_node(context, node) for node in nodes if node]
-            )
+        node_ids = [
+            i for level in graph.topological_sort(parent_id) for i in level if i
+        ]
+        indegree: dict[str, int] = {node_id: 0 for node_id in node_ids}
+        successors: dict[str, list[str]] = {node_id: [] for node_id in node_ids}
+
+        for node_id in node_ids:
+            for edge in graph.outgoing_edges(node_id):
+                if edge.target in indegree:
+                    indegree[edge.target] += 1
+                    successors[node_id].append(edge.target)
+
+        ready = deque(node_id for node_id in node_ids if indegree[node_id] == 0)
+        running: dict[asyncio.Task, str] = {}
+
+        def release(node_id: str):
+            for target in successors[node_id]:
+                indegree[target] -= 1
+                if indegree[target] == 0:
+                    ready.append(target)
+
+        try:
+            while ready or running:
+                while ready and (
+                    self.max_concurrency is None or len(running) < self.max_concurrency
+                ):
+                    if self.status == "cancelled":
+                        log.info(f"Job {self.job_id} cancelled")
+                        context.post_message(
+                            JobUpdate(job_id=self.job_id, status="cancelled")
+                        )
+                        raise JobCancelledException()
+
+                    node_id = ready.popleft()
+                    node = graph.find_node(node_id)
+                    if node is None:
+                        release(node_id)
+                        continue
+                    log.debug(f"Starting node: {node_id}")
+                    task = asyncio.create_task(self.process_node(context, node))
+                    running[task] = node_id
+
+                if not running:
+                    continue
+
+                done, _ = await asyncio.wait(
+                    running.keys(), return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    node_id = running.pop(task)
+                    task.result()
+                    release(node_id)
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running.keys(), return_exceptions=True)
 
     async def process_node(self, context: ProcessingContext, node: BaseNode):
         """
@@ -349,7 +417,8 @@ class WorkflowRunner:
                 if isinstance(node, GroupNode):
                     await self.run_group_node(node, context)
                 else:
-                    await self.process_regular_node(context, node)
+                    with ModelManager.running(node.id):
+                        await self.process_regular_node(context, node)
                 break
             except torch.cuda.OutOfMemoryError as e:
                 log.error(
@@ -530,7 +599,8 @@ class WorkflowRunner:
 
         Note:
             - Handles special input types like DataframeRef.
-            - Executes the subgraph for each item in the input data.
+            - Executes the subgraph for each item in the input data, up to the Loop's
+              max_concurrency items at a time, keeping the order of the results.
             - Collects and returns results from output nodes.
             - Marks all nodes in the subgraph as processed.
         """
@@ -563,21 +633,49 @@ class WorkflowRunner:
                     f"Input data must be a list or dataframe but got: {type(input)}"
                 )
 
-            # Run the subgraph for each item in the input data.
-            results = {node._id: [] for node in output_nodes}
-            for i in range(len(input)):
-                sub_context = context.copy()
-                # passing global graph for lookups
-                # set the result of the input node
-                for input_node in input_nodes:
-                    input_node._value = input[i]
-
-                graph = Graph(nodes=child_nodes, edges=context.graph.edges)
-                await self.process_graph(sub_context, graph, parent_id=group_node._id)
-
-                # Get the result of the subgraph and add it to the results.
-                for output_node in output_nodes:
-                    results[output_node._id].append(output_node.input)
+            max_concurrency = int(
+                inputs.get("max_concurrency", getattr(group_node, "max_concurrency", 1))
+            )
+            # The loop body is built once. Edges from outside the loop are
+            # resolved through the parent graph of the context.
+            child_ids = {node._id for node in child_nodes}
+            body = Graph(
+                nodes=child_nodes,
+                edges=[
+                    edge
+                    for edge in context.graph.edges
+                    if edge.source in child_ids and edge.target in child_ids
+                ],
+            )
+            results = {node._id: [None] * len(input) for node in output_nodes}
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def run_item(i: int):
+                async with semaphore:
+                    # Concurrent items work on their own copies of the nodes.
+                    if max_concurrency > 1:
+                        graph = body.with_nodes([n.model_copy() for n in child_nodes])
+                    else:
+                        graph = body
+                    sub_context = context.copy()
+                    for input_node in input_nodes:
+                        graph.find_node(input_node._id)._value = input[i]  # type: ignore
+
+                    await self.process_graph(
+                        sub_context, graph, parent_id=group_node._id
+                    )
+
+                    # Get the result of the subgraph and add it to the results.
+                    for output_node in output_nodes:
+                        results[output_node._id][i] = graph.find_node(output_node._id).input  # type: ignore
+
+            tasks = [asyncio.create_task(run_item(i)) for i in range(len(input))]
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
 
             # Mark the nodes as processed.
             for n in child_nodes:
@@ -1,15 +1,23 @@
+import io
 import json
 import os
+import zipfile
 from fastapi.testclient import TestClient
+import PIL.Image
+import psutil
 import pytest
+from nodetool.api.asset import stream_zip, zip_entry_paths
+from nodetool.api.media_worker import MediaWorkerPool
 from nodetool.common.environment import Environment
+from nodetool.storage.file_storage import FileStorage
 from nodetool.models.asset import Asset
 from nodetool.models.user import User
 from nodetool.types.asset import AssetCreateRequest, AssetUpdateRequest
-from tests.conftest import make_image
+from tests.conftest import make_image, make_text
 
 
 test_jpg = os.path.join(os.path.dirname(os.path.dirname(__file__)), "test.jpg")
+test_mp4 = os.path.join(os.path.dirname(os.path.dirname(__file__)), "test.mp4")
 
 
 def test_index(client: TestClient, headers: dict[str, str], user: User):
@@ -78,6 +86,154 @@ def test_create(client: TestClient, headers: dict[str, str], user: User):
         headers=headers,
     )
     assert response.status_code == 200
+    assert response.json()["media_status"] == "pending"
     image = Asset.find(user.id, response.json()["id"])
     assert image is not None
     assert image.name == "bild.jpeg"
+
+    MediaWorkerPool.get_default().wait(timeout=30)
+    response = client.get(f"/api/assets/{image.id}", headers=headers)
+    assert response.json()["media_status"] == "ready"
+    assert response.json()["thumb_url"] is not None
+    storage = Environment.get_asset_storage()
+    thumbnail = PIL.Image.open(io.BytesIO(storage.storage[image.thumb_file_name]))
+    assert max(thumbnail.size) <= 512
+
+
+def test_create_video(client: TestClient, headers: dict[str, str], user: User):
+    response = client.post(
+        "/api/assets",
+        files={"file": ("test.mp4", open(test_mp4, "rb"), "video/mp4")},
+        data={
+            "json": AssetCreateRequest(
+                parent_id=user.id, name="video", content_type="video/mp4"
+            ).model_dump_json()
+        },
+        headers=headers,
+    )
+    assert response.status_code == 200
+
+    MediaWorkerPool.get_default().wait(timeout=30)
+    video = Asset.get(response.json()["id"])
+    assert video is not None
+    assert video.media_status == "ready"
+    assert video.duration is not None and video.duration > 0
+    assert video.thumb_file_name in Environment.get_asset_storage().storage
+
+
+def test_create_with_invalid_media(
+    client: TestClient, headers: dict[str, str], user: User
+):
+    response = client.post(
+        "/api/assets",
+        files={"file": ("test.jpg", b"not an image", "image/jpeg")},
+        data={
+            "json": AssetCreateRequest(
+                parent_id=user.id, name="broken.jpeg", content_type="image/jpeg"
+            ).model_dump_json()
+        },
+        headers=headers,
+    )
+    assert response.status_code == 200
+
+    MediaWorkerPool.get_default().wait(timeout=30)
+    response = client.get(f"/api/assets/{response.json()['id']}", headers=headers)
+    assert response.json()["media_status"] == "failed"
+    assert response.json()["thumb_url"] is None
+
+
+def test_download_assets(client: TestClient, headers: dict[str, str], user: User):
+    folder = Asset.create(user_id=user.id, name="folder", content_type="folder")
+    sub = Asset.create(
+        user_id=user.id, name="sub", content_type="folder", parent_id=folder.id
+    )
+    make_text(user, "a", parent_id=folder.id)
+    make_text(user, "b", parent_id=sub.id)
+    image = make_image(user)
+    make_text(user, "not exported")
+
+    response = client.post(
+        "/api/assets/download",
+        json={"asset_ids": [folder.id, image.id]},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "application/zip"
+
+    with zipfile.ZipFile(io.BytesIO(response.content)) as zip_file:
+        assert sorted(zip_file.namelist()) == [
+            "folder/",
+            "folder/sub/",
+            "folder/sub/test_text.txt",
+            "folder/test_text.txt",
+            "test_image.jpg",
+        ]
+        assert zip_file.read("folder/sub/test_text.txt") == b"b"
+        assert zip_file.testzip() is None
+
+
+def test_download_assets_not_found(
+    client: TestClient, headers: dict[str, str], user: User
+):
+    response = client.post(
+        "/api/assets/download", json={"asset_ids": ["missing"]}, headers=headers
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_download_assets_streams_with_bounded_memory(
+    tmp_path, monkeypatch, user: User
+):
+    storage = FileStorage(str(tmp_path), "http://localhost:8000/api/storage")
+    monkeypatch.setattr(Environment, "asset_storage", storage, raising=False)
+
+    file_size = 64 * 1024 * 1024
+    block = os.urandom(1024 * 1024)
+    folder = Asset.create(user_id=user.id, name="videos", content_type="folder")
+    for i in range(16):
+        asset = Asset.create(
+            user_id=user.id,
+            name=f"video_{i}",
+            content_type="video/mp4",
+            parent_id=folder.id,
+        )
+        with open(tmp_path / asset.file_name, "wb") as f:
+            for _ in range(file_size // len(block)):
+                f.write(block)
+
+    process = psutil.Process()
+    start_rss = process.memory_info().rss
+    peak_rss = start_rss
+    total = 0
+    entries = zip_entry_paths(Asset.get_asset_tree(user.id, [folder.id]))
+    async for chunk in stream_zip(entries):
+        total += len(chunk)
+        peak_rss = max(peak_rss, process.memory_info().rss)
+
+    assert total > 16 * file_size
+    assert peak_rss - start_rss < 64 * 1024 * 1024
+
+
+def test_delete_folder(client: TestClient, headers: dict[str, str], user: User):
+    folder = Asset.create(user_id=user.id, name="folder", content_type="folder")
+    sub = Asset.create(
+        user_id=user.id, name="sub", content_type="folder", parent_id=folder.id
+    )
+    image = make_image(user, parent_id=sub.id)
+    text = make_text(user, "a", parent_id=folder.id)
+    kept = make_text(user, "kept")
+
+    response = client.delete(f"/api/assets/{folder.id}", headers=headers)
+    assert response.status_code == 200
+    deleted = response.json()["deleted_asset_ids"]
+    assert sorted(deleted) == sorted([folder.id, sub.id, image.id, text.id])
+    assert deleted[-1] == folder.id
+
+    storage = Environment.get_asset_storage()
+    for asset in [folder, sub, image, text]:
+        assert Asset.get(asset.id) is None
+    assert image.file_name not in storage.storage
+    assert text.file_name not in storage.storage
+    assert Asset.get(kept.id) is not None
+    assert kept.file_name in storage.storage
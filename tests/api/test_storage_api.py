@@ -0,0 +1,95 @@
+import asyncio
+import io
+from fastapi.testclient import TestClient
+import pytest
+from nodetool.common.environment import Environment
+
+data = bytes(range(256)) * 40
+key = "video.mp4"
+
+
+@pytest.fixture
+def url():
+    storage = Environment.get_asset_storage()
+    asyncio.run(storage.upload(key, io.BytesIO(data)))
+    yield f"/api/storage/{Environment.get_asset_bucket()}/{key}"
+    asyncio.run(storage.delete(key))
+
+
+def test_get_full(client: TestClient, url: str):
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.content == data
+    assert response.headers["Content-Length"] == str(len(data))
+    assert response.headers["Content-Type"] == "video/mp4"
+    assert response.headers["ETag"].startswith('"')
+
+
+def test_get_missing(client: TestClient):
+    response = client.get(f"/api/storage/{Environment.get_asset_bucket()}/missing")
+    assert response.status_code == 404
+
+
+def test_head(client: TestClient, url: str):
+    response = client.head(url)
+    assert response.status_code == 200
+    assert response.headers["Content-Length"] == str(len(data))
+    assert response.headers["Accept-Ranges"] == "bytes"
+
+
+@pytest.mark.parametrize(
+    "range_header,start,end",
+    [
+        ("bytes=100-199", 100, 199),
+        ("bytes=10000-", 10000, len(data) - 1),
+        ("bytes=-24", len(data) - 24, len(data) - 1),
+        ("bytes=10230-99999", 10230, len(data) - 1),
+    ],
+)
+def test_get_range(client: TestClient, url: str, range_header, start, end):
+    response = client.get(url, headers={"Range": range_header})
+    assert response.status_code == 206
+    assert response.content == data[start : end + 1]
+    assert response.headers["Content-Range"] == f"bytes {start}-{end}/{len(data)}"
+    assert response.headers["Content-Length"] == str(end - start + 1)
+
+
+def test_get_unsatisfiable_range(client: TestClient, url: str):
+    response = client.get(url, headers={"Range": f"bytes={len(data)}-"})
+    assert response.status_code == 416
+    assert response.headers["Content-Range"] == f"bytes */{len(data)}"
+
+
+def test_get_malformed_range_returns_full_content(client: TestClient, url: str):
+    response = client.get(url, headers={"Range": "bytes=0-1,5-6"})
+    assert response.status_code == 200
+    assert response.content == data
+
+
+def test_conditional_get(client: TestClient, url: str):
+    first = client.get(url)
+    etag = first.headers["ETag"]
+    last_modified = first.headers["Last-Modified"]
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    response = client.get(url, headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+    response = client.get(url, headers={"If-None-Match": '"other"'})
+    assert response.status_code == 200
+
+
+def test_if_range(client: TestClient, url: str):
+    etag = client.head(url).headers["ETag"]
+
+    response = client.get(url, headers={"Range": "bytes=0-9", "If-Range": etag})
+    assert response.status_code == 206
+    assert response.content == data[:10]
+
+    response = client.get(url, headers={"Range": "bytes=0-9", "If-Range": '"stale"'})
+    assert response.status_code == 200
+    assert response.content == data
@@ -0,0 +1,161 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from nodetool.common.job_poller import JobPoller, RateLimiter
+from nodetool.nodes.kling.api import ImageGenerationRequest, KlingAIAPI, TaskStatus
+
+
+class FakeProvider:
+    """
+    A fake Kling API whose tasks succeed a fixed delay after creation.
+    """
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.tasks: dict[str, float] = {}
+        self.status_requests = 0
+        self.app = FastAPI()
+
+        @self.app.post("/v1/images/generations")
+        async def create():
+            task_id = str(len(self.tasks))
+            self.tasks[task_id] = time.monotonic()
+            return self.response(task_id)
+
+        @self.app.get("/v1/images/generations/{task_id}")
+        async def get(task_id: str):
+            self.status_requests += 1
+            return self.response(task_id)
+
+    def response(self, task_id: str):
+        done = time.monotonic() - self.tasks[task_id] >= self.delay
+        return {
+            "code": 0,
+            "message": "",
+            "request_id": task_id,
+            "data": {
+                "task_id": task_id,
+                "task_status": "succeed" if done else "processing",
+                "created_at": 0,
+                "updated_at": 0,
+                "task_result": {"images": [{"index": 0, "url": "http://x"}]},
+            },
+        }
+
+    def client(self, poller: JobPoller) -> KlingAIAPI:
+        api = KlingAIAPI("key", "secret", base_url="http://fake", poller=poller)
+        api.client = httpx.AsyncClient(transport=httpx.ASGITransport(app=self.app))
+        return api
+
+
+@pytest.mark.asyncio
+async def test_polls_many_tasks_on_one_scheduler():
+    provider = FakeProvider(delay=0.2)
+    poller = JobPoller(initial_interval=0.02, max_interval=0.05, rate_limits={})
+    api = provider.client(poller)
+
+    start = time.monotonic()
+    responses = await asyncio.gather(
+        *[
+            api.create_image_generation_task_and_wait(
+                ImageGenerationRequest(prompt=str(i))
+            )
+            for i in range(50)
+        ]
+    )
+
+    assert all(r.data.task_status == TaskStatus.SUCCEED for r in responses)
+    assert len({r.data.task_id for r in responses}) == 50
+    assert time.monotonic() - start < 2
+    await asyncio.sleep(0)
+    assert poller.jobs == {}
+    assert poller.task is not None and poller.task.done()
+
+
+@pytest.mark.asyncio
+async def test_rate_limit():
+    provider = FakeProvider(delay=0.5)
+    poller = JobPoller(initial_interval=0.01, max_interval=0.01)
+    poller.set_rate_limit("kling", 40, burst=5)
+    api = provider.client(poller)
+
+    start = time.monotonic()
+    await asyncio.gather(
+        *[
+            api.create_image_generation_task_and_wait(
+                ImageGenerationRequest(prompt=str(i))
+            )
+            for i in range(10)
+        ]
+    )
+    elapsed = time.monotonic() - start
+
+    assert provider.status_requests <= 40 * elapsed + 5
+    assert provider.status_requests >= 10
+
+
+@pytest.mark.asyncio
+async def test_deadline():
+    provider = FakeProvider(delay=60)
+    poller = JobPoller(initial_interval=0.01)
+    api = provider.client(poller)
+    task = await api.create_image_generation_task(ImageGenerationRequest(prompt=""))
+
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        await poller.wait(
+            "kling",
+            task.data.task_id,
+            poll=lambda: api.get_image_generation_task(task.data.task_id),
+            is_done=lambda r: r.data.task_status == TaskStatus.SUCCEED,
+            timeout=0.2,
+        )
+    assert time.monotonic() - start < 1
+
+
+@pytest.mark.asyncio
+async def test_complete_short_circuits_polling():
+    provider = FakeProvider(delay=60)
+    poller = JobPoller(initial_interval=10)
+    api = provider.client(poller)
+    task = await api.create_image_generation_task(ImageGenerationRequest(prompt=""))
+
+    waiter = asyncio.create_task(
+        api._poll_task(task.data.task_id, api.get_image_generation_task)
+    )
+    await asyncio.sleep(0.1)
+    assert poller.complete("kling", task.data.task_id, "from webhook")
+    assert await asyncio.wait_for(waiter, 1) == "from webhook"
+    assert provider.status_requests == 1
+    assert not poller.complete("kling", task.data.task_id, "again")
+
+
+@pytest.mark.asyncio
+async def test_backoff_and_errors():
+    poll_times = []
+
+    async def poll():
+        poll_times.append(time.monotonic())
+        if len(poll_times) < 6:
+            return "running"
+        raise ConnectionError("provider down")
+
+    poller = JobPoller(initial_interval=0.01, backoff=2, max_interval=0.1, max_errors=2)
+    with pytest.raises(ConnectionError):
+        await poller.wait("test", "1", poll, is_done=lambda s: s == "done")
+
+    assert len(poll_times) == 7
+    gaps = [b - a for a, b in zip(poll_times, poll_times[1:])]
+    assert gaps[3] > gaps[0] * 3
+
+
+def test_rate_limiter():
+    limiter = RateLimiter(rate=2, burst=2)
+    assert limiter.reserve(0) == 0
+    assert limiter.reserve(0) == 0
+    assert limiter.reserve(0) == pytest.approx(0.5)
+    assert limiter.reserve(0.5) == 0
@@ -0,0 +1,36 @@
+import asyncio
+import pytest
+from nodetool.common.micro_batcher import MicroBatcher
+
+
+@pytest.mark.asyncio
+async def test_batches_by_key_and_size():
+    batcher = MicroBatcher(max_batch_size=4, max_wait=0.01)
+    batches = []
+
+    async def run_batch(items):
+        batches.append(items)
+        return [item * 2 for item in items]
+
+    results = await asyncio.gather(
+        *(batcher.submit(i % 2, i, run_batch) for i in range(10))
+    )
+
+    assert results == [i * 2 for i in range(10)]
+    assert sorted(map(sorted, batches)) == [[0, 2, 4, 6], [1, 3, 5, 7], [8], [9]]
+
+
+@pytest.mark.asyncio
+async def test_error_fails_every_caller():
+    batcher = MicroBatcher()
+
+    async def run_batch(items):
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        *(batcher.submit("key", i, run_batch) for i in range(3)),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, ValueError) for r in results)
+    assert batcher.pending == {}
@@ -68,3 +68,61 @@ def test_created_at(user: User):
 
     assert asset.created_at is not None
     assert isinstance(asset.created_at, datetime)
+
+
+def make_folder_tree(user: User, depth: int, files_per_folder: int) -> list[Asset]:
+    assets = []
+    parent_id = user.id
+    for level in range(depth):
+        folder = Asset.create(
+            user_id=user.id,
+            name=f"level_{level}",
+            content_type="folder",
+            parent_id=parent_id,
+        )
+        assets.append(folder)
+        for i in range(files_per_folder):
+            assets.append(
+                Asset.create(
+                    user_id=user.id,
+                    name=f"file_{i}",
+                    content_type="text/plain",
+                    parent_id=folder.id,
+                )
+            )
+        parent_id = folder.id
+    return assets
+
+
+def test_get_asset_tree(user: User):
+    assets = make_folder_tree(user, depth=10, files_per_folder=3)
+    Asset.create(
+        user_id="other",
+        name="foreign",
+        content_type="text/plain",
+        parent_id=assets[0].id,
+    )
+
+    tree = Asset.get_asset_tree(user.id, [assets[0].id])
+
+    assert {a.id for a in tree} == {a.id for a in assets}
+    position = {a.id: i for i, a in enumerate(tree)}
+    for asset in tree[1:]:
+        assert position[asset.parent_id] < position[asset.id]
+
+
+def test_get_assets_recursive(user: User):
+    assets = make_folder_tree(user, depth=3, files_per_folder=2)
+
+    result = Asset.get_assets_recursive(user.id, assets[0].id)
+
+    root = result["assets"][0]
+    assert root["id"] == assets[0].id
+    children = {c["name"]: c for c in root["children"]}
+    assert sorted(children) == ["file_0", "file_1", "level_1"]
+    assert "children" not in children["file_0"]
+    level_2 = children["level_1"]["children"]
+    level_2 = next(c for c in level_2 if c["name"] == "level_2")
+    assert sorted(c["name"] for c in level_2["children"]) == ["file_0", "file_1"]
+
+    assert Asset.get_assets_recursive(user.id, "missing") == {"assets": []}
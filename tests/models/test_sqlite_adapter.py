@@ -136,6 +136,65 @@ def test_query(db_adapter):
     assert last_key == ""
 
 
+class TreeModel(DBModel):
+    id: str = DBField(hash_key=True)
+    parent_id: str = DBField(default="")
+    owner: str = DBField(default="")
+
+    @classmethod
+    def get_table_schema(cls) -> dict:
+        return {"table_name": "tree_table"}
+
+
+@pytest.fixture
+def tree_adapter():
+    adapter = SQLiteAdapter(
+        ":memory:", TreeModel.db_fields(), TreeModel.get_table_schema()
+    )
+    #   a        x (other owner)
+    #  / \       |
+    # b   c      y
+    # |
+    # d (other owner) - e
+    for id, parent_id, owner in [
+        ("a", "", "me"),
+        ("b", "a", "me"),
+        ("c", "a", "me"),
+        ("d", "b", "other"),
+        ("e", "d", "me"),
+        ("x", "", "other"),
+        ("y", "x", "other"),
+    ]:
+        adapter.save(TreeModel(id=id, parent_id=parent_id, owner=owner).model_dump())
+    yield adapter
+    adapter.connection.close()
+
+
+def test_query_tree(tree_adapter):
+    rows = tree_adapter.query_tree(["a"], "parent_id")
+    assert [row["id"] for row in rows] == ["a", "b", "c", "d", "e"]
+
+    rows = tree_adapter.query_tree(
+        ["a", "b", "x"], "parent_id", Field("owner").equals("me")
+    )
+    assert [row["id"] for row in rows] == ["a", "b", "c"]
+
+    assert tree_adapter.query_tree([], "parent_id") == []
+
+
+def test_query_tree_stops_on_cycles(tree_adapter):
+    tree_adapter.save(TreeModel(id="a", parent_id="e", owner="me").model_dump())
+    rows = tree_adapter.query_tree(["a"], "parent_id")
+    assert [row["id"] for row in rows] == ["a", "b", "c", "d", "e"]
+
+
+def test_delete_many(tree_adapter):
+    tree_adapter.delete_many(["a", "b", "missing"])
+    assert tree_adapter.get("a") is None
+    assert tree_adapter.get("b") is None
+    assert tree_adapter.get("c") is not None
+
+
 def test_convert_to_sqlite_format():
     assert convert_to_sqlite_format("test", str) == "test"
     assert convert_to_sqlite_format(123, int) == 123
@@ -0,0 +1,77 @@
+import asyncio
+import pytest
+import torch
+from transformers import (
+    BertConfig,
+    BertForSequenceClassification,
+    BertTokenizerFast,
+    pipeline,
+)
+from nodetool.nodes.huggingface.text_classification import TextClassifier
+from nodetool.workflows.processing_context import ProcessingContext
+
+WORDS = ["good", "bad", "movie", "really", "not", "the", "was", "great"]
+
+
+@pytest.fixture
+def classifier(tmp_path):
+    vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", *WORDS]
+    (tmp_path / "vocab.txt").write_text("\n".join(vocab))
+    tokenizer = BertTokenizerFast(vocab_file=str(tmp_path / "vocab.txt"))
+    torch.manual_seed(0)
+    config = BertConfig(
+        vocab_size=len(vocab),
+        hidden_size=32,
+        num_hidden_layers=2,
+        num_attention_heads=2,
+        intermediate_size=64,
+        num_labels=2,
+    )
+    model = BertForSequenceClassification(config).eval()
+    classify = pipeline("text-classification", model=model, tokenizer=tokenizer)
+
+    calls = []
+
+    def counted(inputs, **kwargs):
+        calls.append(inputs)
+        return classify(inputs, **kwargs)
+
+    return counted, classify, calls
+
+
+def make_prompts(n: int) -> list[str]:
+    return [" ".join(WORDS[i % 8 : i % 8 + 1 + i % 5]) for i in range(n)]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_batched(classifier):
+    counted, classify, calls = classifier
+    context = ProcessingContext(user_id="", auth_token="token")
+    prompts = make_prompts(256)
+    nodes = [TextClassifier(id=str(i), prompt=p) for i, p in enumerate(prompts)]  # type: ignore
+    for node in nodes:
+        node._pipeline = counted  # type: ignore
+
+    results = await asyncio.gather(*(node.process(context) for node in nodes))
+
+    assert len(calls) <= 256 // 32 + 1
+    for prompt, result in zip(prompts, results):
+        expected = classify(prompt)
+        assert result.keys() == {expected[0]["label"]}
+        assert result[expected[0]["label"]] == pytest.approx(
+            expected[0]["score"], abs=1e-5
+        )
+
+
+@pytest.mark.asyncio
+async def test_single_call_is_not_batched(classifier):
+    counted, classify, calls = classifier
+    context = ProcessingContext(user_id="", auth_token="token")
+    node = TextClassifier(id="1", prompt="good movie")  # type: ignore
+    node._pipeline = counted  # type: ignore
+
+    result = await node.process(context)
+
+    assert calls == ["good movie"]
+    expected = classify("good movie")[0]
+    assert result == {expected["label"]: pytest.approx(expected["score"])}
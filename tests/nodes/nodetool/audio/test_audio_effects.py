@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from io import BytesIO
 from pydub import AudioSegment
@@ -72,8 +73,40 @@ async def test_audio_effects_node(context: ProcessingContext, node: BaseNode):
     try:
         result = await node.process(context)
         assert isinstance(result, AudioRef)
+        result.encode_memory()
         assert result.data is not None
         assert len(result.data) > 0
 
     except Exception as e:
         pytest.fail(f"Error processing {node.__class__.__name__}: {str(e)}")
+
+
+@pytest.mark.asyncio
+async def test_effect_chain_passes_pcm(
+    context: ProcessingContext, monkeypatch: pytest.MonkeyPatch
+):
+    exports = []
+    original_export = AudioSegment.export
+
+    def counting_export(self, *args, **kwargs):
+        exports.append(kwargs.get("format"))
+        return original_export(self, *args, **kwargs)
+
+    monkeypatch.setattr(AudioSegment, "export", counting_export)
+    monkeypatch.setenv("AUDIO_CODEC", "wav")
+
+    t = np.arange(32_000, dtype=np.float32) / 32_000
+    tone = (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+    audio = await context.audio_from_numpy(tone, 32_000)
+
+    for _ in range(5):
+        audio = await Gain(audio=audio, gain_db=0.0).process(context)
+
+    samples, sample_rate, channels = await context.audio_to_numpy(audio)
+    assert exports == []
+    assert (sample_rate, channels) == (32_000, 1)
+    np.testing.assert_allclose(samples, tone, atol=1e-6)
+
+    audio.model_dump()
+    assert exports == ["wav"]
+    assert audio.data[:4] == b"RIFF"
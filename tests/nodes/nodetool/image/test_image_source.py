@@ -38,6 +38,7 @@ async def test_image_source_nodes(context: ProcessingContext, node, expected_typ
         assert isinstance(result, expected_type)
 
         if isinstance(result, ImageRef):
+            result.encode_memory()
             assert result.data is not None
             assert len(result.data) > 0
 
@@ -56,8 +56,44 @@ async def test_image_transform_nodes(context: ProcessingContext, node, expected_
         assert isinstance(result, expected_type)
 
         if isinstance(result, ImageRef):
+            result.encode_memory()
             assert result.data is not None
             assert len(result.data) > 0
 
     except Exception as e:
         pytest.fail(f"Error processing {node.__class__.__name__}: {str(e)}")
+
+
+@pytest.mark.asyncio
+async def test_transform_chain_encodes_once(context: ProcessingContext, monkeypatch):
+    encodes = []
+    original_save = Image.Image.save
+
+    def counting_save(self, fp, format=None, **params):
+        encodes.append(format)
+        return original_save(self, fp, format, **params)
+
+    monkeypatch.setattr(Image.Image, "save", counting_save)
+
+    nodes = [
+        Invert(),
+        Blur(radius=1),
+        Solarize(threshold=100),
+        Posterize(bits=4),
+        Smooth(),
+        Expand(border=2),
+        Crop(left=2, top=2, right=98, bottom=98),
+        Resize(width=64, height=64),
+        Emboss(),
+        ConvertToGrayscale(),
+    ]
+    image = dummy_image
+    for node in nodes:
+        node.image = image
+        image = await node.process(context)
+
+    assert encodes == []
+    image.model_dump()
+    image.model_dump()
+    assert len(encodes) == 1
+    assert Image.open(BytesIO(image.data)).size == (64, 64)
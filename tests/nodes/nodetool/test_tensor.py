@@ -111,3 +111,44 @@ async def test_exp_and_log(context: ProcessingContext):
     result = await log_node.process(context)
     assert isinstance(result, Tensor)
     np.testing.assert_array_almost_equal(result.to_numpy(), x.to_numpy())
+
+
+def test_tensor_binary_round_trip():
+    import msgpack
+    import pickle
+
+    array = np.random.rand(64, 64, 3).astype(np.float32)
+    tensor = Tensor.from_numpy(array)
+
+    assert tensor.value == []
+    assert tensor.shape == [64, 64, 3]
+    assert isinstance(tensor.data, bytes)
+
+    packed = msgpack.packb(tensor.model_dump(), use_bin_type=True)
+    unpacked = Tensor(**msgpack.unpackb(packed))
+    np.testing.assert_array_equal(unpacked.to_numpy(), array)
+
+    np.testing.assert_array_equal(pickle.loads(pickle.dumps(tensor)).to_numpy(), array)
+
+
+def test_tensor_json_fallback():
+    from nodetool.metadata.types import tensors_to_json
+
+    tensor = Tensor.from_numpy(np.array([[1, 2], [3, 4]], dtype=np.int32))
+
+    json_dict = tensor.model_dump(mode="json")
+    assert json_dict["value"] == [[1, 2], [3, 4]]
+    assert json_dict["data"] is None
+    np.testing.assert_array_equal(
+        Tensor(**json_dict).to_numpy(), np.array([[1, 2], [3, 4]])
+    )
+
+    message = {"result": {"output": tensor.model_dump()}}
+    assert tensors_to_json(message)["result"]["output"]["value"] == [[1, 2], [3, 4]]
+
+
+@pytest.mark.asyncio
+async def test_tensor_nodes_keep_binary_representation(context: ProcessingContext):
+    result = await Transpose(tensor=Tensor.from_numpy(np.ones((2, 3)))).process(context)
+    assert result.value == []
+    assert result.shape == [3, 2]
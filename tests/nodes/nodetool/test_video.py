@@ -1,3 +1,7 @@
+import asyncio
+import subprocess
+import tempfile
+import imageio.v3 as iio
 import numpy as np
 import base64
 import pytest
@@ -34,6 +38,7 @@ from nodetool.nodes.nodetool.video import (
 from io import BytesIO
 from pydub import AudioSegment
 import os
+import nodetool.common.media_utils as media_utils
 
 test_mp4 = os.path.join(
     os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
@@ -105,5 +110,66 @@ async def test_video_nodes(context: ProcessingContext, node, expected_type):
     try:
         result = await node.process(context)
         assert isinstance(result, expected_type)
+        if isinstance(result, VideoRef):
+            # Filter nodes defer ffmpeg until the video is read.
+            assert len((await context.asset_to_io(result)).read()) > 0
     except Exception as e:
         pytest.fail(f"Error processing {node.__class__.__name__}: {str(e)}")
+
+
+def video_props(video: bytes):
+    with tempfile.NamedTemporaryFile(suffix=".mp4") as temp:
+        temp.write(video)
+        temp.flush()
+        return iio.improps(temp.name, plugin="pyav").shape
+
+
+@pytest.mark.asyncio
+async def test_filter_chain_runs_single_ffmpeg(context: ProcessingContext, monkeypatch):
+    with tempfile.NamedTemporaryFile(suffix=".mp4") as temp:
+        subprocess.run(
+            [
+                "ffmpeg",
+                "-y",
+                "-f",
+                "lavfi",
+                "-i",
+                "testsrc=duration=3:size=320x240:rate=10",
+                "-pix_fmt",
+                "yuv420p",
+                temp.name,
+            ],
+            check=True,
+            capture_output=True,
+        )
+        source = VideoRef(data=open(temp.name, "rb").read())
+
+    spawns = []
+    create_subprocess_exec = asyncio.create_subprocess_exec
+
+    async def counting_exec(*cmd, **kwargs):
+        spawns.append(cmd)
+        return await create_subprocess_exec(*cmd, **kwargs)
+
+    monkeypatch.setattr(media_utils.asyncio, "create_subprocess_exec", counting_exec)
+
+    trimmed = await Trim(video=source, start_time=0, end_time=2).process(context)
+    resized = await VideoResizeNode(video=trimmed, width=160, height=120).process(
+        context
+    )
+    fps = await Fps(video=resized).process(context)
+
+    assert len(spawns) == 1
+    assert fps == 10
+
+    # The same chain rendered node by node.
+    spawns.clear()
+    trimmed = await Trim(video=source, start_time=0, end_time=2).process(context)
+    trimmed = VideoRef(data=(await context.asset_to_io(trimmed)).read())
+    unfused = await VideoResizeNode(video=trimmed, width=160, height=120).process(
+        context
+    )
+    unfused_data = (await context.asset_to_io(unfused)).read()
+
+    assert len(spawns) == 2
+    assert video_props(resized.data) == video_props(unfused_data) == (20, 120, 160, 3)
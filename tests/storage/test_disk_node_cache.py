@@ -0,0 +1,77 @@
+import time
+import pytest
+from nodetool.storage.disk_node_cache import DiskNodeCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = DiskNodeCache(tmp_path, max_memory_bytes=2_000, max_disk_bytes=10_000)
+    yield cache
+    cache.close()
+
+
+def test_get_set(cache: DiskNodeCache):
+    assert cache.get("a") is None
+    cache.set("a", {"output": 1})
+    assert cache.get("a") == {"output": 1}
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_expired_entry(cache: DiskNodeCache):
+    cache.set("a", 1, ttl=1)
+    cache.memory["a"] = (1, cache.memory["a"][1], time.time() - 1)
+    assert cache.get("a") is None
+
+
+def test_spills_least_recently_used_to_disk(cache: DiskNodeCache):
+    cache.set("a", b"a" * 900)
+    cache.set("b", b"b" * 900)
+    cache.get("a")
+    cache.set("c", b"c" * 900)
+
+    assert "b" not in cache.memory
+    stats = cache.stats()
+    assert stats["memory_bytes"] <= 2_000
+    assert stats["disk_entries"] == 1
+    assert stats["evictions"] == 1
+
+    assert cache.get("b") == b"b" * 900
+    assert "b" in cache.memory
+
+
+def test_disk_budget_evicts_oldest(cache: DiskNodeCache):
+    for i in range(20):
+        cache.set(str(i), bytes([i]) * 1_500)
+
+    stats = cache.stats()
+    assert stats["disk_bytes"] <= 10_000
+    assert cache.get("0") is None
+    assert cache.get("19") == bytes([19]) * 1_500
+
+
+def test_persists_across_instances(tmp_path):
+    cache = DiskNodeCache(tmp_path, max_memory_bytes=100, max_disk_bytes=10_000)
+    cache.set("a", b"x" * 500)
+    cache.set("b", b"y" * 500)
+    cache.close()
+
+    cache = DiskNodeCache(tmp_path, max_memory_bytes=100, max_disk_bytes=10_000)
+    assert cache.get("a") == b"x" * 500
+    cache.close()
+
+
+def test_unpicklable_value_is_skipped(cache: DiskNodeCache):
+    cache.set("a", lambda: None)
+    assert cache.get("a") is None
+
+
+def test_clear(cache: DiskNodeCache, tmp_path):
+    cache.set("a", b"a" * 1_500)
+    cache.set("b", b"b" * 1_500)
+    cache.clear()
+
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.stats()["disk_entries"] == 0
+    assert [p for p in (tmp_path / "blobs").rglob("*") if p.is_file()] == []
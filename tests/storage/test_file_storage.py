@@ -39,3 +39,15 @@ async def test_delete(storage: FileStorage):
         f.write(data)
     await storage.delete(file_name)
     assert not os.path.isfile(file_path)
+
+
+@pytest.mark.asyncio
+async def test_download_range(storage: FileStorage):
+    with open(file_path, "wb") as f:
+        f.write(os.urandom(3 * 1024 * 1024))
+    with open(file_path, "rb") as f:
+        expected = f.read()[1000 : 2 * 1024 * 1024 + 1]
+
+    assert await storage.get_size(file_name) == 3 * 1024 * 1024
+    chunks = [c async for c in storage.download_range(file_name, 1000, 2 * 1024 * 1024)]
+    assert b"".join(chunks) == expected
@@ -97,3 +97,13 @@ async def test_delete(memory_storage):
     assert await memory_storage.file_exists("test.txt")
     await memory_storage.delete("test.txt")
     assert not await memory_storage.file_exists("test.txt")
+
+
+@pytest.mark.asyncio
+async def test_download_range(memory_storage):
+    await memory_storage.upload("test.txt", io.BytesIO(b"hello, world"))
+    assert await memory_storage.get_size("test.txt") == 12
+    output = b""
+    async for chunk in memory_storage.download_range("test.txt", 7, 11):
+        output += chunk
+    assert output == b"world"
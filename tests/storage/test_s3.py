@@ -1,27 +1,42 @@
+import os
 import pytest
 import io
+import uuid
 import boto3
-from moto import mock_aws
+from moto.server import ThreadedMotoServer
 from nodetool.storage.s3_storage import S3Storage
 
 file_name = "test_asset.jpg"
 data = b"0" * 1024 * 1024  # 1 MB of data for testing
+large_data = os.urandom(13 * 1024 * 1024)  # spans three 5 MB parts
 
 
-@pytest.fixture(scope="function")
-def s3_client():
-    with mock_aws():
-        yield boto3.client("s3", region_name="us-east-1")
+@pytest.fixture(scope="module")
+def s3_endpoint():
+    server = ThreadedMotoServer(ip_address="127.0.0.1", port=0)
+    server.start()
+    host, port = server.get_host_and_port()
+    yield f"http://{host}:{port}"
+    server.stop()
 
 
 @pytest.fixture(scope="function")
-def storage(s3_client):
-    bucket_name = "test-bucket"
-    s3_client.create_bucket(Bucket=bucket_name)
+def storage(s3_endpoint):
+    bucket_name = f"test-bucket-{uuid.uuid4().hex[:8]}"
+    boto3.client(
+        "s3",
+        region_name="us-east-1",
+        endpoint_url=s3_endpoint,
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+    ).create_bucket(Bucket=bucket_name)
     return S3Storage(
         bucket_name=bucket_name,
-        endpoint_url="http://localhost:5000",  # This is ignored by moto
-        client=s3_client,
+        endpoint_url=s3_endpoint,
+        access_key_id="test",
+        secret_access_key="test",
+        part_size=5 * 1024 * 1024,
+        max_concurrency=2,
     )
 
 
@@ -100,7 +115,7 @@ async def test_get_base_url(storage):
     base_url = storage.get_base_url()
     assert (
         base_url
-        == f"https://{storage.bucket_name}.s3.{storage.s3.meta.region_name}.amazonaws.com"
+        == f"https://{storage.bucket_name}.s3.{storage.region_name}.amazonaws.com"
     )
 
 
@@ -113,3 +128,39 @@ async def test_get_url(storage):
     # Test without domain
     storage.domain = None
     assert storage.get_url(file_name) == f"{storage.get_base_url()}/{file_name}"
+
+
+@pytest.mark.asyncio
+async def test_multipart_upload_and_ranged_download(storage, s3_endpoint):
+    await storage.upload(file_name, io.BytesIO(large_data))
+
+    head = boto3.client(
+        "s3",
+        region_name="us-east-1",
+        endpoint_url=s3_endpoint,
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+    ).head_object(Bucket=storage.bucket_name, Key=file_name)
+    assert head["ETag"].strip('"').endswith("-3"), "Should be a 3 part upload"
+
+    output = io.BytesIO()
+    await storage.download(file_name, output)
+    assert output.getvalue() == large_data
+
+    chunks = [chunk async for chunk in storage.download_stream(file_name)]
+    assert [len(c) for c in chunks] == [
+        5 * 1024 * 1024,
+        5 * 1024 * 1024,
+        3 * 1024 * 1024,
+    ]
+    assert b"".join(chunks) == large_data
+
+
+@pytest.mark.asyncio
+async def test_download_range(storage):
+    await storage.upload(file_name, io.BytesIO(large_data))
+    assert await storage.get_size(file_name) == len(large_data)
+
+    start, end = 6 * 1024 * 1024 - 10, 6 * 1024 * 1024 + 9
+    chunks = [chunk async for chunk in storage.download_range(file_name, start, end)]
+    assert b"".join(chunks) == large_data[start : end + 1]
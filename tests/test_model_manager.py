@@ -0,0 +1,62 @@
+import pytest
+import torch
+from nodetool.model_manager import ModelManager, estimate_model_size
+
+
+def make_model(n: int) -> torch.nn.Module:
+    # n float32 weights and no bias: 4 * n bytes
+    return torch.nn.Linear(n, 1, bias=False)
+
+
+@pytest.fixture(autouse=True)
+def model_manager(monkeypatch):
+    monkeypatch.setenv("MODEL_CACHE_MEMORY_LIMIT", "1000")
+    ModelManager.clear()
+    yield
+    ModelManager.clear()
+
+
+def test_estimate_model_size():
+    model = make_model(100)
+    model.register_buffer("scale", torch.zeros(10, dtype=torch.float16))
+    assert estimate_model_size(model) == 400 + 20
+
+    class Pipeline:
+        def __init__(self):
+            self.components = {"unet": model, "vae": model, "scheduler": object()}
+
+    assert estimate_model_size(Pipeline()) == 420
+
+
+def test_lru_eviction_and_stats():
+    ModelManager.set_model("n1", "a", "task", make_model(100))
+    ModelManager.set_model("n2", "b", "task", make_model(100))
+    assert ModelManager.get_model("a", "task") is not None
+
+    # 1200 bytes exceed the budget, so the least recently used "b" goes.
+    ModelManager.set_model("n3", "c", "task", make_model(100))
+
+    assert ModelManager.get_model("b", "task") is None
+    assert ModelManager.get_model("a", "task") is not None
+    assert ModelManager.stats() == {
+        "hits": 2,
+        "misses": 1,
+        "evictions": 1,
+        "models": 2,
+        "bytes": 800,
+    }
+
+
+def test_running_node_pins_its_models():
+    ModelManager.set_model("n1", "a", "task", make_model(200))
+
+    with ModelManager.running("n1"):
+        # "a" is older, but pinned, so the new model is evicted instead.
+        ModelManager.set_model("n2", "b", "task", make_model(100))
+        assert ModelManager.get_model("a", "task") is not None
+        assert ModelManager.get_model("b", "task") is None
+
+    # Once the node has finished, its model can be evicted again.
+    ModelManager.set_model("n2", "b", "task", make_model(100))
+    assert ModelManager.get_model("a", "task") is None
+    assert ModelManager.get_model("b", "task") is not None
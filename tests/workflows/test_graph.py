@@ -346,3 +346,63 @@ def test_topological_sort_with_mixed_parent_ids(graph: Graph):
         ["1"],
         ["2"],
     ], "Should return only nodes with parent_id='group1' in topological order"
+
+
+def test_find_node_uses_index(complex_graph: Graph):
+    assert complex_graph.find_node("5").id == "5"  # type: ignore
+    assert complex_graph.find_node("missing") is None
+
+
+def test_incoming_and_outgoing_edges(complex_graph: Graph):
+    assert [e.source for e in complex_graph.incoming_edges("7")] == ["3", "6"]
+    assert [e.target for e in complex_graph.outgoing_edges("1")] == ["2", "3"]
+    assert complex_graph.incoming_edges("1") == []
+
+
+def test_indexes_follow_graph_changes(graph: Graph):
+    graph.nodes = [StandardNode(id="1")]
+    assert graph.find_node("1") is not None
+
+    graph.nodes.append(StandardNode(id="2"))  # type: ignore
+    graph.edges = [
+        Edge(source="1", sourceHandle="output", target="2", targetHandle="value")
+    ]
+    assert graph.find_node("2") is not None
+    assert len(graph.outgoing_edges("1")) == 1
+    assert graph.topological_sort() == [["1"], ["2"]]
+
+
+def test_topological_sort_large_graph_benchmark():
+    import random
+    import time
+
+    num_nodes = 10_000
+    num_edges = 50_000
+    rng = random.Random(0)
+
+    nodes = [StandardNode(id=str(i)) for i in range(num_nodes)]  # type: ignore
+    edges = []
+    for _ in range(num_edges):
+        a, b = rng.sample(range(num_nodes), 2)
+        source, target = min(a, b), max(a, b)
+        edges.append(
+            Edge(
+                source=str(source),
+                sourceHandle="output",
+                target=str(target),
+                targetHandle="value",
+            )
+        )
+
+    start = time.perf_counter()
+    graph = Graph(nodes=nodes, edges=edges)
+    sorted_nodes = graph.topological_sort()
+    elapsed = time.perf_counter() - start
+
+    assert sum(len(level) for level in sorted_nodes) == num_nodes
+    position = {
+        node_id: level for level, ids in enumerate(sorted_nodes) for node_id in ids
+    }
+    assert all(position[e.source] < position[e.target] for e in edges)
+    # The previous implementation was quadratic and took minutes on this graph.
+    assert elapsed < 5.0, f"topological sort took {elapsed:.2f}s"
@@ -0,0 +1,78 @@
+import os
+import msgpack
+import pytest
+import nodetool
+import tests
+from nodetool.types.graph import Graph as APIGraph, Node
+from nodetool.types.job import JobUpdate
+from nodetool.workflows.multi_process_runner import MultiprocessRunner, WorkerPool
+from nodetool.workflows.run_job_request import RunJobRequest
+from nodetool.workflows.types import Error
+from tests.workflows.test_workflow_runner import SleepNode
+
+
+def make_request(delay: float = 0.0) -> RunJobRequest:
+    node = Node(id="1", type=SleepNode.get_node_type(), data={"delay": delay})
+    return RunJobRequest(workflow_id="workflow", graph=APIGraph(nodes=[node], edges=[]))
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    # The forkserver does not inherit sys.path, so expose the packages to it.
+    roots = [os.path.dirname(os.path.dirname(p.__file__)) for p in (nodetool, tests)]
+    monkeypatch.setenv("PYTHONPATH", os.pathsep.join(roots))
+    pool = WorkerPool(
+        size=1, max_jobs_per_worker=2, preload=["tests.workflows.test_workflow_runner"]
+    )
+    yield pool
+    pool.shutdown()
+
+
+async def collect(pool: WorkerPool, req: RunJobRequest) -> list:
+    return [msg async for msg in pool.run(req)]
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_and_recycles_workers(pool: WorkerPool):
+    pool.start()
+    first_pid = pool.workers[0].process.pid
+
+    messages = await collect(pool, make_request())
+    assert messages[-1] == JobUpdate(job_id="workflow", status="completed", result={})
+    assert pool.workers[0].process.pid == first_pid
+
+    await collect(pool, make_request())
+
+    # The worker reached max_jobs_per_worker and was replaced.
+    assert len(pool.workers) == 1
+    assert pool.workers[0].process.pid != first_pid
+
+    messages = await collect(pool, make_request())
+    assert messages[-1].status == "completed"
+
+
+@pytest.mark.asyncio
+async def test_worker_crash_fails_only_its_job(pool: WorkerPool):
+    messages = []
+    async for msg in pool.run(make_request(delay=10)):
+        messages.append(msg)
+        if len(messages) == 1:
+            pool.workers[0].process.kill()
+
+    assert isinstance(messages[-1], Error)
+    assert "exited unexpectedly" in messages[-1].error
+
+    messages = await collect(pool, make_request())
+    assert messages[-1].status == "completed"
+
+
+@pytest.mark.asyncio
+async def test_multiprocess_runner_streams_messages(pool: WorkerPool):
+    runner = MultiprocessRunner(make_request(), pool=pool)
+    runner.start_workflow()
+
+    messages = [msgpack.unpackb(m) async for m in runner.get_messages()]
+
+    assert messages[-1]["type"] == "job_update"
+    assert messages[-1]["status"] == "completed"
+    assert not runner.is_running()
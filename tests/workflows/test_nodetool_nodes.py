@@ -362,4 +362,6 @@ async def test_save_dataframe_node(context: ProcessingContext, user: User):
     assert result.asset_id, "DataFrame should have an asset_id"
     asset = Asset.find(context.user_id, result.asset_id)
     assert asset, "Asset should exist"
-    assert asset.content_type == "application/octet-stream"
+    assert asset.content_type == "application/vnd.apache.arrow.file"
+    loaded = await context.dataframe_to_pandas(result)
+    assert loaded["a"].tolist() == [1, 2, 3]
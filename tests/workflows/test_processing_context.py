@@ -1,11 +1,17 @@
 import io
 import os
+import pickle
+import PIL.Image
+import pandas as pd
+import pyarrow as pa
 import pytest
 from unittest.mock import AsyncMock, patch
+from nodetool.common.environment import Environment
 from nodetool.metadata.types import AssetRef
 from nodetool.models.asset import Asset
 from nodetool.models.prediction import Prediction
-from nodetool.workflows.processing_context import ProcessingContext
+from nodetool.storage.file_storage import FileStorage
+from nodetool.workflows.processing_context import ProcessingContext, cache_key_value
 
 mp3_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), "test.mp3")
 
@@ -59,3 +65,119 @@ async def test_audio_from_io(context: ProcessingContext, http_client):
 
     downloaded_content = await context.download_asset(audio_ref.asset_id)
     assert downloaded_content.read() == audio_bytes
+
+
+def test_get_node_inputs_follows_graph_changes(context: ProcessingContext):
+    from nodetool.nodes.nodetool.math import Add
+    from nodetool.nodes.nodetool.constant import Float
+    from nodetool.types.graph import Edge
+    from nodetool.workflows.graph import Graph
+
+    nodes = [Float(id="1", value=1), Float(id="2", value=2), Add(id="3")]  # type: ignore
+    context.graph = Graph(
+        nodes=nodes,
+        edges=[
+            Edge(source="1", sourceHandle="output", target="3", targetHandle="a"),
+        ],
+    )
+    context.set_result("1", {"output": 1.0})
+    context.set_result("2", {"output": 2.0})
+
+    assert context.get_node_inputs("3") == {"a": 1.0}
+    assert list(context.get_node_input_types("3").keys()) == ["a"]
+
+    context.graph.edges = [
+        Edge(source="1", sourceHandle="output", target="3", targetHandle="a"),
+        Edge(source="2", sourceHandle="output", target="3", targetHandle="b"),
+    ]
+
+    assert context.get_node_inputs("3") == {"a": 1.0, "b": 2.0}
+    assert context.get_node_inputs("1") == {}
+
+
+def test_node_cache_key_is_content_based(context: ProcessingContext):
+    from nodetool.metadata.types import ImageRef
+    from nodetool.nodes.nodetool.input import ImageInput
+
+    payload = b"\x89PNG" + b"\x00" * 1_000_000
+    node_a = ImageInput(id="a", name="x", value=ImageRef(uri="memory://1", data=payload))  # type: ignore
+    node_b = ImageInput(id="b", name="x", value=ImageRef(uri="memory://1", data=payload))  # type: ignore
+    node_c = ImageInput(id="c", name="x", value=ImageRef(uri="memory://1", data=payload + b"\x01"))  # type: ignore
+
+    key_a = context.generate_node_cache_key(node_a)
+
+    assert key_a == context.generate_node_cache_key(node_b)
+    assert key_a != context.generate_node_cache_key(node_c)
+    assert key_a.startswith(f"{context.user_id}:{ImageInput.get_node_type()}:")
+    assert len(key_a) < 250
+
+
+def test_node_cache_key_includes_node_version(context: ProcessingContext, monkeypatch):
+    from nodetool.nodes.nodetool.constant import Float
+
+    node = Float(id="1", value=1.0)  # type: ignore
+    key = context.generate_node_cache_key(node)
+
+    monkeypatch.setattr(Float, "get_version", classmethod(lambda cls: "changed"))
+
+    assert context.generate_node_cache_key(node) != key
+
+
+@pytest.mark.asyncio
+async def test_image_from_pil_stays_in_memory(context: ProcessingContext):
+    image = PIL.Image.new("RGB", (8, 8), color="red")
+    image_ref = await context.image_from_pil(image)
+
+    assert image_ref.data is None
+    assert image_ref.is_set()
+
+    # Consumers get a copy, so in-place edits do not leak into the reference.
+    decoded = await context.image_to_pil(image_ref)
+    decoded.putpixel((0, 0), (0, 0, 255))
+    assert image.getpixel((0, 0)) == (255, 0, 0)
+
+    other_ref = await context.image_from_pil(PIL.Image.new("RGB", (8, 8), "blue"))
+    assert cache_key_value(image_ref) != cache_key_value(other_ref)
+
+    restored = pickle.loads(pickle.dumps(image_ref))
+    assert not restored.has_memory()
+    assert PIL.Image.open(io.BytesIO(restored.data)).getpixel((0, 0)) == (255, 0, 0)
+    assert (await context.asset_to_io(image_ref)).read() == restored.data
+
+
+@pytest.mark.asyncio
+async def test_dataframe_stays_arrow_with_bounded_preview(
+    context: ProcessingContext, monkeypatch
+):
+    monkeypatch.setenv("DATAFRAME_PREVIEW_ROWS", "5")
+    frame = pd.DataFrame({"a": range(100), "b": [f"x{i}" for i in range(100)]})
+
+    ref = await context.dataframe_from_pandas(frame)
+
+    assert ref.has_memory()
+    assert [c.data_type for c in ref.columns or []] == ["int", "string"]
+    dumped = ref.model_dump()
+    assert dumped["data"] == [[i, f"x{i}"] for i in range(5)]
+    restored = pickle.loads(pickle.dumps(ref))
+    pd.testing.assert_frame_equal(await context.dataframe_to_pandas(restored), frame)
+    pd.testing.assert_frame_equal(await context.dataframe_to_pandas(ref), frame)
+
+
+@pytest.mark.asyncio
+async def test_dataframe_asset_is_memory_mapped(
+    context: ProcessingContext, monkeypatch, tmp_path
+):
+    monkeypatch.setattr(
+        Environment,
+        "asset_storage",
+        FileStorage(base_path=str(tmp_path), base_url="http://localhost/assets"),
+        raising=False,
+    )
+    frame = pd.DataFrame({"a": [1.5, 2.5], "b": ["x", "y"]}, index=[3, 7])
+
+    ref = await context.dataframe_from_pandas(frame, name="frame")
+
+    with patch("pyarrow.memory_map", wraps=pa.memory_map) as memory_map:
+        loaded = await context.dataframe_to_pandas(ref)
+    memory_map.assert_called_once()
+    pd.testing.assert_frame_equal(loaded, frame)
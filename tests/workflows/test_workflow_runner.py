@@ -1,6 +1,9 @@
+import asyncio
+import time
 import PIL.Image
 import PIL.ImageChops
 import pytest
+import torch
 from nodetool.types.graph import Node, Edge
 from nodetool.types.job import JobUpdate
 from nodetool.models.job import Job
@@ -8,6 +11,8 @@ from nodetool.nodes.nodetool.output import GroupOutput
 from nodetool.workflows.run_job_request import RunJobRequest
 from nodetool.workflows.run_job_request import RunJobRequest
 from nodetool.workflows.processing_context import ProcessingContext
+from nodetool.workflows.base_node import BaseNode
+from nodetool.workflows.types import NodeProgress, NodeUpdate
 from nodetool.metadata.types import ImageRef
 from nodetool.workflows.workflow_runner import WorkflowRunner
 from nodetool.models.user import User
@@ -365,3 +370,181 @@ async def test_loop_node(user: User, workflow_runner: WorkflowRunner):
     await workflow_runner.process_graph(context, graph)
 
     assert context.get_result("loop", "output") == [1, 4, 9]
+
+
+class SleepNode(BaseNode):
+    input: int = 0
+    delay: float = 0.0
+
+    async def process(self, context: ProcessingContext) -> int:
+        await asyncio.sleep(self.delay)
+        return self.input + 1
+
+
+def make_slow_and_fast_graph() -> Graph:
+    nodes = [SleepNode(id="slow", delay=0.5)]  # type: ignore
+    nodes += [SleepNode(id=f"fast{i}", delay=0.01) for i in range(5)]  # type: ignore
+    edges = [
+        Edge(
+            id=str(i),
+            source=f"fast{i}",
+            target=f"fast{i + 1}",
+            sourceHandle="output",
+            targetHandle="input",
+        )
+        for i in range(4)
+    ]
+    return Graph(nodes=nodes, edges=edges)
+
+
+@pytest.mark.asyncio
+async def test_fast_chain_does_not_wait_for_slow_branch(
+    workflow_runner: WorkflowRunner,
+):
+    graph = make_slow_and_fast_graph()
+    context = ProcessingContext(
+        user_id="", workflow_id="", auth_token="token", graph=graph
+    )
+
+    completed_at: dict[str, float] = {}
+    post_message = context.post_message
+
+    def record(message):
+        if isinstance(message, NodeUpdate) and message.status == "completed":
+            completed_at[message.node_id] = time.monotonic()
+        post_message(message)
+
+    context.post_message = record  # type: ignore
+
+    await workflow_runner.process_graph(context, graph)
+
+    assert context.get_result("fast4", "output") == 5
+    assert context.get_result("slow", "output") == 1
+    assert completed_at["fast4"] < completed_at["slow"]
+    assert completed_at["slow"] - completed_at["fast4"] > 0.3
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_limits_running_nodes(job: Job):
+    workflow_runner = WorkflowRunner(job.id, max_concurrency=1)
+    graph = make_slow_and_fast_graph()
+    context = ProcessingContext(
+        user_id="", workflow_id="", auth_token="token", graph=graph
+    )
+
+    await workflow_runner.process_graph(context, graph)
+
+    assert context.get_result("fast4", "output") == 5
+    assert context.get_result("slow", "output") == 1
+
+
+class CpuInferenceNode(BaseNode):
+    steps: int = 10000
+
+    async def process(self, context: ProcessingContext) -> float:
+        def infer() -> float:
+            x = torch.rand(256, 256)
+            for step in range(self.steps):
+                context.check_cancelled()
+                if step % 10 == 0:
+                    context.post_message(
+                        NodeProgress(node_id=self.id, progress=step, total=self.steps)
+                    )
+                x = torch.tanh(x @ x)
+            return float(x.sum())
+
+        return await context.run_model(infer)
+
+
+@pytest.mark.asyncio
+async def test_inference_does_not_block_other_jobs(job: Job):
+    slow_runner = WorkflowRunner(job.id)
+    slow_graph = Graph(nodes=[CpuInferenceNode(id="infer")])  # type: ignore
+    slow_context = ProcessingContext(
+        user_id="", workflow_id="", auth_token="token", graph=slow_graph
+    )
+    slow_task = asyncio.create_task(slow_runner.process_graph(slow_context, slow_graph))
+
+    async def next_progress():
+        while True:
+            message = await slow_context.pop_message_async()
+            if isinstance(message, NodeProgress):
+                return message
+
+    await asyncio.wait_for(next_progress(), timeout=10)
+
+    fast_runner = WorkflowRunner(job.id)
+    fast_graph = make_slow_and_fast_graph()
+    fast_context = ProcessingContext(
+        user_id="", workflow_id="", auth_token="token", graph=fast_graph
+    )
+    await asyncio.wait_for(
+        fast_runner.process_graph(fast_context, fast_graph), timeout=5
+    )
+
+    assert fast_context.get_result("fast4", "output") == 5
+    assert not slow_task.done()
+    await asyncio.wait_for(next_progress(), timeout=5)
+
+    slow_context.cancel()
+    await asyncio.wait_for(slow_task, timeout=5)
+    assert slow_runner.status == "cancelled"
+    assert slow_context.get_result("infer", "output") is None
+
+
+class DelayNode(BaseNode):
+    input: float = 0.0
+
+    async def process(self, context: ProcessingContext) -> float:
+        await asyncio.sleep(self.input)
+        return self.input * 10
+
+
+@pytest.mark.asyncio
+async def test_loop_runs_items_concurrently_in_order(
+    workflow_runner: WorkflowRunner,
+):
+    delays = [0.2 - i * 0.01 for i in range(16)]
+    nodes = [
+        List(id="list", value=delays),  # type: ignore
+        Loop(id="loop", max_concurrency=8),  # type: ignore
+        GroupInput(id="in", parent_id="loop"),  # type: ignore
+        DelayNode(id="delay", parent_id="loop"),  # type: ignore
+        GroupOutput(id="out", parent_id="loop"),  # type: ignore
+    ]
+    edges = [
+        Edge(
+            id="0",
+            source="list",
+            target="loop",
+            sourceHandle="output",
+            targetHandle="input",
+        ),
+        Edge(
+            id="1",
+            source="in",
+            target="delay",
+            sourceHandle="output",
+            targetHandle="input",
+        ),
+        Edge(
+            id="2",
+            source="delay",
+            target="out",
+            sourceHandle="output",
+            targetHandle="input",
+        ),
+    ]
+    graph = Graph(nodes=nodes, edges=edges)
+    context = ProcessingContext(
+        user_id="", workflow_id="", auth_token="token", graph=graph
+    )
+
+    started = time.monotonic()
+    await workflow_runner.process_graph(context, graph)
+    elapsed = time.monotonic() - started
+
+    assert context.get_result("loop", "output") == pytest.approx(
+        [d * 10 for d in delays]
+    )
+    assert elapsed < sum(delays) / 4
@@ -2299,6 +2299,10 @@ export interface components {
       value?: unknown[];
       /** Dtype */
       dtype?: string | null;
+      /** Shape */
+      shape?: number[] | null;
+      /** Data */
+      data?: Uint8Array | null;
     };
     /** TextRef */
     TextRef: {
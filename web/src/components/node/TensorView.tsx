@@ -7,8 +7,37 @@ interface TensorViewProps {
   tensor: Tensor;
 }
 
+const TYPED_ARRAYS: Record<string, any> = {
+  float32: Float32Array,
+  float64: Float64Array,
+  int8: Int8Array,
+  int16: Int16Array,
+  int32: Int32Array,
+  int64: BigInt64Array,
+  uint8: Uint8Array,
+  uint16: Uint16Array,
+  uint32: Uint32Array,
+  uint64: BigUint64Array,
+  bool: Uint8Array
+};
+
+// Binary tensors arrive as a contiguous buffer, decode them to a flat list
+const decodeTensorData = (tensor: Tensor): unknown[] | undefined => {
+  const { data, dtype } = tensor;
+  if (!data || !dtype || !(dtype in TYPED_ARRAYS)) return tensor.value;
+  const ArrayType = TYPED_ARRAYS[dtype];
+  const buffer = data.buffer.slice(
+    data.byteOffset,
+    data.byteOffset + data.byteLength
+  );
+  return Array.from(new ArrayType(buffer), (x) =>
+    typeof x === "bigint" ? Number(x) : x
+  );
+};
+
 const TensorView: React.FC<TensorViewProps> = ({ tensor }) => {
-  const { value, dtype } = tensor;
+  const { dtype, shape } = tensor;
+  const value = useMemo(() => decodeTensorData(tensor), [tensor]);
 
   const formattedValue = useMemo(() => {
     if (!value) return "No data";
@@ -21,7 +50,8 @@ const TensorView: React.FC<TensorViewProps> = ({ tensor }) => {
   return (
     <Paper elevation={2} sx={{ p: 2, my: 1, fontFamily: "monospace" }}>
       <Typography variant="h6" gutterBottom>
-        Tensor ({dtype})
+        Tensor ({dtype}
+        {shape ? `, ${shape.join("x")}` : ""})
       </Typography>
       <Box display="flex" flexDirection="column" gap={1}>
         <Box